@@ -0,0 +1,112 @@
+"""Return of a burst of reservations, one by one against one batch.
+
+Each round reserves ``--items`` books (one per user) with ``POST /reservations/batch`` logic,
+then returns them with ``update_reservation_on_db`` one at a time (a select of the open
+loan, of the stock, of the reservation, an update and a commit each) or with
+``return_reservations_on_db`` (two updates and one commit for the whole burst).
+
+``--synchronous FULL`` makes every commit wait for an fsync, as on a durable setup.
+
+    $ python -m benchmarks.batch_returns --items 200 --rounds 5 --synchronous FULL
+"""
+
+import argparse
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from sqlalchemy import event
+from sqlmodel import Session, create_engine
+
+from benchmarks.common import create_database
+from src.db.models import (  # noqa # pylint: disable=unused-import
+    author,
+    book,
+    reservation_status,
+    stock,
+    user,
+)
+from src.db.operations.reservation import (
+    create_reservations_on_db,
+    return_reservations_on_db,
+    update_reservation_on_db,
+)
+from src.models.reservation import ReservationBatchIn, ReservationIn, ReservationReturnsIn
+
+
+def return_one_by_one(session: Session, reservations: list[ReservationIn], ids: list[int]) -> None:
+    """Return the reservations with a request each."""
+    for reservation_in, reservation_id in zip(reservations, ids, strict=True):
+        update_reservation_on_db(session, reservation_id, reservation_in)
+
+
+def return_batch(session: Session, _reservations: list[ReservationIn], ids: list[int]) -> None:
+    """Return the reservations with one request."""
+    return_reservations_on_db(session, ReservationReturnsIn(reservation_ids=ids))
+
+
+def time_returns(
+    session: Session,
+    returns: Callable[[Session, list[ReservationIn], list[int]], None],
+    pairs: list[tuple[int, int]],
+    rounds: int,
+) -> float:
+    """Reserve the books and time their returns, get the time per return in milliseconds."""
+    elapsed = 0.0
+    for _ in range(rounds):
+        reservations = [
+            ReservationIn(user_id=user_id, book_id=book_id) for user_id, book_id in pairs
+        ]
+        ids = []
+        for reservation_in in reservations:
+            batch_in = ReservationBatchIn(
+                user_id=reservation_in.user_id, book_ids=[reservation_in.book_id]
+            )
+            batch_out = create_reservations_on_db(session, batch_in)
+            ids.append(batch_out.reservations[0].reservation.id)  # type: ignore
+
+        started = time.perf_counter()
+        returns(session, reservations, ids)
+        elapsed += time.perf_counter() - started
+    return elapsed / (rounds * len(pairs)) * 1000
+
+
+def main() -> None:  # noqa: PLR0915
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--synchronous", default="NORMAL", choices=["OFF", "NORMAL", "FULL"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_file = Path(tmp_dir) / "bench.db"
+        database_url = create_database(db_file, books=args.items, users=args.items)
+        with sqlite3.connect(db_file) as connection:
+            book_ids = [
+                row[0] for row in connection.execute("SELECT id FROM books ORDER BY id DESC")
+            ]
+            user_ids = [
+                row[0] for row in connection.execute("SELECT id FROM users ORDER BY id DESC")
+            ]
+        pairs = list(zip(user_ids[: args.items], book_ids[: args.items], strict=True))
+
+        engine = create_engine(database_url)
+
+        @event.listens_for(engine, "connect")
+        def set_pragmas(dbapi_connection: Any, _record: Any) -> None:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute(f"PRAGMA synchronous={args.synchronous}")
+            cursor.close()
+
+        print(f"{'returns':<14}{'ms/return':>12}")
+        with Session(engine) as session:
+            for name, returns in {"one by one": return_one_by_one, "batch": return_batch}.items():
+                print(f"{name:<14}{time_returns(session, returns, pairs, args.rounds):>12.3f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Creation of a catalog of books, one by one against bulk chunks.
+
+``one by one`` creates each book with ``create_book_on_db`` as ``POST /books`` does (an insert,
+a commit and a refresh each), ``bulk`` creates them with ``create_books_on_db`` as
+``POST /books/bulk`` does (one insert and one commit per chunk of ``--chunk-size`` books).
+
+``--synchronous FULL`` makes every commit wait for an fsync, as on a durable setup.
+
+    $ python -m benchmarks.bulk_create --books 5000 --chunk-size 500 --synchronous FULL
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable
+
+from sqlalchemy import event
+from sqlmodel import Session, create_engine
+
+from benchmarks.common import create_database
+from src.db.models import (  # noqa # pylint: disable=unused-import
+    author,
+    book,
+    reservation,
+    reservation_status,
+    stock,
+    user,
+)
+from src.db.operations.book import create_book_on_db, create_books_on_db
+from src.models.book import BookIn
+
+
+def create_one_by_one(session: Session, books_in: list[BookIn], _chunk_size: int) -> None:
+    """Create the books with a request each."""
+    for book_in in books_in:
+        create_book_on_db(session, book_in)
+
+
+def create_bulk(session: Session, books_in: list[BookIn], chunk_size: int) -> None:
+    """Create the books one chunk at a time."""
+    rows = list(enumerate(books_in, start=1))
+    for start in range(0, len(rows), chunk_size):
+        create_books_on_db(session, rows[start : start + chunk_size])
+
+
+def time_creation(
+    session: Session,
+    create: Callable[[Session, list[BookIn], int], None],
+    name: str,
+    args: argparse.Namespace,
+) -> float:
+    """Create the books and get the time per book in milliseconds."""
+    books_in = [
+        BookIn(title=f"{name} {i}", author_id=1, published_date=date(2000, 1, 1))
+        for i in range(args.books)
+    ]
+    started = time.perf_counter()
+    create(session, books_in, args.chunk_size)
+    return (time.perf_counter() - started) / args.books * 1000
+
+
+def main() -> None:  # noqa: PLR0915
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--books", type=int, default=2000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--synchronous", default="NORMAL", choices=["OFF", "NORMAL", "FULL"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = create_database(Path(tmp_dir) / "bench.db", books=0, users=0)
+        engine = create_engine(database_url)
+
+        @event.listens_for(engine, "connect")
+        def set_pragmas(dbapi_connection: Any, _record: Any) -> None:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute(f"PRAGMA synchronous={args.synchronous}")
+            cursor.close()
+
+        print(f"{'creation':<14}{'ms/book':>12}")
+        with Session(engine) as session:
+            for name, create in {"one by one": create_one_by_one, "bulk": create_bulk}.items():
+                print(f"{name:<14}{time_creation(session, create, name, args):>12.3f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
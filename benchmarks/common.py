@@ -0,0 +1,101 @@
+"""Helpers shared by the benchmark scripts.
+
+The benchmarks run the real application with uvicorn on a temporary SQLite database
+created by the Alembic migrations and seeded with extra rows.
+"""
+
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import httpx
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# The servers run with BASIC_AUTH_ENABLE=False, any credentials are accepted
+BENCHMARK_AUTH = ("benchmark", "benchmark")
+
+
+def create_database(db_file: Path, *, books: int, users: int) -> str:
+    """Create and seed a benchmark database, return its URL."""
+    url = f"sqlite:///{db_file}"
+    env = {**os.environ, "DATABASE_URL": url}
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=ROOT_DIR,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+
+    with sqlite3.connect(db_file) as connection:
+        connection.executemany(
+            "INSERT INTO books (title, author_id, published_date, category, created_at, "
+            "updated_at) VALUES (?, 1, '2000-01-01', 'Benchmark', CURRENT_TIMESTAMP, "
+            "CURRENT_TIMESTAMP)",
+            [(f"Benchmark book {i}",) for i in range(books)],
+        )
+        connection.execute(
+            "INSERT INTO stocks (book_id, stock_quantity, created_at, updated_at) "
+            "SELECT id, 1000000, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP FROM books "
+            "WHERE id NOT IN (SELECT book_id FROM stocks)"
+        )
+        connection.executemany(
+            "INSERT INTO users (first_name, last_name, email, created_at, updated_at) "
+            "VALUES ('Bench', 'User', ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)",
+            [(f"bench.user{i}@example.com",) for i in range(users)],
+        )
+
+    return url
+
+
+def get_free_port() -> int:
+    """Get a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+@contextmanager
+def run_server(database_url: str, **env: str) -> Iterator[str]:  # noqa: PLR0915
+    """Run the application with uvicorn and yield its base URL."""
+    port = get_free_port()
+    server_env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "BASIC_AUTH_ENABLE": "False",
+        "APP_LOG_FORMAT": "apache",
+        **env,
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--port", str(port), "--no-access-log"],
+        cwd=ROOT_DIR,
+        env=server_env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(f"{base_url}/health")
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def percentile(values: list[float], rank: float) -> float:
+    """Get a percentile (0-100) of the values."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(rank / 100 * (len(ordered) - 1))))
+    return ordered[index]
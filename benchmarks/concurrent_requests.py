@@ -0,0 +1,97 @@
+"""Concurrent request throughput for each database execution mode.
+
+Fires concurrent list requests while probing ``/health``, for each value of
+``DATABASE_EXECUTION_MODE``. In the ``sync`` mode the queries block the event loop,
+so the health probes queue behind them. With a concurrency above the pool capacity
+(pool_size + max_overflow) the ``sync`` mode stalls: the pool checkout blocks the event loop,
+so the requests holding the connections can never finish and release them.
+
+    $ python -m benchmarks.concurrent_requests --requests 400 --concurrency 12
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from benchmarks.common import BENCHMARK_AUTH, create_database, percentile, run_server
+
+
+async def probe_health(client: httpx.AsyncClient, stop: asyncio.Event) -> list[float]:
+    """Measure the /health latency until the load is over."""
+    latencies: list[float] = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get("/health")
+        latencies.append(time.perf_counter() - started)
+        await asyncio.sleep(0.01)
+    return latencies
+
+
+async def run_load(  # noqa: PLR0915
+    base_url: str, path: str, requests: int, concurrency: int
+) -> dict[str, float]:
+    """Send the requests with a bounded concurrency and measure the throughput."""
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency + 1)
+
+    # Authentication is disabled on the server but HTTPBasic still expects the header
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=120, auth=BENCHMARK_AUTH
+    ) as client:
+        errors = 0
+
+        async def send() -> None:
+            nonlocal errors
+            async with semaphore:
+                try:
+                    response = await client.get(path)
+                    errors += response.is_error
+                except httpx.TimeoutException:
+                    errors += 1
+
+        stop = asyncio.Event()
+        health = asyncio.create_task(probe_health(client, stop))
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(*(send() for _ in range(requests)))
+        finally:
+            elapsed = time.perf_counter() - started
+            stop.set()
+            health_latencies = await health
+
+    return {
+        "requests_per_second": requests / elapsed,
+        "health_p50_ms": percentile(health_latencies, 50) * 1000,
+        "health_p99_ms": percentile(health_latencies, 99) * 1000,
+        "errors": errors,
+    }
+
+
+def main() -> None:  # noqa: PLR0915
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modes", nargs="+", default=["sync", "async", "executor"])
+    parser.add_argument("--path", default="/books?limit=200")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=12)
+    parser.add_argument("--books", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = create_database(Path(tmp_dir) / "bench.db", books=args.books, users=100)
+        print(f"{'mode':<10}{'req/s':>10}{'health p50 ms':>16}{'health p99 ms':>16}{'errors':>8}")
+        for mode in args.modes:
+            with run_server(database_url, DATABASE_EXECUTION_MODE=mode) as base_url:
+                result = asyncio.run(run_load(base_url, args.path, args.requests, args.concurrency))
+            print(
+                f"{mode:<10}{result['requests_per_second']:>10.1f}"
+                f"{result['health_p50_ms']:>16.1f}{result['health_p99_ms']:>16.1f}"
+                f"{result['errors']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
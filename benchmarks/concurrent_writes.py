@@ -0,0 +1,100 @@
+"""Concurrent reservation writes for each write configuration.
+
+Every user reserves then returns a book, all the users at the same time, with:
+
+- ``writer``: mutating requests serialized on one ``BEGIN IMMEDIATE`` connection, reads on
+  a read-only pool.
+- ``no writer``: every pooled connection writes and upgrades its read lock on the first write.
+- ``group commit``: the writer connection, the reservations and returns of concurrent
+  requests sharing one commit.
+
+``--synchronous FULL`` makes every commit wait for an fsync, as on a durable setup.
+
+    $ python -m benchmarks.concurrent_writes --users 100 --concurrency 16 --synchronous FULL
+"""
+
+import argparse
+import asyncio
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from benchmarks.common import BENCHMARK_AUTH, create_database, run_server
+
+CONFIGURATIONS = {
+    "writer": {"SQLITE_WRITER_ENABLE": "True"},
+    "no writer": {"SQLITE_WRITER_ENABLE": "False"},
+    "group commit": {"SQLITE_WRITER_ENABLE": "True", "DATABASE_GROUP_COMMIT_ENABLE": "True"},
+}
+
+
+async def reserve_and_return(
+    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, user_id: int, book_id: int
+) -> list[int]:
+    """Reserve a book for the user, return it and get the response status codes."""
+    payload = {"user_id": user_id, "book_id": book_id}
+    async with semaphore:
+        created = await client.post("/reservations", json=payload)
+    if created.is_error:
+        return [created.status_code]
+
+    async with semaphore:
+        returned = await client.put(f"/reservations/{created.json()['id']}", json=payload)
+    return [created.status_code, returned.status_code]
+
+
+async def run_load(
+    base_url: str, user_ids: list[int], book_ids: list[int], concurrency: int
+) -> dict[str, float]:
+    """Run the reservations of all the users and measure the throughput."""
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=120, auth=BENCHMARK_AUTH) as client:
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                reserve_and_return(client, semaphore, user_id, book_ids[index % len(book_ids)])
+                for index, user_id in enumerate(user_ids)
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+    status_codes = [code for result in results for code in result]
+    return {
+        "writes_per_second": len(status_codes) / elapsed,
+        "server_errors": sum(code >= 500 for code in status_codes),  # noqa: PLR2004
+    }
+
+
+def main() -> None:  # noqa: PLR0915
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--books", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--mode", default="async", help="DATABASE_EXECUTION_MODE of the server")
+    parser.add_argument("--synchronous", default="NORMAL", help="SQLite synchronous pragma")
+    args = parser.parse_args()
+
+    print(f"{'configuration':<16}{'writes/s':>10}{'5xx':>8}")
+    for name, env in CONFIGURATIONS.items():
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_file = Path(tmp_dir) / "bench.db"
+            database_url = create_database(db_file, books=args.books, users=args.users)
+            with sqlite3.connect(db_file) as connection:
+                user_ids = [row[0] for row in connection.execute("SELECT id FROM users")]
+                book_ids = [row[0] for row in connection.execute("SELECT book_id FROM stocks")]
+
+            with run_server(
+                database_url,
+                DATABASE_EXECUTION_MODE=args.mode,
+                SQLITE_SYNCHRONOUS=args.synchronous,
+                **env,
+            ) as base_url:
+                result = asyncio.run(run_load(base_url, user_ids, book_ids, args.concurrency))
+            print(f"{name:<16}{result['writes_per_second']:>10.1f}{result['server_errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Serialization of 1000-item list pages, FastAPI response_model path against ModelJSONResponse.
+
+``response_model`` is what the list routes did before: FastAPI validates the returned model
+against the response model, dumps it and encodes it with ``json.dumps``. ``single pass`` is
+the ``ModelJSONResponse`` returned by the routes now. Both produce the same bytes.
+
+    $ python -m benchmarks.list_serialization --items 1000 --rounds 200
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import date, datetime
+from typing import Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from pydantic import BaseModel
+
+from src.helper.response import ModelJSONResponse
+from src.models.book import BookOut, BooksList
+from src.models.reservation import ReservationOut, ReservationsList
+from src.models.user import UserOut, UsersList
+
+PAGINATION = {"number_of_pages": 10, "current_page": 1, "next_page": 2, "previous_page": None}
+
+
+def build_pages(items: int) -> dict[str, BaseModel]:
+    """Build a page of each list model, as the operations do."""
+    borrowed_at = datetime(2024, 1, 1, 10, 0)
+    books = [
+        BookOut.trusted(
+            id=i,
+            title=f"Book {i}",
+            author_id=1,
+            published_date=date(2000, 1, 1),
+            category="Novel",
+        )
+        for i in range(1, items + 1)
+    ]
+    users = [
+        UserOut.trusted(id=i, first_name="Jane", last_name="Doe", email=f"user{i}@example.com")
+        for i in range(1, items + 1)
+    ]
+    reservations = [
+        ReservationOut.trusted(
+            id=i,
+            book_id=1,
+            user_id=i,
+            status="confirmed",
+            borrowed_at=borrowed_at,
+            due_date=borrowed_at,
+            return_date=None,
+        )
+        for i in range(1, items + 1)
+    ]
+    return {
+        "books": BooksList.trusted(books=books, number_of_books=items, **PAGINATION),
+        "users": UsersList.trusted(users=users, number_of_users=items, **PAGINATION),
+        "reservations": ReservationsList.trusted(
+            reservations=reservations, number_of_reservation=items, **PAGINATION
+        ),
+    }
+
+
+def encode_with_response_model(page: BaseModel) -> bytes:
+    """Validate, dump and encode the page as FastAPI does for a route returning it."""
+    field = create_model_field(name="Response", type_=type(page), mode="serialization")
+    content = asyncio.run(serialize_response(field=field, response_content=page))
+    return bytes(JSONResponse(content).body)
+
+
+def encode_single_pass(page: BaseModel) -> bytes:
+    """Encode the page as the list routes do."""
+    return bytes(ModelJSONResponse(page).body)
+
+
+def time_encoding(encode: Callable[[BaseModel], bytes], page: BaseModel, rounds: int) -> float:
+    """Get the time per page in milliseconds."""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        encode(page)
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+def main() -> None:  # noqa: PLR0915
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'page':<14}{'response_model ms':>19}{'single pass ms':>16}{'speedup':>9}")
+    for name, page in build_pages(args.items).items():
+        assert encode_with_response_model(page) == encode_single_pass(page)
+        before = time_encoding(encode_with_response_model, page, args.rounds)
+        after = time_encoding(encode_single_pass, page, args.rounds)
+        print(f"{name:<14}{before:>19.2f}{after:>16.2f}{before / after:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
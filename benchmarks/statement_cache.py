@@ -0,0 +1,67 @@
+"""Primary key lookups with a statement built per call and with the cached statement.
+
+Runs ``fetch_one_or_none`` on the books of a seeded benchmark database, once with a
+``select()`` built at every call and once with ``get_book_from_id_stmt`` (lambda statement).
+
+    $ python -m benchmarks.statement_cache --lookups 20000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from sqlmodel import Session, create_engine, select
+from sqlmodel.sql._expression_select_cls import SelectOfScalar
+
+from benchmarks.common import create_database
+from src.db.execution import fetch_one_or_none
+from src.db.models import (  # noqa # pylint: disable=unused-import
+    author,
+    reservation,
+    reservation_status,
+    stock,
+    user,
+)
+from src.db.models.book import Book
+from src.db.queries.book import get_book_from_id_stmt
+from src.db.statement_cache import statement_cache
+
+
+def build_book_from_id_stmt(book_id: int) -> SelectOfScalar[Book]:
+    """Build the statement at every call, as the builders did before the cache."""
+    return select(Book).where(Book.id == book_id)
+
+
+def run_lookups(
+    session: Session, builder: Callable[[int], SelectOfScalar[Book]], lookups: int, books: int
+) -> float:
+    """Run the lookups and get the time per lookup in microseconds."""
+    started = time.perf_counter()
+    for index in range(lookups):
+        fetch_one_or_none(session, builder(index % books + 1))
+    return (time.perf_counter() - started) / lookups * 1_000_000
+
+
+def main() -> None:  # noqa: PLR0915
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--books", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = create_database(Path(tmp_dir) / "bench.db", books=args.books, users=1)
+        engine = create_engine(database_url)
+        statement_cache.register_engine(engine)
+        builders = {"built per call": build_book_from_id_stmt, "cached": get_book_from_id_stmt}
+        print(f"{'statement':<16}{'us/lookup':>12}")
+        with Session(engine) as session:
+            for name, builder in builders.items():
+                print(f"{name:<16}{run_lookups(session, builder, args.lookups, args.books):>12.1f}")
+        print(statement_cache.stats())
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from alembic import context
 from sqlalchemy import engine_from_config, pool
 from sqlmodel import SQLModel
 
+from src.db.engine import get_database_url
 from src.db.models import (  # noqa # pylint: disable=unused-import
     admin_user,
     author,
@@ -11,6 +12,7 @@ from src.db.models import (  # noqa # pylint: disable=unused-import
     reservation,
     reservation_status,
     stock,
+    table_count,
     user,
 )
 
@@ -23,12 +25,27 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+# The database URL comes from the active database profile unless it has been set
+# explicitly (e.g. by the test suite through ``Config.set_main_option``).
+if not config.get_main_option("sqlalchemy.url"):
+    config.set_main_option("sqlalchemy.url", get_database_url().replace("%", "%%"))
+
 # add your model's MetaData object here
 # for 'autogenerate' support
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
 target_metadata = SQLModel.metadata
 
+# Tables created by the migrations without a model: the full-text search index and its
+# shadow tables, ignored by autogenerate
+UNMODELED_TABLE_PREFIXES = ("books_search",)
+
+
+def include_name(name: str | None, type_: str, _parent_names: dict[str, str | None]) -> bool:
+    """Skip the tables without a model when comparing the database to the models."""
+    return not (type_ == "table" and name is not None and name.startswith(UNMODELED_TABLE_PREFIXES))
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -51,6 +68,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -73,7 +91,9 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection, target_metadata=target_metadata, include_name=include_name
+        )
 
         with context.begin_transaction():
             context.run_migrations()
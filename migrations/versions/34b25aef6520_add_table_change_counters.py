@@ -0,0 +1,80 @@
+"""add change counters to table_counts maintained by triggers
+
+Revision ID: 34b25aef6520
+Revises: b71e4c9d2a36
+Create Date: 2026-10-17 19:02:37.684215
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "34b25aef6520"
+down_revision: Union[str, None] = "b71e4c9d2a36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables of the conditional GET endpoints, their changes give the ETag and Last-Modified
+CHANGE_TRACKED_TABLES = ("authors", "books", "stocks", "users")
+
+
+def upgrade() -> None:
+    op.add_column(
+        "table_counts",
+        sa.Column("change_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    # SQLite cannot add a column with a non-constant default (nor recreate the table, the
+    # count triggers refer to it): the column is nullable and set from now on
+    op.add_column("table_counts", sa.Column("changed_at", sa.DateTime(), nullable=True))
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+    # UTC, like CURRENT_TIMESTAMP on SQLite
+    now = "timezone('utc', now())" if is_postgresql else "CURRENT_TIMESTAMP"
+    op.execute(f"UPDATE table_counts SET changed_at = {now}")
+
+    if is_postgresql:
+        # Once per statement: the counter only has to change, not to count the rows
+        op.execute(
+            """
+            CREATE FUNCTION update_table_change() RETURNS trigger AS $$
+            BEGIN
+                UPDATE table_counts
+                SET change_count = change_count + 1,
+                    changed_at = timezone('utc', now())
+                WHERE table_name = TG_TABLE_NAME;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+            """
+        )
+        for table in CHANGE_TRACKED_TABLES:
+            op.execute(
+                f"CREATE TRIGGER {table}_change AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE "
+                f"ON {table} FOR EACH STATEMENT EXECUTE FUNCTION update_table_change()"
+            )
+        return
+
+    for table in CHANGE_TRACKED_TABLES:
+        for event in ("insert", "update", "delete"):
+            op.execute(
+                f"CREATE TRIGGER {table}_change_{event} AFTER {event.upper()} ON {table} BEGIN "
+                f"UPDATE table_counts SET change_count = change_count + 1, "
+                f"changed_at = CURRENT_TIMESTAMP WHERE table_name = '{table}'; "
+                f"END"
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for table in CHANGE_TRACKED_TABLES:
+            op.execute(f"DROP TRIGGER {table}_change ON {table}")
+        op.execute("DROP FUNCTION update_table_change()")
+    else:
+        for table in CHANGE_TRACKED_TABLES:
+            for event in ("delete", "update", "insert"):
+                op.execute(f"DROP TRIGGER {table}_change_{event}")
+
+    op.drop_column("table_counts", "changed_at")
+    op.drop_column("table_counts", "change_count")
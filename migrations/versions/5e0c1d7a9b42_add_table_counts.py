@@ -0,0 +1,92 @@
+"""add table_counts maintained by triggers
+
+Revision ID: 5e0c1d7a9b42
+Revises: d28edbc89768
+Create Date: 2026-10-17 10:12:44.518302
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e0c1d7a9b42"
+down_revision: Union[str, None] = "d28edbc89768"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables of the collection endpoints, their row counts are used for the pagination
+COUNTED_TABLES = ("authors", "books", "reservations", "stocks", "users")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "table_counts",
+        sa.Column("table_name", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("table_name"),
+    )
+    for table in COUNTED_TABLES:
+        op.execute(
+            f"INSERT INTO table_counts (table_name, row_count) "
+            f"SELECT '{table}', COUNT(*) FROM {table}"
+        )
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            """
+            CREATE FUNCTION update_table_count() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    UPDATE table_counts SET row_count = row_count + 1
+                    WHERE table_name = TG_TABLE_NAME;
+                ELSIF TG_OP = 'DELETE' THEN
+                    UPDATE table_counts SET row_count = row_count - 1
+                    WHERE table_name = TG_TABLE_NAME;
+                ELSE
+                    UPDATE table_counts SET row_count = 0 WHERE table_name = TG_TABLE_NAME;
+                END IF;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+            """
+        )
+        for table in COUNTED_TABLES:
+            op.execute(
+                f"CREATE TRIGGER {table}_count AFTER INSERT OR DELETE ON {table} "
+                f"FOR EACH ROW EXECUTE FUNCTION update_table_count()"
+            )
+            op.execute(
+                f"CREATE TRIGGER {table}_count_truncate AFTER TRUNCATE ON {table} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION update_table_count()"
+            )
+        return
+
+    for table in COUNTED_TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_count_insert AFTER INSERT ON {table} BEGIN "
+            f"UPDATE table_counts SET row_count = row_count + 1 WHERE table_name = '{table}'; "
+            f"END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_count_delete AFTER DELETE ON {table} BEGIN "
+            f"UPDATE table_counts SET row_count = row_count - 1 WHERE table_name = '{table}'; "
+            f"END"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for table in COUNTED_TABLES:
+            op.execute(f"DROP TRIGGER {table}_count_truncate ON {table}")
+            op.execute(f"DROP TRIGGER {table}_count ON {table}")
+        op.execute("DROP FUNCTION update_table_count()")
+    else:
+        for table in COUNTED_TABLES:
+            op.execute(f"DROP TRIGGER {table}_count_delete")
+            op.execute(f"DROP TRIGGER {table}_count_insert")
+
+    op.drop_table("table_counts")
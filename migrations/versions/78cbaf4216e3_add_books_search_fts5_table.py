@@ -0,0 +1,81 @@
+"""add books_search FTS5 table maintained by triggers
+
+Revision ID: 78cbaf4216e3
+Revises: 34b25aef6520
+Create Date: 2026-10-17 21:16:05.203118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "78cbaf4216e3"
+down_revision: Union[str, None] = "34b25aef6520"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Search columns of a book, its rowid is the book id
+INSERT_BOOK_SEARCH = """
+    INSERT INTO books_search (rowid, title, category, author_first_name, author_last_name)
+    SELECT {book}.id, {book}.title, {book}.category, authors.first_name, authors.last_name
+    FROM authors WHERE authors.id = {book}.author_id
+"""
+
+
+def upgrade() -> None:
+    # SQLite only, the search route is not available on the other databases
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    # The book and author names are copied in the index (a contentful table): they come from
+    # two tables, the index could not read them back from a single one. The prefix indexes
+    # make the prefix queries of the search route as fast as the full words.
+    op.execute(
+        "CREATE VIRTUAL TABLE books_search USING fts5("
+        "title, category, author_first_name, author_last_name, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+    op.execute(
+        INSERT_BOOK_SEARCH.format(book="books").replace(
+            "FROM authors WHERE", "FROM books JOIN authors ON"
+        )
+    )
+
+    op.execute(
+        f"CREATE TRIGGER books_search_insert AFTER INSERT ON books BEGIN "
+        f"{INSERT_BOOK_SEARCH.format(book='NEW')}; END"
+    )
+    op.execute(
+        f"CREATE TRIGGER books_search_update "
+        f"AFTER UPDATE OF id, title, category, author_id ON books BEGIN "
+        f"DELETE FROM books_search WHERE rowid = OLD.id; "
+        f"{INSERT_BOOK_SEARCH.format(book='NEW')}; END"
+    )
+    op.execute(
+        "CREATE TRIGGER books_search_delete AFTER DELETE ON books BEGIN "
+        "DELETE FROM books_search WHERE rowid = OLD.id; END"
+    )
+    # An author with books cannot be deleted (foreign key), only its names change
+    op.execute(
+        "CREATE TRIGGER authors_search_update AFTER UPDATE OF first_name, last_name ON authors "
+        "BEGIN "
+        "UPDATE books_search SET author_first_name = NEW.first_name, "
+        "author_last_name = NEW.last_name "
+        "WHERE rowid IN (SELECT id FROM books WHERE author_id = NEW.id); END"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    for trigger in (
+        "authors_search_update",
+        "books_search_delete",
+        "books_search_update",
+        "books_search_insert",
+    ):
+        op.execute(f"DROP TRIGGER {trigger}")
+    op.execute("DROP TABLE books_search")
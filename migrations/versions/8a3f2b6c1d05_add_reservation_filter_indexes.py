@@ -0,0 +1,42 @@
+"""add composite indexes for the reservation filters
+
+Revision ID: 8a3f2b6c1d05
+Revises: 5e0c1d7a9b42
+Create Date: 2026-10-17 14:03:21.730915
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8a3f2b6c1d05"
+down_revision: Union[str, None] = "5e0c1d7a9b42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The composite indexes lead with the same columns, the single column ones are redundant
+    op.drop_index("ix_reservations_user_id", table_name="reservations")
+    op.drop_index("ix_reservations_book_id", table_name="reservations")
+    op.create_index(
+        "ix_reservations_user_id_returned_at", "reservations", ["user_id", "returned_at"]
+    )
+    op.create_index(
+        "ix_reservations_book_id_returned_at", "reservations", ["book_id", "returned_at"]
+    )
+    op.create_index("ix_reservations_status_id_id", "reservations", ["status_id", "id"])
+    op.create_index(
+        "ix_reservations_returned_at_due_date", "reservations", ["returned_at", "due_date"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reservations_returned_at_due_date", table_name="reservations")
+    op.drop_index("ix_reservations_status_id_id", table_name="reservations")
+    op.drop_index("ix_reservations_book_id_returned_at", table_name="reservations")
+    op.drop_index("ix_reservations_user_id_returned_at", table_name="reservations")
+    op.create_index("ix_reservations_book_id", "reservations", ["book_id"], unique=False)
+    op.create_index("ix_reservations_user_id", "reservations", ["user_id"], unique=False)
@@ -0,0 +1,32 @@
+"""add a partial index of the open loans
+
+Revision ID: b71e4c9d2a36
+Revises: 8a3f2b6c1d05
+Create Date: 2026-10-17 16:41:08.204517
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b71e4c9d2a36"
+down_revision: Union[str, None] = "8a3f2b6c1d05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_reservations_open_user_id_book_id",
+        "reservations",
+        ["user_id", "book_id"],
+        sqlite_where=sa.text("returned_at IS NULL"),
+        postgresql_where=sa.text("returned_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reservations_open_user_id_book_id", table_name="reservations")
@@ -1,20 +1,44 @@
 import logging
-from contextlib import contextmanager
 
+from sqlalchemy import Connection, Engine
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.sql import text
 
-from src.db.engine import get_db_session
+from src.db.engine import get_db_engine
 
 logger = logging.getLogger("app")
 
 
-def db_settings_initializations() -> None:
-    """Databases settings initializations."""
+def get_connection_details(connection: Connection) -> str:
+    """Run a backend specific check query on the connection.
+
+    Args:
+        connection (Connection): Database connection.
+
+    Returns:
+        str: Short description of the verified connection.
+    """
+    # PRAGMA only exists on SQLite, the other backends get a plain round trip.
+    if connection.dialect.name == "sqlite":
+        journal_mode = connection.exec_driver_sql("PRAGMA journal_mode;").scalar()
+        return f"sqlite {journal_mode=}"
+
+    connection.exec_driver_sql("SELECT 1;")
+    return connection.dialect.name
+
+
+def db_settings_initializations(engine: Engine | None = None) -> None:
+    """Databases settings initializations.
+
+    The connection level settings (SQLite pragmas) are applied by the engine's connect hook,
+    so this only verifies that a connection can be opened with them.
+
+    Args:
+        engine (Engine | None, optional): Engine to verify. Defaults to the application engine.
+    """
     try:
-        with contextmanager(get_db_session)() as session:
-            session.exec(text("PRAGMA foreign_keys = ON;"))  # type: ignore
-            logger.info("Database connection verified successfully.")
+        with (engine or get_db_engine()).connect() as connection:
+            details = get_connection_details(connection)
+            logger.info(f"Database connection verified successfully ({details}).")
     except SQLAlchemyError as e:
         logger.error(f"Failed to verify database connection: {str(e)}")
         raise
@@ -1,12 +1,285 @@
-from typing import Annotated, Iterator
+from typing import Annotated, Any, AsyncIterator, Iterator
 
-from fastapi import Depends
-from sqlalchemy import Engine
-from sqlalchemy.pool import QueuePool, StaticPool
+from fastapi import Depends, Request
+from sqlalchemy import Connection, Engine, event, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool, StaticPool
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing_extensions import Self
 
 from src.config.config import APP_CONFIG
+from src.db.statement_cache import statement_cache
+
+TESTING_PROFILE = "testing"
+
+POOL_CLASSES: dict[str, type[Pool]] = {
+    "QueuePool": QueuePool,
+    "StaticPool": StaticPool,
+    "NullPool": NullPool,
+}
+
+# asyncio drivers used by the async engine for each backend
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "psycopg",
+}
+
+# HTTP methods which never modify the database, their requests use the reader pool
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def register_sqlite_pragmas(engine: Engine, pragmas: dict[str, Any]) -> None:
+    """Apply the SQLite pragmas to every new DBAPI connection created by the engine.
+
+    Pragmas such as ``foreign_keys`` or ``busy_timeout`` are per connection, so they must be
+    set each time the pool opens a connection and not only once at application startup.
+
+    Args:
+        engine (Engine): SQLite engine.
+        pragmas (dict[str, Any]): Pragma names and values, applied in the given order.
+    """
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name} = {value};")
+        finally:
+            cursor.close()
+
+
+def register_sqlite_immediate_transactions(engine: Engine) -> None:
+    """Start every transaction of the engine with ``BEGIN IMMEDIATE``.
+
+    The write lock is taken when the transaction starts instead of being upgraded from a
+    read lock on the first write, so concurrent writers wait on ``busy_timeout`` instead of
+    failing with "database is locked".
+
+    Args:
+        engine (Engine): SQLite engine.
+    """
+
+    event.listen(engine, "connect", disable_driver_transactions)
+    event.listen(engine, "begin", begin_immediate)
+
+
+def disable_driver_transactions(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Stop the driver from emitting its own BEGIN, `begin_immediate` does it."""
+    dbapi_connection.isolation_level = None
+
+
+def begin_immediate(connection: Connection) -> None:
+    """Start a transaction taking the SQLite write lock."""
+    connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def has_sqlite_immediate_transactions(engine: Engine) -> bool:
+    """Whether the transactions of a SQLite engine are started by SQLAlchemy (the writer
+    engine), see `register_sqlite_immediate_transactions`."""
+    return event.contains(engine, "begin", begin_immediate)
+
+
+def is_sqlite_writer_enabled(profile: dict[str, Any]) -> bool:
+    """Whether the profile splits a SQLite database into a writer connection and a reader pool.
+
+    Args:
+        profile (dict[str, Any]): Database profile.
+
+    Returns:
+        bool: True if the mutating requests go through the single writer connection.
+    """
+    is_sqlite = make_url(profile["url"]).get_backend_name() == "sqlite"
+    return is_sqlite and bool(profile.get("sqlite_writer", {}).get("enable", False))
+
+
+def get_database_profile(profile_name: str | None = None) -> dict[str, Any]:
+    """Get a database profile from the application configuration.
+
+    Args:
+        profile_name (str | None, optional): Profile name. Defaults to the configured profile.
+
+    Raises:
+        ValueError: If the profile is not defined in the configuration.
+
+    Returns:
+        dict[str, Any]: Database profile (url, pool and backend specific settings).
+    """
+    profile_name = profile_name or APP_CONFIG["database"]["profile"]
+    profiles: dict[str, dict[str, Any]] = APP_CONFIG["database"]["profiles"]
+    if profile_name not in profiles:
+        raise ValueError(
+            f"Unknown database profile {profile_name=}, expected one of {list(profiles)}"
+        )
+
+    return profiles[profile_name]
+
+
+def get_pool_options(pool_settings: dict[str, Any], *, is_async: bool = False) -> dict[str, Any]:
+    """Convert the pool settings of a profile into ``create_engine`` keyword arguments.
+
+    Args:
+        pool_settings (dict[str, Any]): Pool settings of a database profile.
+        is_async (bool, optional): Whether the options are for an async engine.
+                                   Defaults to False.
+
+    Returns:
+        dict[str, Any]: Keyword arguments for ``create_engine``.
+    """
+    pool_class = POOL_CLASSES[pool_settings.get("class", "QueuePool")]
+    options: dict[str, Any] = {
+        "poolclass": AsyncAdaptedQueuePool if is_async and pool_class is QueuePool else pool_class,
+        "pool_pre_ping": pool_settings.get("pre_ping", False),
+        "pool_recycle": pool_settings.get("recycle", -1),
+    }
+
+    # Only a QueuePool keeps a bounded set of connections to size
+    if pool_class is QueuePool:
+        options["pool_size"] = pool_settings.get("size", 5)
+        options["max_overflow"] = pool_settings.get("max_overflow", 10)
+        options["pool_timeout"] = pool_settings.get("timeout", 30)
+
+    return options
+
+
+def get_sqlite_pragmas(profile: dict[str, Any], *, is_writer: bool) -> dict[str, Any]:
+    """Get the pragmas of the connections of a SQLite engine.
+
+    When the writer is enabled, the connections of the reader pool are made read-only.
+
+    Args:
+        profile (dict[str, Any]): Database profile.
+        is_writer (bool): Whether the pragmas are for the writer engine.
+
+    Returns:
+        dict[str, Any]: Pragma names and values.
+    """
+    pragmas = dict(profile.get("sqlite_pragmas", {}))
+    if is_sqlite_writer_enabled(profile) and not is_writer:
+        pragmas["query_only"] = "ON"
+
+    return pragmas
+
+
+def get_engine_options(
+    profile: dict[str, Any], *, is_writer: bool = False, is_async: bool = False
+) -> dict[str, Any]:
+    """Get the ``create_engine`` keyword arguments of the reader or the writer engine.
+
+    The writer engine holds a single connection, the mutating requests queue for it.
+
+    Args:
+        profile (dict[str, Any]): Database profile.
+        is_writer (bool, optional): Whether the options are for the writer engine.
+                                    Defaults to False.
+        is_async (bool, optional): Whether the options are for an async engine.
+                                   Defaults to False.
+
+    Returns:
+        dict[str, Any]: Keyword arguments for ``create_engine``.
+    """
+    pool_settings = profile.get("pool", {})
+    if is_writer:
+        writer_timeout = profile["sqlite_writer"].get("timeout", 30)
+        pool_settings = {**pool_settings, "class": "QueuePool", "size": 1, "max_overflow": 0}
+        pool_settings["timeout"] = writer_timeout
+
+    return get_pool_options(pool_settings, is_async=is_async)
+
+
+def create_engine_from_profile(profile: dict[str, Any], *, is_writer: bool = False) -> Engine:
+    """Create an engine from a database profile.
+
+    Args:
+        profile (dict[str, Any]): Database profile.
+        is_writer (bool, optional): Whether to create the single connection writer engine of
+                                    a SQLite profile. Defaults to False.
+
+    Returns:
+        Engine: Database engine.
+    """
+    engine = create_engine(url=profile["url"], **get_engine_options(profile, is_writer=is_writer))
+    statement_cache.register_engine(engine)
+    if engine.dialect.name == "sqlite":
+        register_sqlite_pragmas(engine, get_sqlite_pragmas(profile, is_writer=is_writer))
+        if is_writer:
+            register_sqlite_immediate_transactions(engine)
+
+    return engine
+
+
+def create_async_engine_from_profile(
+    profile: dict[str, Any], *, is_writer: bool = False
+) -> AsyncEngine:
+    """Create an async engine from a database profile.
+
+    The profile URL is switched to the asyncio driver of its backend, the pool and the
+    SQLite pragmas are the same as for the synchronous engine.
+
+    Args:
+        profile (dict[str, Any]): Database profile.
+        is_writer (bool, optional): Whether to create the single connection writer engine of
+                                    a SQLite profile. Defaults to False.
+
+    Returns:
+        AsyncEngine: Async database engine.
+    """
+    engine = create_async_engine(
+        get_async_database_url(profile["url"]),
+        **get_engine_options(profile, is_writer=is_writer, is_async=True),
+    )
+    statement_cache.register_engine(engine.sync_engine)
+    if engine.dialect.name == "sqlite":
+        pragmas = get_sqlite_pragmas(profile, is_writer=is_writer)
+        register_sqlite_pragmas(engine.sync_engine, pragmas)
+        if is_writer:
+            register_sqlite_immediate_transactions(engine.sync_engine)
+
+    return engine
+
+
+def get_async_database_url(url: str) -> str:
+    """Get the URL of the asyncio driver for a database URL.
+
+    Args:
+        url (str): Database URL.
+
+    Returns:
+        str: Same database with the asyncio driver of its backend.
+    """
+    database_url = make_url(url)
+    backend = database_url.get_backend_name()
+    async_url = database_url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    return async_url.render_as_string(hide_password=False)
+
+
+def get_database_url(profile_name: str | None = None) -> str:
+    """Get the database URL of a profile.
+
+    Args:
+        profile_name (str | None, optional): Profile name. Defaults to the configured profile.
+
+    Returns:
+        str: Database URL.
+    """
+    return str(get_database_profile(profile_name)["url"])
+
+
+def get_sqlite_database_file(url: str) -> str | None:
+    """Get the database file of a SQLite URL.
+
+    Args:
+        url (str): Database URL.
+
+    Returns:
+        str | None: Database file, or None for other backends and in-memory databases.
+    """
+    database_url = make_url(url)
+    if database_url.get_backend_name() != "sqlite" or database_url.database in (None, ":memory:"):
+        return None
+
+    return database_url.database
 
 
 class DatabaseEngine:
@@ -26,34 +299,68 @@ class DatabaseEngine:
         """Initialize the class."""
         if not hasattr(self, "initialized"):
             self._engine: Engine | None = None
+            self._writer_engine: Engine | None = None
             self._test_engine: Engine | None = None
+            self._async_engine: AsyncEngine | None = None
+            self._async_writer_engine: AsyncEngine | None = None
+            self._async_test_engine: AsyncEngine | None = None
             self.initialized = True
 
     def get_engine(self) -> Engine:
         """Get or create the engine."""
         if self._engine is None:
-            self._engine = create_engine(
-                url="sqlite:///library_system.db",
-                poolclass=QueuePool,
-                pool_size=5,
-                max_overflow=10,
-            )
+            self._engine = create_engine_from_profile(get_database_profile())
 
         return self._engine
 
+    def get_writer_engine(self) -> Engine:
+        """Get or create the writer engine, the engine itself if the writer is not enabled."""
+        profile = get_database_profile()
+        if not is_sqlite_writer_enabled(profile):
+            return self.get_engine()
+
+        if self._writer_engine is None:
+            self._writer_engine = create_engine_from_profile(profile, is_writer=True)
+
+        return self._writer_engine
+
     def get_test_engine(self) -> Engine:
         """Get or create the engine for test DB."""
         if self._test_engine is None:
-            self._test_engine = create_engine(
-                f"sqlite:///{APP_CONFIG['testing_db']['file']}",
-                poolclass=StaticPool,
-            )
+            self._test_engine = create_engine_from_profile(get_database_profile(TESTING_PROFILE))
 
         return self._test_engine
 
-    def get_session(self) -> Iterator[Session]:
-        """Get a session."""
-        engine = self.get_engine()
+    def get_async_engine(self) -> AsyncEngine:
+        """Get or create the async engine."""
+        if self._async_engine is None:
+            self._async_engine = create_async_engine_from_profile(get_database_profile())
+
+        return self._async_engine
+
+    def get_async_writer_engine(self) -> AsyncEngine:
+        """Get or create the async writer engine, the async engine if the writer is not enabled."""
+        profile = get_database_profile()
+        if not is_sqlite_writer_enabled(profile):
+            return self.get_async_engine()
+
+        if self._async_writer_engine is None:
+            self._async_writer_engine = create_async_engine_from_profile(profile, is_writer=True)
+
+        return self._async_writer_engine
+
+    def get_async_test_engine(self) -> AsyncEngine:
+        """Get or create the async engine for test DB."""
+        if self._async_test_engine is None:
+            self._async_test_engine = create_async_engine_from_profile(
+                get_database_profile(TESTING_PROFILE)
+            )
+
+        return self._async_test_engine
+
+    def get_session(self, *, is_write: bool = False) -> Iterator[Session]:
+        """Get a session, on the writer engine for the requests modifying the database."""
+        engine = self.get_writer_engine() if is_write else self.get_engine()
         with Session(engine) as session:
             yield session
 
@@ -63,13 +370,30 @@ class DatabaseEngine:
         with Session(engine) as session:
             yield session
 
+    async def get_async_session(self, *, is_write: bool = False) -> AsyncIterator[AsyncSession]:
+        """Get an async session, on the writer engine for the requests modifying the database."""
+        engine = self.get_async_writer_engine() if is_write else self.get_async_engine()
+        async with AsyncSession(engine) as session:
+            yield session
+
+    async def get_async_test_session(self) -> AsyncIterator[AsyncSession]:
+        """Get an async session for test DB."""
+        engine = self.get_async_test_engine()
+        async with AsyncSession(engine) as session:
+            yield session
+
 
 db_engine = DatabaseEngine()
 
 
-def get_db_session() -> Iterator[Session]:
+def is_write_request(request: Request) -> bool:
+    """Whether the request may modify the database."""
+    return request.method not in READ_ONLY_METHODS
+
+
+def get_db_session(request: Request) -> Iterator[Session]:
     """Get the database session."""
-    yield from db_engine.get_session()
+    yield from db_engine.get_session(is_write=is_write_request(request))
 
 
 def get_db_engine() -> Engine:
@@ -77,6 +401,11 @@ def get_db_engine() -> Engine:
     return db_engine.get_engine()
 
 
+def get_db_writer_engine() -> Engine:
+    """Get the database writer engine."""
+    return db_engine.get_writer_engine()
+
+
 def get_db_test_session() -> Iterator[Session]:
     """Get the database test session."""
     yield from db_engine.get_test_session()
@@ -87,4 +416,36 @@ def get_db_test_engine() -> Engine:
     return db_engine.get_test_engine()
 
 
+async def get_db_async_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """Get the async database session."""
+    async for session in db_engine.get_async_session(is_write=is_write_request(request)):
+        yield session
+
+
+def get_db_async_engine() -> AsyncEngine:
+    """Get the async database engine."""
+    return db_engine.get_async_engine()
+
+
+def get_db_async_writer_engine() -> AsyncEngine:
+    """Get the async database writer engine."""
+    return db_engine.get_async_writer_engine()
+
+
+async def get_db_async_test_session() -> AsyncIterator[AsyncSession]:
+    """Get the async database test session."""
+    async for session in db_engine.get_async_test_session():
+        yield session
+
+
+def get_db_async_test_engine() -> AsyncEngine:
+    """Get the async database test engine."""
+    return db_engine.get_async_test_engine()
+
+
 db_dependency = Annotated[Session, Depends(get_db_session)]
+# Reader engine of the lookups done before the route (authentication), which open and close
+# their own session: the session of the request is not taken for them, nor the writer
+db_reader_engine_dependency = Annotated[Engine, Depends(get_db_engine)]
+db_writer_engine_dependency = Annotated[Engine, Depends(get_db_writer_engine)]
+async_db_dependency = Annotated[AsyncSession, Depends(get_db_async_session)]
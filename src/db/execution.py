@@ -1,13 +1,14 @@
 import logging
-from typing import Sequence, TypeVar
+from typing import Any, Callable, Iterator, Sequence, TypeVar
 
-from sqlalchemy import Delete, Update
+from sqlalchemy import Delete, RowMapping, Update
 from sqlalchemy.exc import IntegrityError, OperationalError, SQLAlchemyError
+from sqlalchemy.sql.dml import ReturningInsert, ReturningUpdate
 from sqlmodel import SQLModel
-from sqlmodel.sql._expression_select_cls import SelectOfScalar
+from sqlmodel.sql._expression_select_cls import Select, SelectOfScalar
 
 from src.db.engine import db_dependency
-from src.exceptions.app import SqlException
+from src.exceptions.app import BadRequestException, SqlException
 from src.exceptions.db import handle_db_exception
 from src.models.http_response_code import HTTPResponseCode
 
@@ -64,7 +65,8 @@ def fetch_one_or_none(db_session: db_dependency, stmt: SelectOfScalar[T]) -> T |
         SqlException: Raised when a database error occurs.
     """  # noqa: E501
     try:
-        result = db_session.exec(stmt).one_or_none()
+        # scalars() and not exec(): the cached statements are lambda statements, not SelectOfScalar
+        result = db_session.scalars(stmt).one_or_none()
         return result
     except SQLAlchemyError as exc:
         logger.error(f"Database error while fetching one record: {exc}")
@@ -88,7 +90,7 @@ def fetch_all(db_session: db_dependency, stmt: SelectOfScalar[T]) -> Sequence[T]
         SqlException: Raised when a database error occurs.
     """
     try:
-        result = db_session.exec(stmt).fetchall()
+        result = db_session.scalars(stmt).all()
         return result
     except SQLAlchemyError as exc:
         logger.error(f"Database error while fetching all records: {exc}")
@@ -97,6 +99,102 @@ def fetch_all(db_session: db_dependency, stmt: SelectOfScalar[T]) -> Sequence[T]
         ) from None
 
 
+def fetch_rows(db_session: db_dependency, stmt: Select[Any]) -> Sequence[RowMapping]:
+    """
+    Fetch the rows of a column-projected select as mappings, without building ORM objects.
+
+    The rows are keyed by the labels of the selected columns, they can be given as they are
+    to the `trusted` constructor of the output models.
+
+    Args:
+        db_session (db_dependency): The database session to use for querying.
+        stmt (Select[Any]): The SQL statement selecting columns.
+
+    Returns:
+        Sequence[RowMapping]: All matching rows.
+
+    Raises:
+        SqlException: Raised when a database error occurs.
+    """
+    try:
+        # execute() and not exec(): the rows are read as mappings and not as tuples
+        result = db_session.execute(stmt).mappings().all()
+        return result
+    except SQLAlchemyError as exc:
+        logger.error(f"Database error while fetching rows: {exc}")
+        raise SqlException(
+            status_code=HTTPResponseCode.INTERNAL_SERVER_ERROR, message=str(exc)
+        ) from None
+
+
+def iter_rows(
+    db_session: db_dependency, stmt: Select[Any], *, batch_size: int
+) -> Iterator[Sequence[RowMapping]]:
+    """
+    Iterate over the rows of a column-projected select one batch at a time, through a
+    server-side cursor.
+
+    Only one batch of rows is in memory whatever the number of rows. The rows are read by a
+    single statement, so they all come from the same snapshot of the database: the connection
+    (and on SQLite its read snapshot) is held until the iteration ends.
+
+    Args:
+        db_session (db_dependency): The database session to use for querying.
+        stmt (Select[Any]): The SQL statement selecting columns.
+        batch_size (int): Number of rows fetched from the cursor at a time.
+
+    Yields:
+        Sequence[RowMapping]: The rows of the next batch.
+
+    Raises:
+        SqlException: Raised when a database error occurs.
+    """
+    try:
+        # yield_per streams the rows from a server-side cursor instead of buffering them all
+        result = db_session.execute(stmt, execution_options={"yield_per": batch_size}).mappings()
+        for batch in result.partitions():
+            yield batch
+    except SQLAlchemyError as exc:
+        logger.error(f"Database error while iterating over rows: {exc}")
+        raise SqlException(
+            status_code=HTTPResponseCode.INTERNAL_SERVER_ERROR, message=str(exc)
+        ) from None
+
+
+def iter_rows_by_id(
+    db_session: db_dependency, get_stmt: Callable[[int], Select[Any]], *, batch_size: int
+) -> Iterator[Sequence[RowMapping]]:
+    """
+    Iterate over the rows of a table one batch at a time, each batch being seeked on the id
+    of the last row of the previous one.
+
+    The session is closed after each batch, so its connection goes back to the pool between
+    the batches instead of being held for the whole iteration. The batches are not read from
+    the same snapshot: a row written during the iteration may or may not be in the rows.
+
+    Args:
+        db_session (db_dependency): The database session to use for querying.
+        get_stmt (Callable[[int], Select[Any]]): Gets the select of the `batch_size` rows
+                                                 after an id, in id order, with an `id` column.
+        batch_size (int): Number of rows of each batch.
+
+    Yields:
+        Sequence[RowMapping]: The rows of the next batch.
+
+    Raises:
+        SqlException: Raised when a database error occurs.
+    """
+    cursor_id = 0
+    while True:
+        rows = fetch_rows(db_session, get_stmt(cursor_id))
+        db_session.close()
+        if rows:
+            yield rows
+        if len(rows) < batch_size:
+            return
+        cursor_id = rows[-1]["id"]
+
+
 def delete_all_query(
     db_session: db_dependency,
     sql_models: Sequence[T],
@@ -151,3 +249,87 @@ def execute_statements(
 
     except (IntegrityError, OperationalError, SQLAlchemyError) as exc:
         handle_db_exception(db_session, exc)
+
+
+def execute_returning(
+    db_session: db_dependency,
+    stmt: ReturningInsert[Any] | ReturningUpdate[Any],
+    params: Sequence[dict[str, Any]] | None = None,
+    *,
+    is_commit: bool = True,
+) -> Sequence[RowMapping]:
+    """Executes an Insert or Update statement with a RETURNING clause in the database.
+
+    Args:
+        db_session (db_dependency): The database session to use for executing the query.
+        stmt (ReturningInsert[Any] | ReturningUpdate[Any]): The statement to execute.
+        params (Sequence[dict[str, Any]] | None, optional): Values of the rows to insert with
+                                                            the statement. Defaults to None.
+        is_commit (bool, optional): Whether to commit the transaction after executing
+                                    the statement. Defaults to True.
+
+    Returns:
+        Sequence[RowMapping]: The returned columns of the inserted or updated rows.
+
+    Raises:
+        SqlException: Raised when a database error occurs.
+    """
+    try:
+        # The returned rows are read before the commit closes the cursor
+        result = db_session.execute(stmt, params).mappings().all()
+        if is_commit:
+            db_session.commit()
+
+    except (IntegrityError, OperationalError, SQLAlchemyError) as exc:
+        handle_db_exception(db_session, exc)
+    return result
+
+
+def execute_bulk_insert(
+    db_session: db_dependency,
+    stmt: ReturningInsert[Any],
+    params: Sequence[dict[str, Any]],
+) -> Sequence[RowMapping]:
+    """Inserts rows with a single executemany-style statement and commits them.
+
+    Args:
+        db_session (db_dependency): The database session to use for executing the query.
+        stmt (ReturningInsert[Any]): The insert statement, with the columns to return.
+        params (Sequence[dict[str, Any]]): Values of the rows to insert.
+
+    Returns:
+        Sequence[RowMapping]: The returned columns of the inserted rows.
+
+    Raises:
+        BadRequestException: Raised when a row breaks a constraint of the table (unique key,
+                             foreign key), none of the rows are inserted.
+        SqlException: Raised when another database error occurs.
+    """
+    try:
+        result = db_session.execute(stmt, params).mappings().all()
+        db_session.commit()
+
+    except IntegrityError as exc:
+        db_session.rollback()
+        raise BadRequestException(
+            status_code=HTTPResponseCode.BAD_REQUEST, message=str(exc.orig)
+        ) from None
+    except (OperationalError, SQLAlchemyError) as exc:
+        handle_db_exception(db_session, exc)
+    return result
+
+
+def commit_session(db_session: db_dependency) -> None:
+    """Commits the transaction of the session, for the statements executed without commit.
+
+    Args:
+        db_session (db_dependency): The database session to commit.
+
+    Raises:
+        SqlException: Raised when a database error occurs.
+    """
+    try:
+        db_session.commit()
+
+    except (IntegrityError, OperationalError, SQLAlchemyError) as exc:
+        handle_db_exception(db_session, exc)
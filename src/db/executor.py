@@ -0,0 +1,144 @@
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, ParamSpec, TypeVar
+
+from src.config.config import APP_CONFIG
+from src.exceptions.app import ServiceUnavailableException
+from src.models.http_response_code import HTTPResponseCode
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class DatabaseExecutor:
+    """Dedicated thread pool for the blocking database operations, with backpressure.
+
+    At most ``max_workers + max_queue_size`` operations are admitted at the same time, any
+    other one is rejected straight away instead of piling up behind a busy database. An
+    operation still waiting for a worker after ``queue_timeout`` seconds is not run.
+    """
+
+    def __init__(self, *, max_workers: int, max_queue_size: int, queue_timeout: float) -> None:
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="db-executor"
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._active = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of admitted operations (running and queued)."""
+        return self.max_workers + self.max_queue_size
+
+    async def run(self, operation: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """Run a blocking operation on the executor and wait for its result.
+
+        Args:
+            operation (Callable[P, R]): Blocking operation.
+            *args (P.args): Positional arguments of the operation.
+            **kwargs (P.kwargs): Keyword arguments of the operation.
+
+        Raises:
+            ServiceUnavailableException: The queue is full or the operation waited too long.
+
+        Returns:
+            R: Result of the operation.
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._rejected += 1
+                raise ServiceUnavailableException(
+                    status_code=HTTPResponseCode.SERVICE_UNAVAILABLE,
+                    message="Database is busy, please retry later",
+                )
+            self._in_flight += 1
+
+        job = functools.partial(operation, *args, **kwargs)
+        future = self._executor.submit(self._run_job, time.perf_counter(), job)
+        return await asyncio.wrap_future(future)
+
+    def _run_job(self, submitted_at: float, job: Callable[[], R]) -> R:
+        """Run the operation in a worker thread and keep the statistics up to date."""
+        try:
+            self._start_job(time.perf_counter() - submitted_at)
+            return job()
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._in_flight -= 1
+                self._completed += 1
+
+    def _start_job(self, wait: float) -> None:
+        """Record the time a job waited for a worker and reject it if it waited too long."""
+        with self._lock:
+            self._active += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            if wait > self.queue_timeout:
+                self._timed_out += 1
+                raise ServiceUnavailableException(
+                    status_code=HTTPResponseCode.SERVICE_UNAVAILABLE,
+                    message=f"Database operation waited {wait:.3f}s for a worker",
+                )
+
+    def stats(self) -> dict[str, Any]:
+        """Get the executor statistics.
+
+        Returns:
+            dict[str, Any]: Workers, queue depth, wait times and saturation.
+        """
+        with self._lock:
+            started = self._completed + self._active
+            return {
+                "max_workers": self.max_workers,
+                "max_queue_size": self.max_queue_size,
+                "active": self._active,
+                "queue_depth": self._in_flight - self._active,
+                "saturation": round(self._in_flight / self.capacity, 3),
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+                "average_wait_ms": round(self._total_wait / started * 1000, 3) if started else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 3),
+            }
+
+    def shutdown(self) -> None:
+        """Wait for the running operations and stop the worker threads."""
+        self._executor.shutdown(wait=True)
+
+
+_db_executor: DatabaseExecutor | None = None
+
+
+def get_db_executor() -> DatabaseExecutor:
+    """Get or create the database executor from the application configuration."""
+    global _db_executor  # noqa: PLW0603
+    if _db_executor is None:
+        settings = APP_CONFIG["database"]["execution"]["executor"]
+        _db_executor = DatabaseExecutor(
+            max_workers=settings["max_workers"],
+            max_queue_size=settings["max_queue_size"],
+            queue_timeout=settings["queue_timeout"],
+        )
+
+    return _db_executor
+
+
+def shutdown_db_executor() -> None:
+    """Shut the database executor down if it was created."""
+    global _db_executor  # noqa: PLW0603
+    if _db_executor is not None:
+        _db_executor.shutdown()
+        _db_executor = None
@@ -0,0 +1,254 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Concatenate, ParamSpec, TypeVar
+
+from sqlalchemy import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session
+
+from src.config.config import APP_CONFIG
+from src.db.engine import has_sqlite_immediate_transactions
+from src.db.table_changes import notify_table_changes, pop_changed_tables
+from src.exceptions.app import ServiceUnavailableException, SqlException
+from src.models.http_response_code import HTTPResponseCode
+
+logger = logging.getLogger("sql")
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass
+class GroupCommitJob:
+    """Database operation waiting for the group commit thread."""
+
+    operation: Callable[..., Any]
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    future: Future[Any] = field(default_factory=Future)
+
+
+# Job, result of its operation and error raised by the operation or the commit
+GroupCommitOutcome = tuple[GroupCommitJob, Any, BaseException | None]
+
+
+class GroupCommitter:
+    """Commit the database operations of concurrent requests in a shared transaction.
+
+    A single thread runs the operations one after the other on the same connection, each of
+    them in its own savepoint: an operation failing only rolls back its own changes. The
+    transaction is committed once ``max_batch_size`` operations ran or ``max_delay_ms``
+    elapsed since the first one, and only then the callers get their results. One commit
+    (one fsync) is shared by the whole batch.
+
+    The connection is only held while a batch is open, the other writers get it in between.
+    """
+
+    def __init__(self, engine: Engine, *, max_batch_size: int, max_delay_ms: float) -> None:
+        self.engine = engine
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay_ms / 1000
+        self._queue: queue.SimpleQueue[GroupCommitJob | None] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._is_stopped = False
+        self._is_stop_received = False
+        self._batches = 0
+        self._operations = 0
+        self._thread = threading.Thread(target=self._run, name="db-group-commit", daemon=True)
+        self._thread.start()
+
+    def submit(
+        self,
+        operation: Callable[Concatenate[Session, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[R]:
+        """Queue a database operation for the next batch.
+
+        Args:
+            operation (Callable[Concatenate[Session, P], R]): Operation to run, the session
+                                                              is passed as first argument.
+            *args (P.args): Positional arguments of the operation.
+            **kwargs (P.kwargs): Keyword arguments of the operation.
+
+        Raises:
+            ServiceUnavailableException: The group committer is shut down.
+
+        Returns:
+            Future[R]: Result of the operation, set once its batch is committed.
+        """
+        job = GroupCommitJob(operation=operation, args=args, kwargs=kwargs)
+        with self._lock:
+            if self._is_stopped:
+                raise ServiceUnavailableException(
+                    status_code=HTTPResponseCode.SERVICE_UNAVAILABLE,
+                    message="Database group commit is shut down",
+                )
+            self._queue.put(job)
+
+        return job.future
+
+    def _run(self) -> None:
+        """Group commit thread, runs the batches until the shutdown."""
+        while not self._is_stop_received:
+            job = self._get_next_job()
+            if job is not None:
+                self._resolve_batch(self._run_batch(job))
+
+    def _run_batch(self, first_job: GroupCommitJob) -> list[GroupCommitOutcome]:  # noqa: PLR0915
+        """Run and commit a batch of operations, starting with the given one."""
+        batch: list[GroupCommitOutcome] = []
+        changed_tables: set[str] = set()
+        try:
+            with self.engine.connect() as connection, connection.begin():
+                deadline = time.monotonic() + self.max_delay
+                job: GroupCommitJob | None = first_job
+                while job is not None:
+                    batch.append(self._run_job(connection, job, changed_tables))
+                    if len(batch) >= self.max_batch_size:
+                        break
+                    job = self._get_next_job(deadline - time.monotonic())
+            # The writes of the operations are only visible once the batch is committed
+            notify_table_changes(changed_tables)
+        except Exception as exc:
+            # The whole batch is lost, every caller gets the error and the thread goes on
+            logger.error(f"Group commit of {len(batch)} operations failed: {exc}")
+            error: Exception = (
+                SqlException(status_code=HTTPResponseCode.INTERNAL_SERVER_ERROR, message=str(exc))
+                if isinstance(exc, SQLAlchemyError)
+                else exc
+            )
+            jobs = [job for job, _, _ in batch] or [first_job]
+            batch = [(job, None, error) for job in jobs]
+
+        return batch
+
+    def _resolve_batch(self, batch: list[GroupCommitOutcome]) -> None:
+        """Give their results to the callers of a committed batch."""
+        with self._lock:
+            self._batches += 1
+            self._operations += len(batch)
+
+        for job, result, error in batch:
+            if error is None:
+                job.future.set_result(result)
+            else:
+                job.future.set_exception(error)
+
+    def _get_next_job(self, timeout: float | None = None) -> GroupCommitJob | None:
+        """Wait for the next operation, None on timeout or when the shutdown is received."""
+        if self._is_stop_received or (timeout is not None and timeout <= 0):
+            return None
+        try:
+            job = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+        self._is_stop_received = job is None
+        return job
+
+    @staticmethod
+    def _run_job(
+        connection: Connection, job: GroupCommitJob, changed_tables: set[str]
+    ) -> GroupCommitOutcome:
+        """Run an operation in a savepoint of the batch transaction, adding the tables it
+        wrote to the changed tables of the batch."""
+        # The commit of the operation releases its savepoint, the batch commits the transaction
+        with Session(bind=connection, join_transaction_mode="create_savepoint") as db_session:
+            try:
+                return job, job.operation(db_session, *job.args, **job.kwargs), None
+            except Exception as exc:
+                return job, None, exc
+            finally:
+                changed_tables.update(pop_changed_tables(db_session))
+
+    def stats(self) -> dict[str, Any]:
+        """Get the group commit statistics.
+
+        Returns:
+            dict[str, Any]: Committed batches, operations and average batch size.
+        """
+        with self._lock:
+            return {
+                "max_batch_size": self.max_batch_size,
+                "max_delay_ms": self.max_delay * 1000,
+                "batches": self._batches,
+                "operations": self._operations,
+                "average_batch_size": (
+                    round(self._operations / self._batches, 3) if self._batches else 0.0
+                ),
+            }
+
+    def shutdown(self) -> None:
+        """Commit the pending operations and stop the group commit thread."""
+        with self._lock:
+            self._is_stopped = True
+            self._queue.put(None)
+
+        self._thread.join()
+
+
+# Group committers by engine, one thread and batch per database
+_group_committers: dict[Engine, GroupCommitter] = {}
+_group_committers_lock = threading.Lock()
+
+
+def is_group_commit_enabled() -> bool:
+    """Whether the group commit is enabled in the application configuration."""
+    return bool(APP_CONFIG["database"]["execution"]["group_commit"]["enable"])
+
+
+def get_group_committer(engine: Engine) -> GroupCommitter:
+    """Get or create the group committer of a writer engine from the application
+    configuration.
+
+    Args:
+        engine (Engine): Writer engine of the batches.
+
+    Raises:
+        ValueError: A SQLite engine which is not the writer engine, the savepoints of the
+                    batches need the transactions handled by SQLAlchemy.
+
+    Returns:
+        GroupCommitter: Group committer of the engine.
+    """
+    if engine.dialect.name == "sqlite" and not has_sqlite_immediate_transactions(engine):
+        raise ValueError("The group commit on SQLite needs the sqlite_writer enabled")
+
+    with _group_committers_lock:
+        if engine not in _group_committers:
+            settings = APP_CONFIG["database"]["execution"]["group_commit"]
+            _group_committers[engine] = GroupCommitter(
+                engine,
+                max_batch_size=settings["max_batch_size"],
+                max_delay_ms=settings["max_delay_ms"],
+            )
+
+        return _group_committers[engine]
+
+
+def find_group_committer(engine: Engine) -> GroupCommitter | None:
+    """Get the group committer of a writer engine if it was created, without creating it.
+
+    Args:
+        engine (Engine): Writer engine of the batches.
+
+    Returns:
+        GroupCommitter | None: Group committer of the engine, None if not created yet.
+    """
+    with _group_committers_lock:
+        return _group_committers.get(engine)
+
+
+def shutdown_group_committers() -> None:
+    """Commit the pending operations and stop the group committers which were created."""
+    with _group_committers_lock:
+        group_committers = list(_group_committers.values())
+        _group_committers.clear()
+
+    for group_committer in group_committers:
+        group_committer.shutdown()
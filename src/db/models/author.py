@@ -3,6 +3,8 @@ from datetime import date, datetime
 from sqlalchemy import Column, DateTime, UniqueConstraint, func
 from sqlmodel import Field, Relationship, SQLModel
 
+from src.db.models.timestamp import get_utc_now
+
 
 class Author(SQLModel, table=True):
     """Pydantic model to represent an author in the database."""
@@ -26,7 +28,7 @@ class Author(SQLModel, table=True):
         sa_column=Column(
             DateTime,
             server_default=func.now(),
-            onupdate=func.now(),
+            onupdate=get_utc_now,
             nullable=False,
         ),
     )
@@ -3,6 +3,8 @@ from datetime import date, datetime
 from sqlalchemy import Column, DateTime, UniqueConstraint, func
 from sqlmodel import Field, Relationship, SQLModel
 
+from src.db.models.timestamp import get_utc_now
+
 
 class Book(SQLModel, table=True):
     __tablename__ = "books"
@@ -24,7 +26,7 @@ class Book(SQLModel, table=True):
         sa_column=Column(
             DateTime,
             server_default=func.now(),
-            onupdate=func.now(),
+            onupdate=get_utc_now,
             nullable=False,
         ),
     )
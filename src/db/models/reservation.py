@@ -1,15 +1,29 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import Column, DateTime, Index, func, text
 from sqlmodel import Field, SQLModel
 
 
 class Reservation(SQLModel, table=True):
     __tablename__ = "reservations"
+    __table_args__ = (
+        Index("ix_reservations_user_id_returned_at", "user_id", "returned_at"),
+        Index("ix_reservations_book_id_returned_at", "book_id", "returned_at"),
+        Index("ix_reservations_status_id_id", "status_id", "id"),
+        Index("ix_reservations_returned_at_due_date", "returned_at", "due_date"),
+        # Partial index of the open loans, looked up on every reservation and return
+        Index(
+            "ix_reservations_open_user_id_book_id",
+            "user_id",
+            "book_id",
+            sqlite_where=text("returned_at IS NULL"),
+            postgresql_where=text("returned_at IS NULL"),
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True, index=True, nullable=False)
-    book_id: int = Field(foreign_key="books.id", nullable=False, index=True)
-    user_id: int = Field(foreign_key="users.id", nullable=False, index=True)
+    book_id: int = Field(foreign_key="books.id", nullable=False)
+    user_id: int = Field(foreign_key="users.id", nullable=False)
     status_id: int = Field(foreign_key="reservation_status.id", nullable=False)
     borrowed_at: datetime = Field(
         sa_column=Column(
@@ -3,6 +3,8 @@ from datetime import datetime
 from sqlalchemy import Column, DateTime, func
 from sqlmodel import Field, Relationship, SQLModel
 
+from src.db.models.timestamp import get_utc_now
+
 
 class Stock(SQLModel, table=True):
     __tablename__ = "stocks"
@@ -21,7 +23,7 @@ class Stock(SQLModel, table=True):
         sa_column=Column(
             DateTime,
             server_default=func.now(),
-            onupdate=func.now(),
+            onupdate=get_utc_now,
             nullable=False,
         ),
     )
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class TableCount(SQLModel, table=True):
+    """Number of rows of a table, maintained by the insert and delete triggers of the table.
+
+    The change count and time of the tables of the conditional GET endpoints are maintained
+    by their insert, update and delete triggers.
+    """
+
+    __tablename__ = "table_counts"
+
+    table_name: str = Field(primary_key=True, nullable=False, max_length=64)
+    row_count: int = Field(default=0, nullable=False)
+    change_count: int = Field(default=0, nullable=False)
+    changed_at: datetime | None = Field(default=None)
+
+    def __repr__(self) -> str:
+        return f"<TableCount(table_name={self.table_name}, row_count={self.row_count})>"
@@ -0,0 +1,11 @@
+from datetime import datetime, timezone
+
+
+def get_utc_now() -> datetime:
+    """Get the current UTC time, naive like the timestamp columns.
+
+    Set by the application on every update of a row, its microseconds tell apart the
+    versions of a row updated twice in the same second (`CURRENT_TIMESTAMP` only has
+    seconds on SQLite): the ETag of an entity is made of its update time.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
@@ -4,6 +4,8 @@ from pydantic import EmailStr
 from sqlalchemy import Column, DateTime, func
 from sqlmodel import Field, SQLModel
 
+from src.db.models.timestamp import get_utc_now
+
 
 class User(SQLModel, table=True):
     __tablename__ = "users"
@@ -24,7 +26,7 @@ class User(SQLModel, table=True):
         sa_column=Column(
             DateTime,
             server_default=func.now(),
-            onupdate=func.now(),
+            onupdate=get_utc_now,
             nullable=False,
         ),
     )
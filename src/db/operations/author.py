@@ -1,20 +1,32 @@
+from typing import Sequence
+
+from sqlalchemy import RowMapping
+
 from src.db.engine import db_dependency
-from src.db.execution import execute_all_query, execute_statements, fetch_all, fetch_one_or_none
+from src.db.execution import execute_all_query, execute_statements, fetch_one_or_none, fetch_rows
 from src.db.models.author import Author
+from src.db.operations.bulk import insert_rows_on_db
 from src.db.queries.author import (
     delete_author_from_id_stmt,
     get_author_count_stmt,
     get_author_stmt,
+    get_author_version_stmt,
+    get_authors_stmt_with_limit_and_cursor,
     get_authors_stmt_with_limit_and_offset,
+    get_insert_authors_stmt,
 )
 from src.db.queries.book import (
     delete_books_from_author_id_stmt,
 )
 from src.exceptions.app import NotFoundException, SqlException
-from src.helper.pagination import pagination_details
+from src.helper.pagination import Cursor, cursor_details, pagination_details
 from src.models.author import AuthorIn, AuthorOut, AuthorsList
+from src.models.bulk import BulkCreateItem
 from src.models.http_response_code import HTTPResponseCode
 
+# Tables the outputs are read from, their changes are the validators of the GET routes
+AUTHOR_TABLES = [Author.__tablename__]
+
 
 def create_author_on_db(db_session: db_dependency, author_in: AuthorIn) -> AuthorOut:
     """Create a new author in the databases
@@ -29,7 +41,22 @@ def create_author_on_db(db_session: db_dependency, author_in: AuthorIn) -> Autho
     new_author = Author(**author_in.model_dump())
     # Refresh the object after commit to get the primary key
     execute_all_query(db_session, [new_author], is_commit=True, is_refresh_after_commit=True)
-    return AuthorOut(**new_author.model_dump())
+    return AuthorOut.trusted(**new_author.model_dump())
+
+
+def create_authors_on_db(
+    db_session: db_dependency, authors_in: Sequence[tuple[int, AuthorIn]]
+) -> list[BulkCreateItem]:
+    """Create a chunk of the authors of a bulk request in one transaction.
+
+    Args:
+        db_session (db_dependency): Database session.
+        authors_in (Sequence[tuple[int, AuthorIn]]): Lines of the request body and author details.
+
+    Returns:
+        list[BulkCreateItem]: ID or reason of the failure of each author.
+    """
+    return insert_rows_on_db(db_session, get_insert_authors_stmt(), authors_in)
 
 
 def get_author_from_id(db_session: db_dependency, author_id: int) -> Author:
@@ -68,11 +95,30 @@ def get_author_out_from_db(db_session: db_dependency, author_id: int) -> AuthorO
         AuthorOut: Author details.
     """
     db_author = get_author_from_id(db_session, author_id)
-    return AuthorOut(**db_author.model_dump())
+    return AuthorOut.trusted(**db_author.model_dump())
+
+
+def get_author_version_from_db(db_session: db_dependency, author_id: int) -> RowMapping | None:
+    """Get the id and update time of an author, the version of its output.
+
+    Args:
+        db_session (db_dependency): Database session.
+        author_id (int): Author id.
+
+    Returns:
+        RowMapping | None: Id and update time, None if not found.
+    """
+    rows = fetch_rows(db_session, get_author_version_stmt(author_id))
+    return rows[0] if rows else None
 
 
 def get_authors_with_offset_and_limit(
-    db_session: db_dependency, *, offset: int, limit: int
+    db_session: db_dependency,
+    *,
+    offset: int,
+    limit: int,
+    cursor: Cursor | None = None,
+    include_total: bool = True,
 ) -> AuthorsList:
     """Get all authors with pagination.
 
@@ -80,39 +126,53 @@ def get_authors_with_offset_and_limit(
         db_session (db_dependency): Database session.
         offset (int): Offset value.
         limit (int): Limit value.
+        cursor (Cursor | None, optional): Cursor of the page, the offset is ignored when it
+                                          is given. Defaults to None.
+        include_total (bool, optional): Whether to count the items. Defaults to True.
 
     Returns:
         AuthorsList: List of authors.
     """
-    authors_count_stmt = get_author_count_stmt()
-    authors_count = fetch_one_or_none(db_session, authors_count_stmt)  # type: ignore
-
-    # There is nothing to fetch if the authors_count is None
-    if authors_count is None:
-        return AuthorsList(
-            authors=[],
-            number_of_authors=0,
-            number_of_pages=0,
-            current_page=0,
-            next_page=None,
-            previous_page=None,
+    # The count is a lookup in the counts maintained by triggers, skipped without include_total
+    authors_count: int | None = None
+    if include_total:
+        authors_count_stmt = get_author_count_stmt()
+        authors_count = fetch_one_or_none(db_session, authors_count_stmt)  # type: ignore
+
+    # One row more than the limit tells whether there is a next page
+    if cursor is None:
+        authors_stmt = get_authors_stmt_with_limit_and_offset(offset=offset, limit=limit + 1)
+    else:
+        authors_stmt = get_authors_stmt_with_limit_and_cursor(
+            cursor_id=cursor.id, is_previous=cursor.is_previous, limit=limit + 1
         )
-
-    authors_stmt = get_authors_stmt_with_limit_and_offset(offset=offset, limit=limit)
-    authors = [AuthorOut(**author.model_dump()) for author in fetch_all(db_session, authors_stmt)]
+    rows, next_cursor, previous_cursor = cursor_details(
+        fetch_rows(db_session, authors_stmt),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        get_id=lambda row: row["id"],
+    )
+    authors = [AuthorOut.trusted(**row) for row in rows]
 
     # Calculate the number of pages, current page, next page, and previous page
     number_of_pages, current_page, next_page, previous_page = pagination_details(
-        offset=offset, limit=limit, counts=authors_count
+        offset=offset,
+        limit=limit,
+        counts=authors_count,
+        cursor=cursor,
+        has_next=next_cursor is not None,
     )
 
-    return AuthorsList(
+    return AuthorsList.trusted(
         authors=authors,
         number_of_authors=authors_count,
         number_of_pages=number_of_pages,
         current_page=current_page,
         next_page=next_page,
         previous_page=previous_page,
+        next_cursor=next_cursor,
+        previous_cursor=previous_cursor,
     )
 
 
@@ -138,7 +198,7 @@ def update_author_on_db(
     for field, value in author_in.model_dump().items():
         setattr(db_author, field, value)
 
-    author_out = AuthorOut(**db_author.model_dump())
+    author_out = AuthorOut.trusted(**db_author.model_dump())
     # We don't need to refresh the object for the update operation, so we can avoid
     # making a select request to the database.
     execute_all_query(
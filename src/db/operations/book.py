@@ -1,17 +1,29 @@
+from typing import Sequence
+
+from sqlalchemy import RowMapping
+
 from src.db.engine import db_dependency
-from src.db.execution import execute_all_query, execute_statements, fetch_all, fetch_one_or_none
+from src.db.execution import execute_all_query, execute_statements, fetch_one_or_none, fetch_rows
 from src.db.models.book import Book
+from src.db.operations.bulk import insert_rows_on_db
 from src.db.queries.book import (
     delete_book_from_id_stmt,
     get_book_count_stmt,
     get_book_from_id_stmt,
+    get_book_version_stmt,
+    get_books_stmt_with_limit_and_cursor,
     get_books_stmt_with_limit_and_offset,
+    get_insert_books_stmt,
 )
 from src.exceptions.app import NotFoundException, SqlException
-from src.helper.pagination import pagination_details
+from src.helper.pagination import Cursor, cursor_details, pagination_details
 from src.models.book import BookIn, BookOut, BooksList
+from src.models.bulk import BulkCreateItem
 from src.models.http_response_code import HTTPResponseCode
 
+# Tables the outputs are read from, their changes are the validators of the GET routes
+BOOK_TABLES = [Book.__tablename__]
+
 
 def create_book_on_db(db_session: db_dependency, book_in: BookIn) -> BookOut:
     """Create a new book in the databases
@@ -26,7 +38,22 @@ def create_book_on_db(db_session: db_dependency, book_in: BookIn) -> BookOut:
     new_book = Book(**book_in.model_dump())
     # Refresh the object after commit to get the primary key
     execute_all_query(db_session, [new_book], is_commit=True, is_refresh_after_commit=True)
-    return BookOut(**new_book.model_dump())
+    return BookOut.trusted(**new_book.model_dump())
+
+
+def create_books_on_db(
+    db_session: db_dependency, books_in: Sequence[tuple[int, BookIn]]
+) -> list[BulkCreateItem]:
+    """Create a chunk of the books of a bulk request in one transaction.
+
+    Args:
+        db_session (db_dependency): Database session.
+        books_in (Sequence[tuple[int, BookIn]]): Lines of the request body and book details.
+
+    Returns:
+        list[BulkCreateItem]: ID or reason of the failure of each book.
+    """
+    return insert_rows_on_db(db_session, get_insert_books_stmt(), books_in)
 
 
 def get_book_from_id(db_session: db_dependency, book_id: int) -> Book:
@@ -65,11 +92,30 @@ def get_book_out_from_db(db_session: db_dependency, book_id: int) -> BookOut:
         BookOut: Book details.
     """
     db_book = get_book_from_id(db_session, book_id)
-    return BookOut(**db_book.model_dump())
+    return BookOut.trusted(**db_book.model_dump())
+
+
+def get_book_version_from_db(db_session: db_dependency, book_id: int) -> RowMapping | None:
+    """Get the id and update time of a book, the version of its output.
+
+    Args:
+        db_session (db_dependency): Database session.
+        book_id (int): Book id.
+
+    Returns:
+        RowMapping | None: Id and update time, None if not found.
+    """
+    rows = fetch_rows(db_session, get_book_version_stmt(book_id))
+    return rows[0] if rows else None
 
 
 def get_books_with_offset_and_limit(
-    db_session: db_dependency, *, offset: int, limit: int
+    db_session: db_dependency,
+    *,
+    offset: int,
+    limit: int,
+    cursor: Cursor | None = None,
+    include_total: bool = True,
 ) -> BooksList:
     """Get all books with pagination.
 
@@ -77,39 +123,53 @@ def get_books_with_offset_and_limit(
         db_session (db_dependency): Database session.
         offset (int): Offset value.
         limit (int): Limit value.
+        cursor (Cursor | None, optional): Cursor of the page, the offset is ignored when it
+                                          is given. Defaults to None.
+        include_total (bool, optional): Whether to count the items. Defaults to True.
 
     Returns:
         BooksList: List of books.
     """
-    books_count_stmt = get_book_count_stmt()
-    books_count = fetch_one_or_none(db_session, books_count_stmt)  # type: ignore
-
-    # There is nothing to fetch if the books_count is None
-    if books_count is None:
-        return BooksList(
-            books=[],
-            number_of_books=0,
-            number_of_pages=0,
-            current_page=0,
-            next_page=None,
-            previous_page=None,
+    # The count is a lookup in the counts maintained by triggers, skipped without include_total
+    books_count: int | None = None
+    if include_total:
+        books_count_stmt = get_book_count_stmt()
+        books_count = fetch_one_or_none(db_session, books_count_stmt)  # type: ignore
+
+    # One row more than the limit tells whether there is a next page
+    if cursor is None:
+        books_stmt = get_books_stmt_with_limit_and_offset(offset=offset, limit=limit + 1)
+    else:
+        books_stmt = get_books_stmt_with_limit_and_cursor(
+            cursor_id=cursor.id, is_previous=cursor.is_previous, limit=limit + 1
         )
-
-    books_stmt = get_books_stmt_with_limit_and_offset(offset=offset, limit=limit)
-    books = [BookOut(**book.model_dump()) for book in fetch_all(db_session, books_stmt)]
+    rows, next_cursor, previous_cursor = cursor_details(
+        fetch_rows(db_session, books_stmt),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        get_id=lambda row: row["id"],
+    )
+    books = [BookOut.trusted(**row) for row in rows]
 
     # Calculate the number of pages, current page, next page, and previous page
     number_of_pages, current_page, next_page, previous_page = pagination_details(
-        offset=offset, limit=limit, counts=books_count
+        offset=offset,
+        limit=limit,
+        counts=books_count,
+        cursor=cursor,
+        has_next=next_cursor is not None,
     )
 
-    return BooksList(
+    return BooksList.trusted(
         books=books,
         number_of_books=books_count,
         number_of_pages=number_of_pages,
         current_page=current_page,
         next_page=next_page,
         previous_page=previous_page,
+        next_cursor=next_cursor,
+        previous_cursor=previous_cursor,
     )
 
 
@@ -133,7 +193,7 @@ def update_book_on_db(db_session: db_dependency, book_id: int, book_in: BookIn)
     for field, value in book_in.model_dump().items():
         setattr(db_book, field, value)
 
-    book_out = BookOut(**db_book.model_dump())
+    book_out = BookOut.trusted(**db_book.model_dump())
     # We don't need to refresh the object for the update operation, so we can avoid
     # making a select request to the database.
     execute_all_query(
@@ -0,0 +1,69 @@
+from typing import Any, Sequence
+
+from pydantic import BaseModel
+from sqlalchemy.sql.dml import ReturningInsert
+
+from src.db.engine import db_dependency
+from src.db.execution import execute_bulk_insert
+from src.exceptions.app import BadRequestException
+from src.models.bulk import BulkCreateItem
+from src.models.http_response_code import HTTPResponseCode
+
+# A row of a bulk request: its line in the request body and its validated input model
+BulkRow = tuple[int, BaseModel]
+
+
+def insert_rows_on_db(
+    db_session: db_dependency,
+    stmt: ReturningInsert[Any],
+    rows: Sequence[BulkRow],
+) -> list[BulkCreateItem]:
+    """Insert a chunk of rows of a bulk request in one statement and one transaction.
+
+    The statement returns the ID and the columns of a unique key of the table, the order of
+    the returned rows is not the order of the inserted ones, so the IDs are matched to the
+    rows by their unique key.
+
+    When a row breaks a constraint (a duplicate key, an unknown foreign key), nothing of the
+    chunk is inserted: the chunk is split in two halves inserted on their own, until the
+    failing rows are alone. A chunk with k failing rows takes about k * log2(len(rows))
+    transactions instead of one.
+
+    Args:
+        db_session (db_dependency): Database session.
+        stmt (ReturningInsert[Any]): Insert statement of the table, returning the ID and the
+                                     columns of a unique key.
+        rows (Sequence[BulkRow]): Lines and input models of the rows.
+
+    Returns:
+        list[BulkCreateItem]: Result of each row, in the order of the rows.
+    """
+    if not rows:
+        return []
+
+    values = [row_in.model_dump() for _, row_in in rows]
+    try:
+        returned_rows = execute_bulk_insert(db_session, stmt, values)
+    except BadRequestException as exc:
+        if len(rows) == 1:
+            return [
+                BulkCreateItem.trusted(
+                    line=rows[0][0], status_code=exc.status_code, message=exc.message, id=None
+                )
+            ]
+        middle = len(rows) // 2
+        return insert_rows_on_db(db_session, stmt, rows[:middle]) + insert_rows_on_db(
+            db_session, stmt, rows[middle:]
+        )
+
+    key_columns = [column for column in returned_rows[0] if column != "id"]
+    ids = {tuple(row[column] for column in key_columns): row["id"] for row in returned_rows}
+    return [
+        BulkCreateItem.trusted(
+            line=line,
+            status_code=HTTPResponseCode.CREATED,
+            message=None,
+            id=ids[tuple(row_values[column] for column in key_columns)],
+        )
+        for (line, _), row_values in zip(rows, values, strict=True)
+    ]
@@ -0,0 +1,98 @@
+from typing import Any, Callable, Iterator, Sequence
+
+from sqlalchemy import RowMapping
+from sqlmodel.sql._expression_select_cls import Select
+
+from src.db.engine import db_dependency
+from src.db.execution import iter_rows, iter_rows_by_id
+from src.db.queries.author import (
+    AUTHOR_OUT_COLUMNS,
+    get_authors_export_stmt,
+    get_authors_stmt_with_limit_and_cursor,
+)
+from src.db.queries.book import (
+    BOOK_OUT_COLUMNS,
+    get_books_export_stmt,
+    get_books_stmt_with_limit_and_cursor,
+)
+from src.db.queries.reservation import (
+    RESERVATION_OUT_COLUMNS,
+    get_reservations_export_stmt,
+    get_reservations_stmt_with_limit_and_cursor,
+)
+from src.db.queries.stock import (
+    STOCK_OUT_COLUMNS,
+    get_stocks_export_stmt,
+    get_stocks_stmt_with_limit_and_cursor,
+)
+from src.db.queries.user import (
+    USER_OUT_COLUMNS,
+    get_users_export_stmt,
+    get_users_stmt_with_limit_and_cursor,
+)
+from src.models.export import ExportEntity
+
+# Columns of each table, the same as the ones of the list endpoints
+EXPORT_COLUMNS: dict[ExportEntity, tuple[Any, ...]] = {
+    ExportEntity.AUTHORS: AUTHOR_OUT_COLUMNS,
+    ExportEntity.BOOKS: BOOK_OUT_COLUMNS,
+    ExportEntity.USERS: USER_OUT_COLUMNS,
+    ExportEntity.STOCKS: STOCK_OUT_COLUMNS,
+    ExportEntity.RESERVATIONS: RESERVATION_OUT_COLUMNS,
+}
+
+# Select of all the rows of each table, and of a batch of rows after a cursor
+EXPORT_STATEMENTS: dict[
+    ExportEntity, tuple[Callable[[], Select[Any]], Callable[..., Select[Any]]]
+] = {
+    ExportEntity.AUTHORS: (get_authors_export_stmt, get_authors_stmt_with_limit_and_cursor),
+    ExportEntity.BOOKS: (get_books_export_stmt, get_books_stmt_with_limit_and_cursor),
+    ExportEntity.USERS: (get_users_export_stmt, get_users_stmt_with_limit_and_cursor),
+    ExportEntity.STOCKS: (get_stocks_export_stmt, get_stocks_stmt_with_limit_and_cursor),
+    ExportEntity.RESERVATIONS: (
+        get_reservations_export_stmt,
+        get_reservations_stmt_with_limit_and_cursor,
+    ),
+}
+
+
+def get_export_column_names(entity: ExportEntity) -> list[str]:
+    """Get the names of the exported columns of a table.
+
+    Args:
+        entity (ExportEntity): Exported table.
+
+    Returns:
+        list[str]: Column names, in the order of the rows.
+    """
+    return [column.key for column in EXPORT_COLUMNS[entity]]
+
+
+def export_rows_from_db(
+    db_session: db_dependency, entity: ExportEntity, *, snapshot: bool, batch_size: int
+) -> Iterator[Sequence[RowMapping]]:
+    """Iterate over all the rows of a table, one batch at a time, in id order.
+
+    A snapshot export reads the table with a single statement through a server-side cursor:
+    the rows do not tear across concurrent writes, but a connection is held for the whole
+    export. Otherwise each batch is a select after the id of the previous one, the
+    connection is only held while reading a batch.
+
+    Args:
+        db_session (db_dependency): Database session.
+        entity (ExportEntity): Exported table.
+        snapshot (bool): Whether the rows must come from a single snapshot of the database.
+        batch_size (int): Number of rows of each batch.
+
+    Returns:
+        Iterator[Sequence[RowMapping]]: Batches of rows.
+    """
+    get_export_stmt, get_batch_stmt = EXPORT_STATEMENTS[entity]
+    if snapshot:
+        return iter_rows(db_session, get_export_stmt(), batch_size=batch_size)
+
+    return iter_rows_by_id(
+        db_session,
+        lambda cursor_id: get_batch_stmt(cursor_id=cursor_id, is_previous=False, limit=batch_size),
+        batch_size=batch_size,
+    )
@@ -0,0 +1,14 @@
+from src.db.engine import db_dependency
+from src.db.reference_data import reference_data
+
+
+def refresh_reference_data_on_db(db_session: db_dependency) -> dict[str, dict[int, str]]:
+    """Reload the lookup tables from the database, without restarting the application.
+
+    Args:
+        db_session (db_dependency): Database session.
+
+    Returns:
+        dict[str, dict[int, str]]: Names of the rows by ID of each reloaded table.
+    """
+    return {name: table.names for name, table in reference_data.load(db_session).items()}
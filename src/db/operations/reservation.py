@@ -1,29 +1,56 @@
 import logging
-from contextlib import contextmanager
 from datetime import datetime, timedelta
-from functools import lru_cache
-
-from src.db.engine import db_dependency, get_db_session
-from src.db.execution import execute_all_query, execute_statements, fetch_all, fetch_one_or_none
+from typing import NoReturn
+
+from src.db.engine import db_dependency
+from src.db.execution import (
+    commit_session,
+    execute_all_query,
+    execute_returning,
+    execute_statements,
+    fetch_all,
+    fetch_one_or_none,
+    fetch_rows,
+)
 from src.db.models.reservation import Reservation
 from src.db.queries.reservation import (
+    get_insert_reservation_stmt,
+    get_insert_reservations_stmt,
+    get_non_returned_books_from_user_id_and_book_ids_stmt,
     get_non_returned_books_from_user_id_stmt,
     get_reservation_books_from_id_stmt,
     get_reservation_from_id_stmt,
     get_reservations_count_stmt,
+    get_reservations_from_ids_stmt,
+    get_reservations_stmt_with_limit_and_cursor,
     get_reservations_stmt_with_limit_and_offset,
+    get_return_reservations_stmt,
 )
-from src.db.queries.reservation_status import get_reservation_status_stmt
 from src.db.queries.stock import (
+    get_decrement_available_stocks_stmt,
     get_decrement_stock_quantity_stmt,
+    get_increment_returned_stocks_stmt,
     get_increment_stock_quantity_stmt,
     get_stock_book_stmt,
+    get_stocks_from_book_ids_stmt,
 )
 from src.db.queries.user import get_user_from_id_stmt
+from src.db.reference_data import get_reservation_statuses
 from src.exceptions.app import NotFoundException, ReservationException
-from src.helper.pagination import pagination_details
+from src.helper.pagination import Cursor, cursor_details, pagination_details
 from src.models.http_response_code import HTTPResponseCode
-from src.models.reservation import ReservationIn, ReservationOut, ReservationsList
+from src.models.reservation import (
+    ReservationBatchIn,
+    ReservationBatchItem,
+    ReservationBatchOut,
+    ReservationFilters,
+    ReservationIn,
+    ReservationOut,
+    ReservationReturnItem,
+    ReservationReturnsIn,
+    ReservationReturnsOut,
+    ReservationsList,
+)
 from src.models.reservation_status import ReservationStatus
 
 logger = logging.getLogger("app")
@@ -34,6 +61,10 @@ def create_reservation_on_db(
 ) -> ReservationOut:
     """Create a reservation in the databases
 
+    The reservation is two conditional statements in one transaction: the stock is only
+    decremented for an available book and the reservation only inserted for an existing user
+    without a non returned loan of the book. The reasons of a failure are only read then.
+
     Args:
         db_session (db_dependency): Database session.
         reservation_in (ReservationIn): Reservation details
@@ -41,44 +72,201 @@ def create_reservation_on_db(
     Returns:
         ReservationOut: Reservation details with ID
     """
-    verify_user_and_reservation(db_session, reservation_in)
-    verify_stock_quantity_for_reservation(db_session, reservation_in.book_id)
+    reservation_statuses = get_reservation_statuses(db_session)
+    borrowed_at = datetime.now()
+    due_date = borrowed_at + timedelta(days=15)
 
-    # Get reservation status
-    reservation_status = {value: key for key, value in get_reservation_status_dict().items()}
+    decrement_stock_quantity_stmt = get_decrement_stock_quantity_stmt(reservation_in.book_id)
+    if not execute_returning(db_session, decrement_stock_quantity_stmt, is_commit=False):
+        raise_reservation_exception(db_session, reservation_in)
 
-    new_reservation = Reservation(
-        book_id=reservation_in.book_id,
+    insert_reservation_stmt = get_insert_reservation_stmt(
         user_id=reservation_in.user_id,
-        status_id=reservation_status[ReservationStatus.CONFIRMED.value],
-        due_date=datetime.now() + timedelta(days=15),
-        borrowed_at=datetime.now(),
-        returned_at=None,
+        book_id=reservation_in.book_id,
+        status_id=reservation_statuses.get_id(ReservationStatus.CONFIRMED),
+        borrowed_at=borrowed_at,
+        due_date=due_date,
     )
-    # Decrement stock quantity by one and commit it the execute_all_query
-    decrement_stock_quantity_stmt = get_decrement_stock_quantity_stmt(reservation_in.book_id)
-    execute_statements(db_session, [decrement_stock_quantity_stmt], is_commit=False)
+    reservations = execute_returning(db_session, insert_reservation_stmt, is_commit=False)
+    if not reservations:
+        raise_reservation_exception(db_session, reservation_in)
+    commit_session(db_session)
 
-    # Refresh the object after commit to get the primary key
-    execute_all_query(
-        db_session,
-        [
-            new_reservation,
-        ],
-        is_commit=True,
-        is_refresh_after_commit=True,
-    )
-    return ReservationOut(
-        id=new_reservation.id,  # type: ignore
+    return ReservationOut.trusted(
+        id=reservations[0]["id"],
         book_id=reservation_in.book_id,
         user_id=reservation_in.user_id,
         status=ReservationStatus.CONFIRMED.value,
-        due_date=datetime.now() + timedelta(days=15),
-        borrowed_at=datetime.now(),
+        due_date=due_date,
+        borrowed_at=borrowed_at,
         return_date=None,
     )
 
 
+def raise_reservation_exception(
+    db_session: db_dependency, reservation_in: ReservationIn
+) -> NoReturn:
+    """Roll back a reservation which could not be made and raise the reason.
+
+    Args:
+        db_session (db_dependency): Database session.
+        reservation_in (ReservationIn): Reservation details
+
+    Raises:
+        NotFoundException: Item not found in the databases
+        ReservationException: Not valid request to reserve
+    """
+    db_session.rollback()
+    verify_user_and_reservation(db_session, reservation_in)
+    verify_stock_quantity_for_reservation(db_session, reservation_in.book_id)
+    # The loan or the stock changed since, with a concurrent request
+    raise ReservationException(
+        status_code=HTTPResponseCode.BAD_REQUEST,
+        message=f"book_id={reservation_in.book_id} not available for reservations",
+    )
+
+
+def create_reservations_on_db(  # noqa: PLR0915
+    db_session: db_dependency, batch_in: ReservationBatchIn
+) -> ReservationBatchOut:
+    """Create the reservations of several books for a user in the databases
+
+    The user is read once. The stocks of the available books which the user has not borrowed
+    yet are decremented by one statement and their reservations inserted by another, in one
+    transaction. The reasons of the failures of the other books are only read then.
+
+    Args:
+        db_session (db_dependency): Database session.
+        batch_in (ReservationBatchIn): User and books to reserve
+
+    Raises:
+        NotFoundException: Raised when the user id is not found in the database.
+
+    Returns:
+        ReservationBatchOut: Result of the reservation of each book
+    """
+    user_id = batch_in.user_id
+    user_stmt = get_user_from_id_stmt(user_id)
+    if fetch_one_or_none(db_session, user_stmt) is None:
+        raise NotFoundException(
+            status_code=HTTPResponseCode.NOT_FOUND,
+            message=f"{user_id=} not found in the database",
+        )
+
+    reservation_statuses = get_reservation_statuses(db_session)
+    borrowed_at = datetime.now()
+    due_date = borrowed_at + timedelta(days=15)
+    # A book given twice is only reserved once
+    book_ids = list(dict.fromkeys(batch_in.book_ids))
+
+    decrement_stocks_stmt = get_decrement_available_stocks_stmt(user_id=user_id, book_ids=book_ids)
+    available_book_ids = {
+        stock["book_id"]
+        for stock in execute_returning(db_session, decrement_stocks_stmt, is_commit=False)
+    }
+    reservation_ids: dict[int, int] = {}
+    if available_book_ids:
+        new_reservations = [
+            {
+                "book_id": book_id,
+                "user_id": user_id,
+                "status_id": reservation_statuses.get_id(ReservationStatus.CONFIRMED),
+                "borrowed_at": borrowed_at,
+                "due_date": due_date,
+            }
+            for book_id in book_ids
+            if book_id in available_book_ids
+        ]
+        reservations = execute_returning(
+            db_session, get_insert_reservations_stmt(), new_reservations, is_commit=False
+        )
+        reservation_ids = {
+            reservation["book_id"]: reservation["id"] for reservation in reservations
+        }
+    commit_session(db_session)
+
+    failures = get_reservation_failures(
+        db_session, user_id, [book_id for book_id in book_ids if book_id not in reservation_ids]
+    )
+    items: list[ReservationBatchItem] = []
+    for index, book_id in enumerate(batch_in.book_ids):
+        message: str | None = None
+        reservation_out: ReservationOut | None = None
+        if book_id in batch_in.book_ids[:index]:
+            status_code, message = HTTPResponseCode.BAD_REQUEST, f"{book_id=} given more than once"
+        elif book_id in reservation_ids:
+            status_code = HTTPResponseCode.CREATED
+            reservation_out = ReservationOut.trusted(
+                id=reservation_ids[book_id],
+                book_id=book_id,
+                user_id=user_id,
+                status=ReservationStatus.CONFIRMED.value,
+                due_date=due_date,
+                borrowed_at=borrowed_at,
+                return_date=None,
+            )
+        else:
+            status_code, message = failures[book_id]
+        items.append(
+            ReservationBatchItem.trusted(
+                book_id=book_id,
+                status_code=status_code,
+                message=message,
+                reservation=reservation_out,
+            )
+        )
+
+    return ReservationBatchOut.trusted(
+        user_id=user_id, number_of_reservation=len(reservation_ids), reservations=items
+    )
+
+
+def get_reservation_failures(  # noqa: PLR0915
+    db_session: db_dependency, user_id: int, book_ids: list[int]
+) -> dict[int, tuple[int, str]]:
+    """Get the reasons why books of a batch could not be reserved by the user.
+
+    Args:
+        db_session (db_dependency): Database session.
+        user_id (int): User ID
+        book_ids (list[int]): Book IDs which could not be reserved
+
+    Returns:
+        dict[int, tuple[int, str]]: Status code and message of each book
+    """
+    if not book_ids:
+        return {}
+
+    non_returned_books_stmt = get_non_returned_books_from_user_id_and_book_ids_stmt(
+        user_id=user_id, book_ids=book_ids
+    )
+    due_dates = {
+        reservation.book_id: reservation.due_date
+        for reservation in fetch_all(db_session, non_returned_books_stmt)
+    }
+    stocks_stmt = get_stocks_from_book_ids_stmt(book_ids)
+    stock_book_ids = {stock.book_id for stock in fetch_all(db_session, stocks_stmt)}
+
+    failures: dict[int, tuple[int, str]] = {}
+    for book_id in book_ids:
+        if book_id in due_dates:
+            failures[book_id] = (
+                HTTPResponseCode.BAD_REQUEST,
+                f"Book already borrowed {book_id=} and due date {due_dates[book_id]}",
+            )
+        elif book_id not in stock_book_ids:
+            failures[book_id] = (
+                HTTPResponseCode.NOT_FOUND,
+                f"{book_id=} not found in the database",
+            )
+        else:
+            failures[book_id] = (
+                HTTPResponseCode.BAD_REQUEST,
+                f"{book_id=} not available for reservations",
+            )
+    return failures
+
+
 def verify_user_and_reservation(db_session: db_dependency, reservation_in: ReservationIn) -> None:
     """Method is used to verify user and reservation logic.
 
@@ -176,22 +364,27 @@ def get_reservation_out_from_db(db_session: db_dependency, reservation_id: int)
         ReservationOut: Reservation details.
     """
     db_reservation = get_reservations_from_user_id(db_session, reservation_id)
-    # Get reservation status
-    reservation_status = get_reservation_status_dict()
+    reservation_statuses = get_reservation_statuses(db_session)
 
-    return ReservationOut(
+    return ReservationOut.trusted(
         id=db_reservation.id,  # type: ignore
         book_id=db_reservation.book_id,
         user_id=db_reservation.user_id,
-        status=reservation_status[db_reservation.status_id],
+        status=reservation_statuses.get_name(db_reservation.status_id),
         due_date=db_reservation.due_date,
         borrowed_at=db_reservation.borrowed_at,
         return_date=db_reservation.returned_at,
     )
 
 
-def get_reservations_with_offset_and_limit(
-    db_session: db_dependency, *, offset: int, limit: int
+def get_reservations_with_offset_and_limit(  # noqa: PLR0913
+    db_session: db_dependency,
+    *,
+    offset: int,
+    limit: int,
+    cursor: Cursor | None = None,
+    include_total: bool = True,
+    filters: ReservationFilters | None = None,
 ) -> ReservationsList:
     """Get all the reservations with pagination.
 
@@ -199,53 +392,59 @@ def get_reservations_with_offset_and_limit(
         db_session (db_dependency): Database session.
         offset (int): Offset value.
         limit (int): Limit value.
+        cursor (Cursor | None, optional): Cursor of the page, the offset is ignored when it
+                                          is given. Defaults to None.
+        include_total (bool, optional): Whether to count the items. Defaults to True.
+        filters (ReservationFilters | None, optional): Filters of the reservations.
+                                                       Defaults to None.
 
     Returns:
         ReservationsList: List of reservations.
     """
-    reservations_count_stmt = get_reservations_count_stmt()
-    reservation_count = fetch_one_or_none(db_session, reservations_count_stmt)  # type: ignore
-
-    # There is nothing to fetch if the reservation_count is None
-    if reservation_count is None:
-        return ReservationsList(
-            reservations=[],
-            number_of_reservation=0,
-            number_of_pages=0,
-            current_page=0,
-            next_page=None,
-            previous_page=None,
+    # The count is a lookup in the counts maintained by triggers, skipped without include_total
+    # With filters, the matching reservations are counted through the indexes
+    reservation_count: int | None = None
+    if include_total:
+        reservations_count_stmt = get_reservations_count_stmt(filters)
+        reservation_count = fetch_one_or_none(db_session, reservations_count_stmt)  # type: ignore
+
+    # The status name is joined by the statement, the rows match the ReservationOut fields
+    # One row more than the limit tells whether there is a next page
+    if cursor is None:
+        reservations_stmt = get_reservations_stmt_with_limit_and_offset(
+            offset=offset, limit=limit + 1, filters=filters
         )
-
-    # Get reservation status
-    reservation_status = get_reservation_status_dict()
-
-    reservations_stmt = get_reservations_stmt_with_limit_and_offset(offset=offset, limit=limit)
-    reservations: list[ReservationOut] = []
-    for reservation in fetch_all(db_session, reservations_stmt):
-        res_out = ReservationOut(
-            id=reservation.id,  # type: ignore
-            book_id=reservation.book_id,
-            user_id=reservation.user_id,
-            status=reservation_status[reservation.status_id],
-            due_date=reservation.due_date,
-            borrowed_at=reservation.borrowed_at,
-            return_date=reservation.returned_at,
+    else:
+        reservations_stmt = get_reservations_stmt_with_limit_and_cursor(
+            cursor_id=cursor.id, is_previous=cursor.is_previous, limit=limit + 1, filters=filters
         )
-        reservations.append(res_out)
+    rows, next_cursor, previous_cursor = cursor_details(
+        fetch_rows(db_session, reservations_stmt),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        get_id=lambda row: row["id"],
+    )
+    reservations = [ReservationOut.trusted(**row) for row in rows]
 
     # Calculate the number of pages, current page, next page, and previous page
     number_of_pages, current_page, next_page, previous_page = pagination_details(
-        offset=offset, limit=limit, counts=reservation_count
+        offset=offset,
+        limit=limit,
+        counts=reservation_count,
+        cursor=cursor,
+        has_next=next_cursor is not None,
     )
 
-    return ReservationsList(
+    return ReservationsList.trusted(
         reservations=reservations,
         number_of_reservation=reservation_count,
         number_of_pages=number_of_pages,
         current_page=current_page,
         next_page=next_page,
         previous_page=previous_page,
+        next_cursor=next_cursor,
+        previous_cursor=previous_cursor,
     )
 
 
@@ -277,12 +476,11 @@ def update_reservation_on_db(  # noqa: PLR0915
         )
 
     reservation = get_reservations_from_user_id(db_session, reservation_id)
-    # Get reservation status
-    reservation_status = {value: key for key, value in get_reservation_status_dict().items()}
+    reservation_statuses = get_reservation_statuses(db_session)
 
     # Update db with return date and status
     reservation.returned_at = datetime.now()
-    reservation.status_id = reservation_status[ReservationStatus.RETURNED.value]
+    reservation.status_id = reservation_statuses.get_id(ReservationStatus.RETURNED)
 
     # Increase stock after return and commit it below in the execute_all_query
     increment_stock_quantity_stmt = get_increment_stock_quantity_stmt(reservation_in.book_id)
@@ -292,7 +490,7 @@ def update_reservation_on_db(  # noqa: PLR0915
     execute_all_query(
         db_session, [reservation, stock], is_commit=True, is_refresh_after_commit=True
     )
-    return ReservationOut(
+    return ReservationOut.trusted(
         id=reservation.id,  # type: ignore
         book_id=reservation.book_id,
         user_id=reservation.user_id,
@@ -303,6 +501,100 @@ def update_reservation_on_db(  # noqa: PLR0915
     )
 
 
+def return_reservations_on_db(  # noqa: PLR0915
+    db_session: db_dependency, returns_in: ReservationReturnsIn
+) -> ReservationReturnsOut:
+    """Return several reservations in the databases
+
+    The reservations not returned yet are returned by one statement and the stocks of their
+    books incremented by another, in one transaction. The reasons of the failures of the
+    other reservations are only read then.
+
+    Args:
+        db_session (db_dependency): Database session.
+        returns_in (ReservationReturnsIn): Reservations to return
+
+    Returns:
+        ReservationReturnsOut: Result of the return of each reservation
+    """
+    reservation_statuses = get_reservation_statuses(db_session)
+    # A reservation given twice is only returned once
+    reservation_ids = list(dict.fromkeys(returns_in.reservation_ids))
+
+    return_reservations_stmt = get_return_reservations_stmt(
+        reservation_ids=reservation_ids,
+        status_id=reservation_statuses.get_id(ReservationStatus.RETURNED),
+        returned_at=datetime.now(),
+    )
+    returned = {
+        reservation["id"]: ReservationOut.trusted(
+            **reservation, status=ReservationStatus.RETURNED.value
+        )
+        for reservation in execute_returning(db_session, return_reservations_stmt, is_commit=False)
+    }
+    if returned:
+        increment_stocks_stmt = get_increment_returned_stocks_stmt(
+            book_ids=list({reservation.book_id for reservation in returned.values()}),
+            reservation_ids=list(returned),
+        )
+        execute_statements(db_session, [increment_stocks_stmt], is_commit=False)
+    commit_session(db_session)
+
+    failures = get_return_failures(
+        db_session,
+        [reservation_id for reservation_id in reservation_ids if reservation_id not in returned],
+    )
+    items: list[ReservationReturnItem] = []
+    for index, reservation_id in enumerate(returns_in.reservation_ids):
+        message: str | None = None
+        reservation_out: ReservationOut | None = None
+        if reservation_id in returns_in.reservation_ids[:index]:
+            status_code = HTTPResponseCode.BAD_REQUEST
+            message = f"{reservation_id=} given more than once"
+        elif reservation_id in returned:
+            status_code = HTTPResponseCode.OK
+            reservation_out = returned[reservation_id]
+        else:
+            status_code, message = failures[reservation_id]
+        items.append(
+            ReservationReturnItem.trusted(
+                reservation_id=reservation_id,
+                status_code=status_code,
+                message=message,
+                reservation=reservation_out,
+            )
+        )
+
+    return ReservationReturnsOut.trusted(number_of_reservation=len(returned), reservations=items)
+
+
+def get_return_failures(
+    db_session: db_dependency, reservation_ids: list[int]
+) -> dict[int, tuple[int, str]]:
+    """Get the reasons why reservations of a batch could not be returned.
+
+    Args:
+        db_session (db_dependency): Database session.
+        reservation_ids (list[int]): Reservation IDs which could not be returned
+
+    Returns:
+        dict[int, tuple[int, str]]: Status code and message of each reservation
+    """
+    if not reservation_ids:
+        return {}
+
+    reservations_stmt = get_reservations_from_ids_stmt(reservation_ids)
+    existing_ids = {reservation.id for reservation in fetch_all(db_session, reservations_stmt)}
+    return {
+        reservation_id: (
+            (HTTPResponseCode.BAD_REQUEST, f"Book already returned {reservation_id=}")
+            if reservation_id in existing_ids
+            else (HTTPResponseCode.NOT_FOUND, f"{reservation_id=} not found in the database")
+        )
+        for reservation_id in reservation_ids
+    }
+
+
 def verify_reservation(
     db_session: db_dependency, reservation_in: ReservationIn, reservation_id: int
 ) -> None:
@@ -332,21 +624,3 @@ def verify_reservation(
                 f"{user_id=}, {reservation_id=}"
             ),
         )
-
-
-@lru_cache
-def get_reservation_status_dict() -> dict[int, str]:
-    """Get reservation status as dict format.
-
-    Returns:
-        dict[int, str]: Return reservation status
-    """
-    reservation_status_stmt = get_reservation_status_stmt()
-
-    with contextmanager(get_db_session)() as session:
-        reservation_status: dict[int, str] = {
-            reservation.id: reservation.name  # type: ignore
-            for reservation in fetch_all(session, reservation_status_stmt)
-        }
-
-    return reservation_status
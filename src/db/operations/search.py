@@ -0,0 +1,100 @@
+import re
+
+from src.db.engine import db_dependency
+from src.db.execution import fetch_one_or_none, fetch_rows
+from src.db.models.author import Author
+from src.db.models.book import Book
+from src.db.queries.search import get_books_search_count_stmt, get_books_search_stmt
+from src.exceptions.app import BadRequestException, SqlException
+from src.helper.pagination import pagination_details
+from src.models.http_response_code import HTTPResponseCode
+from src.models.search import BookSearchOut, BooksSearchList
+
+# Tables the results are read from, their changes are the validators of the search route
+SEARCH_TABLES = [Author.__tablename__, Book.__tablename__]
+
+# Words of a search text, the other characters only separate them
+SEARCH_WORD_PATTERN = re.compile(r"\w+")
+
+
+def get_match_query(text: str) -> str:
+    """Get the FTS5 query of a search text.
+
+    Every word of the text must start a word of the book (title, category or author names):
+    the words are quoted, a user cannot write FTS5 syntax, and matched as prefixes.
+
+    Args:
+        text (str): Search text.
+
+    Raises:
+        BadRequestException: The text has no word.
+
+    Returns:
+        str: FTS5 query.
+    """
+    words = SEARCH_WORD_PATTERN.findall(text)
+    if not words:
+        raise BadRequestException(
+            status_code=HTTPResponseCode.BAD_REQUEST,
+            message=f"The search text {text!r} has no word",
+        )
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def search_books_on_db(
+    db_session: db_dependency,
+    *,
+    text: str,
+    offset: int,
+    limit: int,
+    include_total: bool = True,
+) -> BooksSearchList:
+    """Search the books by title, category and author names, the most relevant first.
+
+    Args:
+        db_session (db_dependency): Database session.
+        text (str): Search text.
+        offset (int): Offset value.
+        limit (int): Limit value.
+        include_total (bool, optional): Whether to count the matching books. Defaults to True.
+
+    Raises:
+        BadRequestException: The text has no word.
+        SqlException: The database is not SQLite (no full-text index).
+
+    Returns:
+        BooksSearchList: List of matching books.
+    """
+    if db_session.get_bind().dialect.name != "sqlite":
+        raise SqlException(
+            status_code=HTTPResponseCode.NOT_IMPLEMENTED,
+            message="The search is only available with a SQLite database",
+        )
+
+    match = get_match_query(text)
+    results_count: int | None = None
+    if include_total:
+        results_count_stmt = get_books_search_count_stmt(match)
+        results_count = fetch_one_or_none(db_session, results_count_stmt)  # type: ignore
+
+    # One row more than the limit tells whether there is a next page
+    rows = fetch_rows(
+        db_session, get_books_search_stmt(match=match, offset=offset, limit=limit + 1)
+    )
+    results = [BookSearchOut.trusted(**row) for row in rows[:limit]]
+
+    number_of_pages, current_page, next_page, previous_page = pagination_details(
+        offset=offset,
+        limit=limit,
+        counts=results_count,
+        has_next=len(rows) > limit,
+    )
+
+    return BooksSearchList.trusted(
+        results=results,
+        number_of_results=results_count,
+        number_of_pages=number_of_pages,
+        current_page=current_page,
+        next_page=next_page,
+        previous_page=previous_page,
+    )
@@ -1,17 +1,31 @@
+from typing import Sequence
+
+from sqlalchemy import RowMapping
+
 from src.db.engine import db_dependency
-from src.db.execution import execute_all_query, execute_statements, fetch_all, fetch_one_or_none
+from src.db.execution import execute_all_query, execute_statements, fetch_one_or_none, fetch_rows
+from src.db.models.book import Book
 from src.db.models.stock import Stock
+from src.db.operations.bulk import insert_rows_on_db
 from src.db.queries.stock import (
     get_add_new_stock_quantity_stmt,
-    get_stock_book_stmt,
+    get_insert_stocks_stmt,
+    get_stock_out_from_book_id_stmt,
+    get_stock_version_stmt,
     get_stocks_count_stmt,
+    get_stocks_stmt_with_limit_and_cursor,
     get_stocks_stmt_with_limit_and_offset,
 )
 from src.exceptions.app import NotFoundException
-from src.helper.pagination import pagination_details
+from src.helper.pagination import Cursor, cursor_details, pagination_details
+from src.models.bulk import BulkCreateItem
 from src.models.http_response_code import HTTPResponseCode
 from src.models.stock import StockIn, StockOut, StockQuantityAdd, StocksList
 
+# Tables the outputs are read from (with the title and category of the book), their changes
+# are the validators of the GET routes
+STOCK_TABLES = [Book.__tablename__, Stock.__tablename__]
+
 
 def create_stock_on_db(db_session: db_dependency, stock_in: StockIn) -> StockOut:
     """Create a new stock in the databases
@@ -24,68 +38,73 @@ def create_stock_on_db(db_session: db_dependency, stock_in: StockIn) -> StockOut
         StockOut: Stock details with ID
     """
     new_stock = Stock(**stock_in.model_dump())
-    # Refresh the object after commit to get the primary key
-    execute_all_query(db_session, [new_stock], is_commit=True, is_refresh_after_commit=True)
-    stock_data = new_stock.model_dump()
-    book_data = new_stock.book.model_dump()
-    return StockOut(
-        book_id=stock_data["book_id"],
-        stock_quantity=stock_data["stock_quantity"],
-        id=stock_data["id"],
-        title=book_data["title"],
-        category=book_data["category"],
-    )
+    execute_all_query(db_session, [new_stock], is_commit=True)
+    # The stock and its book are read back by one joined query instead of a refresh of the
+    # stock followed by a lazy load of its book
+    return get_stock_book_out_from_db(db_session, stock_in.book_id)
 
 
-def get_stock_book_from_id(db_session: db_dependency, book_id: int) -> Stock:
-    """Get a stock based on the book id.
+def create_stocks_on_db(
+    db_session: db_dependency, stocks_in: Sequence[tuple[int, StockIn]]
+) -> list[BulkCreateItem]:
+    """Create a chunk of the stocks of a bulk request in one transaction.
 
     Args:
-        db_session (db_dependency):  Database session.
-        book_id (int): Stock id
+        db_session (db_dependency): Database session.
+        stocks_in (Sequence[tuple[int, StockIn]]): Lines of the request body and stock details.
+
+    Returns:
+        list[BulkCreateItem]: ID or reason of the failure of each stock.
+    """
+    return insert_rows_on_db(db_session, get_insert_stocks_stmt(), stocks_in)
+
+
+def get_stock_book_out_from_db(db_session: db_dependency, book_id: int) -> StockOut:
+    """Get StockOut model response.
+
+    Args:
+        db_session (db_dependency): Database session.
+        book_id (int): Book id.
 
     Raises:
-        NotFoundException: Raised when the book_id is not found in the database.
+        NotFoundException: Raised when the book_id is not found in the stocks.
 
     Returns:
-        Stock: Stock details
+        StockOut: Stock details details.
     """
-    stock_stmt = get_stock_book_stmt(book_id)
-    stock = fetch_one_or_none(db_session, stock_stmt)
+    stock_stmt = get_stock_out_from_book_id_stmt(book_id)
+    rows = fetch_rows(db_session, stock_stmt)
 
-    if stock is None:
+    if not rows:
         raise NotFoundException(
             status_code=HTTPResponseCode.NOT_FOUND,
             message=f"{book_id=} not found in the database",
         )
 
-    return stock
+    return StockOut.trusted(**rows[0])
 
 
-def get_stock_book_out_from_db(db_session: db_dependency, book_id: int) -> StockOut:
-    """Get StockOut model response.
+def get_stock_version_from_db(db_session: db_dependency, book_id: int) -> RowMapping | None:
+    """Get the id and update time of the stock of a book, the version of its output.
 
     Args:
         db_session (db_dependency): Database session.
         book_id (int): Book id.
 
     Returns:
-        StockOut: Stock details details.
+        RowMapping | None: Id and update time, None if not found.
     """
-    db_stock = get_stock_book_from_id(db_session, book_id)
-    stock_data = db_stock.model_dump()
-    book_data = db_stock.book.model_dump()
-    return StockOut(
-        book_id=stock_data["book_id"],
-        stock_quantity=stock_data["stock_quantity"],
-        id=stock_data["id"],
-        title=book_data["title"],
-        category=book_data["category"],
-    )
+    rows = fetch_rows(db_session, get_stock_version_stmt(book_id))
+    return rows[0] if rows else None
 
 
 def get_stocks_with_offset_and_limit(
-    db_session: db_dependency, *, offset: int, limit: int
+    db_session: db_dependency,
+    *,
+    offset: int,
+    limit: int,
+    cursor: Cursor | None = None,
+    include_total: bool = True,
 ) -> StocksList:
     """Get all the stocks with pagination.
 
@@ -93,52 +112,53 @@ def get_stocks_with_offset_and_limit(
         db_session (db_dependency): Database session.
         offset (int): Offset value.
         limit (int): Limit value.
+        cursor (Cursor | None, optional): Cursor of the page, the offset is ignored when it
+                                          is given. Defaults to None.
+        include_total (bool, optional): Whether to count the items. Defaults to True.
 
     Returns:
         StocksList: List of available stocks.
     """
-    stocks_count_stmt = get_stocks_count_stmt()
-    stocks_count = fetch_one_or_none(db_session, stocks_count_stmt)  # type: ignore
-
-    # There is nothing to fetch if the stocks_count is None
-    if stocks_count is None:
-        return StocksList(
-            stocks=[],
-            number_of_stocks=0,
-            number_of_pages=0,
-            current_page=0,
-            next_page=None,
-            previous_page=None,
-        )
-
-    stocks_stmt = get_stocks_stmt_with_limit_and_offset(offset=offset, limit=limit)
-    stocks: list[StockOut] = []
-
-    for db_stock in fetch_all(db_session, stocks_stmt):
-        stock_data = db_stock.model_dump()
-        book_data = db_stock.book.model_dump()
-        stocks.append(
-            StockOut(
-                book_id=stock_data["book_id"],
-                stock_quantity=stock_data["stock_quantity"],
-                id=stock_data["id"],
-                title=book_data["title"],
-                category=book_data["category"],
-            )
+    # The count is a lookup in the counts maintained by triggers, skipped without include_total
+    stocks_count: int | None = None
+    if include_total:
+        stocks_count_stmt = get_stocks_count_stmt()
+        stocks_count = fetch_one_or_none(db_session, stocks_count_stmt)  # type: ignore
+
+    # One row more than the limit tells whether there is a next page
+    if cursor is None:
+        stocks_stmt = get_stocks_stmt_with_limit_and_offset(offset=offset, limit=limit + 1)
+    else:
+        stocks_stmt = get_stocks_stmt_with_limit_and_cursor(
+            cursor_id=cursor.id, is_previous=cursor.is_previous, limit=limit + 1
         )
+    rows, next_cursor, previous_cursor = cursor_details(
+        fetch_rows(db_session, stocks_stmt),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        get_id=lambda row: row["id"],
+    )
+    stocks = [StockOut.trusted(**row) for row in rows]
 
     # Calculate the number of pages, current page, next page, and previous page
     number_of_pages, current_page, next_page, previous_page = pagination_details(
-        offset=offset, limit=limit, counts=stocks_count
+        offset=offset,
+        limit=limit,
+        counts=stocks_count,
+        cursor=cursor,
+        has_next=next_cursor is not None,
     )
 
-    return StocksList(
+    return StocksList.trusted(
         stocks=stocks,
         number_of_stocks=stocks_count,
         number_of_pages=number_of_pages,
         current_page=current_page,
         next_page=next_page,
         previous_page=previous_page,
+        next_cursor=next_cursor,
+        previous_cursor=previous_cursor,
     )
 
 
@@ -162,16 +182,5 @@ def add_new_quantity_to_the_existing_stocks_on_db(
     add_new_stock_quantity_stmt = get_add_new_stock_quantity_stmt(book_id, stock_in.stock_quantity)
     execute_statements(db_session, [add_new_stock_quantity_stmt], is_commit=True)
 
-    db_stock = get_stock_book_from_id(db_session, book_id)
-
-    stock_data = db_stock.model_dump()
-    book_data = db_stock.book.model_dump()
-
-    stock_out = StockOut(
-        book_id=stock_data["book_id"],
-        stock_quantity=stock_data["stock_quantity"],
-        id=stock_data["id"],
-        title=book_data["title"],
-        category=book_data["category"],
-    )
+    stock_out = get_stock_book_out_from_db(db_session, book_id)
     return stock_out
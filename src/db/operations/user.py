@@ -1,16 +1,28 @@
+from typing import Sequence
+
+from sqlalchemy import RowMapping
+
 from src.db.engine import db_dependency
-from src.db.execution import execute_all_query, fetch_all, fetch_one_or_none
+from src.db.execution import execute_all_query, fetch_one_or_none, fetch_rows
 from src.db.models.user import User
+from src.db.operations.bulk import insert_rows_on_db
 from src.db.queries.user import (
+    get_insert_users_stmt,
     get_user_count_stmt,
     get_user_from_id_stmt,
+    get_user_version_stmt,
+    get_users_stmt_with_limit_and_cursor,
     get_users_stmt_with_limit_and_offset,
 )
 from src.exceptions.app import NotFoundException
-from src.helper.pagination import pagination_details
+from src.helper.pagination import Cursor, cursor_details, pagination_details
+from src.models.bulk import BulkCreateItem
 from src.models.http_response_code import HTTPResponseCode
 from src.models.user import UserIn, UserOut, UsersList
 
+# Tables the outputs are read from, their changes are the validators of the GET routes
+USER_TABLES = [User.__tablename__]
+
 
 def create_user_on_db(db_session: db_dependency, user_in: UserIn) -> UserOut:
     """Create a new user in the databases
@@ -25,7 +37,22 @@ def create_user_on_db(db_session: db_dependency, user_in: UserIn) -> UserOut:
     new_user = User(**user_in.model_dump())
     # Refresh the object after commit to get the primary key
     execute_all_query(db_session, [new_user], is_commit=True, is_refresh_after_commit=True)
-    return UserOut(**new_user.model_dump())
+    return UserOut.trusted(**new_user.model_dump())
+
+
+def create_users_on_db(
+    db_session: db_dependency, users_in: Sequence[tuple[int, UserIn]]
+) -> list[BulkCreateItem]:
+    """Create a chunk of the users of a bulk request in one transaction.
+
+    Args:
+        db_session (db_dependency): Database session.
+        users_in (Sequence[tuple[int, UserIn]]): Lines of the request body and user details.
+
+    Returns:
+        list[BulkCreateItem]: ID or reason of the failure of each user.
+    """
+    return insert_rows_on_db(db_session, get_insert_users_stmt(), users_in)
 
 
 def get_user_from_id(db_session: db_dependency, user_id: int) -> User:
@@ -64,11 +91,30 @@ def get_user_out_from_db(db_session: db_dependency, user_id: int) -> UserOut:
         UserOut: User details.
     """
     db_user = get_user_from_id(db_session, user_id)
-    return UserOut(**db_user.model_dump())
+    return UserOut.trusted(**db_user.model_dump())
+
+
+def get_user_version_from_db(db_session: db_dependency, user_id: int) -> RowMapping | None:
+    """Get the id and update time of a user, the version of its output.
+
+    Args:
+        db_session (db_dependency): Database session.
+        user_id (int): User id.
+
+    Returns:
+        RowMapping | None: Id and update time, None if not found.
+    """
+    rows = fetch_rows(db_session, get_user_version_stmt(user_id))
+    return rows[0] if rows else None
 
 
 def get_users_with_offset_and_limit(
-    db_session: db_dependency, *, offset: int, limit: int
+    db_session: db_dependency,
+    *,
+    offset: int,
+    limit: int,
+    cursor: Cursor | None = None,
+    include_total: bool = True,
 ) -> UsersList:
     """Get all users with pagination.
 
@@ -76,39 +122,53 @@ def get_users_with_offset_and_limit(
         db_session (db_dependency): Database session.
         offset (int): Offset value.
         limit (int): Limit value.
+        cursor (Cursor | None, optional): Cursor of the page, the offset is ignored when it
+                                          is given. Defaults to None.
+        include_total (bool, optional): Whether to count the items. Defaults to True.
 
     Returns:
         UsersList: List of authors.
     """
-    users_count_stmt = get_user_count_stmt()
-    users_count = fetch_one_or_none(db_session, users_count_stmt)  # type: ignore
-
-    # There is nothing to fetch if the users_count is None
-    if users_count is None:
-        return UsersList(
-            users=[],
-            number_of_users=0,
-            number_of_pages=0,
-            current_page=0,
-            next_page=None,
-            previous_page=None,
+    # The count is a lookup in the counts maintained by triggers, skipped without include_total
+    users_count: int | None = None
+    if include_total:
+        users_count_stmt = get_user_count_stmt()
+        users_count = fetch_one_or_none(db_session, users_count_stmt)  # type: ignore
+
+    # One row more than the limit tells whether there is a next page
+    if cursor is None:
+        users_stmt = get_users_stmt_with_limit_and_offset(offset=offset, limit=limit + 1)
+    else:
+        users_stmt = get_users_stmt_with_limit_and_cursor(
+            cursor_id=cursor.id, is_previous=cursor.is_previous, limit=limit + 1
         )
-
-    users_stmt = get_users_stmt_with_limit_and_offset(offset=offset, limit=limit)
-    users = [UserOut(**user.model_dump()) for user in fetch_all(db_session, users_stmt)]
+    rows, next_cursor, previous_cursor = cursor_details(
+        fetch_rows(db_session, users_stmt),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        get_id=lambda row: row["id"],
+    )
+    users = [UserOut.trusted(**row) for row in rows]
 
     # Calculate the number of pages, current page, next page, and previous page
     number_of_pages, current_page, next_page, previous_page = pagination_details(
-        offset=offset, limit=limit, counts=users_count
+        offset=offset,
+        limit=limit,
+        counts=users_count,
+        cursor=cursor,
+        has_next=next_cursor is not None,
     )
 
-    return UsersList(
+    return UsersList.trusted(
         users=users,
         number_of_users=users_count,
         number_of_pages=number_of_pages,
         current_page=current_page,
         next_page=next_page,
         previous_page=previous_page,
+        next_cursor=next_cursor,
+        previous_cursor=previous_cursor,
     )
 
 
@@ -132,7 +192,7 @@ def update_user_on_db(db_session: db_dependency, user_id: int, user_in: UserIn)
     for field, value in user_in.model_dump().items():
         setattr(db_user, field, value)
 
-    user_out = UserOut(**db_user.model_dump())
+    user_out = UserOut.trusted(**db_user.model_dump())
     # We don't need to refresh the object for the update operation, so we can avoid
     # making a select request to the database.
     execute_all_query(
@@ -2,6 +2,7 @@ from sqlmodel import select
 from sqlmodel.sql._expression_select_cls import SelectOfScalar
 
 from src.db.models.admin_user import AdminUser
+from src.db.statement_cache import cached_statement
 
 
 def get_admin_user_stmt(user_id: str) -> SelectOfScalar[AdminUser]:
@@ -13,5 +14,5 @@ def get_admin_user_stmt(user_id: str) -> SelectOfScalar[AdminUser]:
     Returns:
         SelectOfScalar[AdminUser]: Select statement for admin_user.
     """
-    stmt = select(AdminUser).where(AdminUser.user_id == user_id)
+    stmt = cached_statement(lambda: select(AdminUser).where(AdminUser.user_id == user_id))
     return stmt
@@ -1,8 +1,22 @@
-from sqlalchemy import Delete, delete, func
+from typing import Any
+
+from sqlalchemy import Delete, delete, insert
+from sqlalchemy.sql.dml import ReturningInsert
 from sqlmodel import select
-from sqlmodel.sql._expression_select_cls import SelectOfScalar
+from sqlmodel.sql._expression_select_cls import Select, SelectOfScalar
 
 from src.db.models.author import Author
+from src.db.queries.table_count import get_table_count_stmt
+from src.db.statement_cache import cached_statement
+
+# Columns of `AuthorOut`, the rows of the list statements are read with `fetch_rows`
+AUTHOR_OUT_COLUMNS = (
+    Author.id,
+    Author.first_name,
+    Author.last_name,
+    Author.birth_date,
+    Author.nationality,
+)
 
 
 def get_author_stmt(author_id: int) -> SelectOfScalar[Author]:
@@ -14,7 +28,22 @@ def get_author_stmt(author_id: int) -> SelectOfScalar[Author]:
     Returns:
         SelectOfScalar[Author]: Select statement for author.
     """
-    stmt = select(Author).where(Author.id == author_id)
+    stmt = cached_statement(lambda: select(Author).where(Author.id == author_id))
+    return stmt
+
+
+def get_author_version_stmt(author_id: int) -> Select[Any]:
+    """This function returns a select statement to get the id and update time of the Author.
+
+    Args:
+        author_id (int): The author id
+
+    Returns:
+        Select[Any]: Select statement for the version of the author, a primary key lookup.
+    """
+    stmt: Select[Any] = cached_statement(
+        lambda: select(Author.id, Author.updated_at).where(Author.id == author_id)  # type: ignore
+    )
     return stmt
 
 
@@ -27,7 +56,7 @@ def delete_author_from_id_stmt(author_id: int) -> Delete:
     Returns:
          Delete: Delete statement
     """
-    stmt = delete(Author).where(Author.id == author_id)  # type: ignore
+    stmt = cached_statement(lambda: delete(Author).where(Author.id == author_id))  # type: ignore
     return stmt
 
 
@@ -37,19 +66,92 @@ def get_author_count_stmt() -> SelectOfScalar[int]:
     Returns:
         SelectOfScalar[int]: Select statement for the count of author.
     """
-    stmt = select(func.count().label("author_count")).select_from(Author)
+    stmt = get_table_count_stmt(Author.__tablename__)
     return stmt
 
 
-def get_authors_stmt_with_limit_and_offset(*, offset: int, limit: int) -> SelectOfScalar[Author]:
-    """This function returns a select statement to get all authors with pagination.
+def get_authors_stmt_with_limit_and_offset(*, offset: int, limit: int) -> Select[Any]:
+    """This function returns a select statement to get the columns of all authors with pagination.
+
+    Only the columns of `AuthorOut` are selected, the rows are read with `fetch_rows`.
 
     Args:
         offset (int): Offset value.
         limit (int): Limit value.
 
     Returns:
-        SelectOfScalar[Author]: Select statement for all authors.
+        Select[Any]: Select statement for all authors.
+    """
+    stmt: Select[Any] = cached_statement(
+        lambda: select(*AUTHOR_OUT_COLUMNS)  # type: ignore
+        .limit(limit)
+        .offset(offset)
+        .order_by(Author.id.asc())  # type: ignore
+    )
+    return stmt
+
+
+def get_authors_export_stmt() -> Select[Any]:
+    """This function returns a select statement to get the columns of all the authors, for
+       their export.
+
+    Returns:
+        Select[Any]: Select statement for all the authors in id order.
+    """
+    stmt: Select[Any] = cached_statement(
+        lambda: select(*AUTHOR_OUT_COLUMNS).order_by(Author.id.asc())  # type: ignore
+    )
+    return stmt
+
+
+def get_authors_stmt_with_limit_and_cursor(
+    *, cursor_id: int, is_previous: bool, limit: int
+) -> Select[Any]:
+    """This function returns a select statement to get the columns of the authors after a cursor.
+
+    The authors are seeked on the id primary key instead of skipping the rows of the previous
+    pages. A previous cursor gets the authors before it, in descending id order.
+
+    Args:
+        cursor_id (int): Id of the cursor.
+        is_previous (bool): Whether the cursor is a previous cursor.
+        limit (int): Limit value.
+
+    Returns:
+        Select[Any]: Select statement for the authors of the page.
+    """
+    if is_previous:
+        stmt: Select[Any] = cached_statement(
+            lambda: select(*AUTHOR_OUT_COLUMNS)  # type: ignore
+            .where(Author.id < cursor_id)  # type: ignore
+            .order_by(Author.id.desc())  # type: ignore
+            .limit(limit)
+        )
+    else:
+        stmt = cached_statement(
+            lambda: select(*AUTHOR_OUT_COLUMNS)  # type: ignore
+            .where(Author.id > cursor_id)  # type: ignore
+            .order_by(Author.id.asc())  # type: ignore
+            .limit(limit)
+        )
+    return stmt
+
+
+def get_insert_authors_stmt() -> ReturningInsert[Any]:
+    """This function returns an insert statement of several authors, the values of the
+       authors are given when executing it.
+
+    The statement is not a cached lambda statement, the ORM bulk insert of the rows given
+    when executing it does not support them. Its compiled form is cached by SQLAlchemy.
+
+    Returns:
+        ReturningInsert[Any]: Insert statement returning the ID and the unique key (first name,
+                              last name and birth date) of each author.
     """
-    stmt = select(Author).limit(limit).offset(offset).order_by(Author.id.asc())  # type: ignore
+    stmt: ReturningInsert[Any] = insert(Author).returning(
+        Author.id,  # type: ignore
+        Author.first_name,  # type: ignore
+        Author.last_name,  # type: ignore
+        Author.birth_date,  # type: ignore
+    )
     return stmt
@@ -1,8 +1,16 @@
-from sqlalchemy import Delete, delete, func
+from typing import Any
+
+from sqlalchemy import Delete, delete, insert
+from sqlalchemy.sql.dml import ReturningInsert
 from sqlmodel import select
-from sqlmodel.sql._expression_select_cls import SelectOfScalar
+from sqlmodel.sql._expression_select_cls import Select, SelectOfScalar
 
 from src.db.models.book import Book
+from src.db.queries.table_count import get_table_count_stmt
+from src.db.statement_cache import cached_statement
+
+# Columns of `BookOut`, the rows of the list statements are read with `fetch_rows`
+BOOK_OUT_COLUMNS = (Book.id, Book.title, Book.author_id, Book.published_date, Book.category)
 
 
 def get_book_from_id_stmt(book_id: int) -> SelectOfScalar[Book]:
@@ -14,7 +22,22 @@ def get_book_from_id_stmt(book_id: int) -> SelectOfScalar[Book]:
     Returns:
         SelectOfScalar[Book]: Select statement for book.
     """
-    stmt = select(Book).where(Book.id == book_id)
+    stmt = cached_statement(lambda: select(Book).where(Book.id == book_id))
+    return stmt
+
+
+def get_book_version_stmt(book_id: int) -> Select[Any]:
+    """This function returns a select statement to get the id and update time of the Book.
+
+    Args:
+        book_id (int): The book id
+
+    Returns:
+        Select[Any]: Select statement for the version of the book, a primary key lookup.
+    """
+    stmt: Select[Any] = cached_statement(
+        lambda: select(Book.id, Book.updated_at).where(Book.id == book_id)  # type: ignore
+    )
     return stmt
 
 
@@ -24,21 +47,74 @@ def get_book_count_stmt() -> SelectOfScalar[int]:
     Returns:
         SelectOfScalar[int]: Select statement for the count of author.
     """
-    stmt = select(func.count().label("book_count")).select_from(Book)
+    stmt = get_table_count_stmt(Book.__tablename__)
     return stmt
 
 
-def get_books_stmt_with_limit_and_offset(*, offset: int, limit: int) -> SelectOfScalar[Book]:
-    """This function returns a select statement to get all books with pagination.
+def get_books_stmt_with_limit_and_offset(*, offset: int, limit: int) -> Select[Any]:
+    """This function returns a select statement to get the columns of all books with pagination.
+
+    Only the columns of `BookOut` are selected, the rows are read with `fetch_rows`.
 
     Args:
         offset (int): Offset value.
         limit (int): Limit value.
 
     Returns:
-        SelectOfScalar[Book]: Select statement for all books.
+        Select[Any]: Select statement for all books.
+    """
+    stmt: Select[Any] = cached_statement(
+        lambda: select(*BOOK_OUT_COLUMNS)  # type: ignore
+        .limit(limit)
+        .offset(offset)
+        .order_by(Book.id.asc())  # type: ignore
+    )
+    return stmt
+
+
+def get_books_export_stmt() -> Select[Any]:
+    """This function returns a select statement to get the columns of all the books, for
+       their export.
+
+    Returns:
+        Select[Any]: Select statement for all the books in id order.
+    """
+    stmt: Select[Any] = cached_statement(
+        lambda: select(*BOOK_OUT_COLUMNS).order_by(Book.id.asc())  # type: ignore
+    )
+    return stmt
+
+
+def get_books_stmt_with_limit_and_cursor(
+    *, cursor_id: int, is_previous: bool, limit: int
+) -> Select[Any]:
+    """This function returns a select statement to get the columns of the books after a cursor.
+
+    The books are seeked on the id primary key instead of skipping the rows of the previous
+    pages. A previous cursor gets the books before it, in descending id order.
+
+    Args:
+        cursor_id (int): Id of the cursor.
+        is_previous (bool): Whether the cursor is a previous cursor.
+        limit (int): Limit value.
+
+    Returns:
+        Select[Any]: Select statement for the books of the page.
     """
-    stmt = select(Book).limit(limit).offset(offset).order_by(Book.id.asc())  # type: ignore
+    if is_previous:
+        stmt: Select[Any] = cached_statement(
+            lambda: select(*BOOK_OUT_COLUMNS)  # type: ignore
+            .where(Book.id < cursor_id)  # type: ignore
+            .order_by(Book.id.desc())  # type: ignore
+            .limit(limit)
+        )
+    else:
+        stmt = cached_statement(
+            lambda: select(*BOOK_OUT_COLUMNS)  # type: ignore
+            .where(Book.id > cursor_id)  # type: ignore
+            .order_by(Book.id.asc())  # type: ignore
+            .limit(limit)
+        )
     return stmt
 
 
@@ -51,7 +127,7 @@ def delete_book_from_id_stmt(book_id: int) -> Delete:
     Returns:
          Delete: Delete statement
     """
-    stmt = delete(Book).where(Book.id == book_id)  # type: ignore
+    stmt = cached_statement(lambda: delete(Book).where(Book.id == book_id))  # type: ignore
     return stmt
 
 
@@ -64,5 +140,25 @@ def delete_books_from_author_id_stmt(author_id: int) -> Delete:
     Returns:
          Delete: Delete statement
     """
-    stmt = delete(Book).where(Book.author_id == author_id)  # type: ignore
+    stmt = cached_statement(lambda: delete(Book).where(Book.author_id == author_id))  # type: ignore
+    return stmt
+
+
+def get_insert_books_stmt() -> ReturningInsert[Any]:
+    """This function returns an insert statement of several books, the values of the
+       books are given when executing it.
+
+    The statement is not a cached lambda statement, the ORM bulk insert of the rows given
+    when executing it does not support them. Its compiled form is cached by SQLAlchemy.
+
+    Returns:
+        ReturningInsert[Any]: Insert statement returning the ID and the unique key (title, author
+                              ID and published date) of each book.
+    """
+    stmt: ReturningInsert[Any] = insert(Book).returning(
+        Book.id,  # type: ignore
+        Book.title,  # type: ignore
+        Book.author_id,  # type: ignore
+        Book.published_date,  # type: ignore
+    )
     return stmt
@@ -1,8 +1,30 @@
-from sqlalchemy import and_, func
+from datetime import datetime
+from typing import Any, TypeVar
+
+from sqlalchemy import DateTime, Integer, and_, exists, func, insert, type_coerce, update
+from sqlalchemy.sql.dml import ReturningInsert, ReturningUpdate
 from sqlmodel import select
-from sqlmodel.sql._expression_select_cls import SelectOfScalar
+from sqlmodel.sql._expression_select_cls import Select, SelectOfScalar
 
 from src.db.models.reservation import Reservation
+from src.db.models.reservation_status import ReservationStatus
+from src.db.models.user import User
+from src.db.queries.table_count import get_table_count_stmt
+from src.db.statement_cache import cached_criteria, cached_statement
+from src.models.reservation import ReservationFilters
+
+S = TypeVar("S", Select[Any], SelectOfScalar[int])
+
+# Columns of `ReservationOut`, the rows of the list statements are read with `fetch_rows`
+RESERVATION_OUT_COLUMNS = (
+    Reservation.id,
+    Reservation.book_id,
+    Reservation.user_id,
+    ReservationStatus.name.label("status"),  # type: ignore
+    Reservation.borrowed_at,
+    Reservation.due_date,
+    Reservation.returned_at.label("return_date"),  # type: ignore
+)
 
 
 def get_non_returned_books_from_user_id_stmt(
@@ -18,42 +40,254 @@ def get_non_returned_books_from_user_id_stmt(
         SelectOfScalar[Reservation]: Select statement for non returned books.
     """
 
-    stmt = select(Reservation).where(
-        and_(
+    stmt = cached_statement(
+        lambda: select(Reservation).where(
+            and_(
+                Reservation.user_id == user_id,  # type: ignore
+                Reservation.book_id == book_id,  # type: ignore
+                Reservation.returned_at.is_(None),  # type: ignore
+            )
+        )
+    )
+    return stmt
+
+
+def get_insert_reservation_stmt(  # noqa: PLR0913
+    *, user_id: int, book_id: int, status_id: int, borrowed_at: datetime, due_date: datetime
+) -> ReturningInsert[tuple[int]]:
+    """This function returns an insert statement of a reservation, only for an existing user
+       without a non returned loan of the book.
+
+    Args:
+        user_id (int): User ID
+        book_id (int): Book ID
+        status_id (int): Reservation status ID
+        borrowed_at (datetime): Borrow date
+        due_date (datetime): Due date
+
+    Returns:
+        ReturningInsert[tuple[int]]: Insert statement returning the reservation ID, no row is
+                                     inserted or returned when the user cannot reserve.
+    """
+
+    stmt: ReturningInsert[tuple[int]] = cached_statement(
+        lambda: insert(Reservation)
+        .from_select(
+            ["book_id", "user_id", "status_id", "borrowed_at", "due_date"],
+            select(  # type: ignore[call-overload]
+                type_coerce(book_id, Integer),
+                User.id,
+                type_coerce(status_id, Integer),
+                type_coerce(borrowed_at, DateTime),
+                type_coerce(due_date, DateTime),
+            )
+            .where(User.id == user_id)
+            .where(
+                ~exists().where(
+                    Reservation.user_id == user_id,  # type: ignore
+                    Reservation.book_id == book_id,  # type: ignore
+                    Reservation.returned_at.is_(None),  # type: ignore
+                )
+            ),
+        )
+        .returning(Reservation.id)
+    )
+    return stmt
+
+
+def get_non_returned_books_from_user_id_and_book_ids_stmt(
+    *, user_id: int, book_ids: list[int]
+) -> SelectOfScalar[Reservation]:
+    """This function returns a select statement to get non returned books among several books.
+
+    Args:
+        user_id (int): User ID
+        book_ids (list[int]): Book IDs
+
+    Returns:
+        SelectOfScalar[Reservation]: Select statement for non returned books.
+    """
+
+    stmt = cached_statement(
+        lambda: select(Reservation).where(
             Reservation.user_id == user_id,  # type: ignore
-            Reservation.book_id == book_id,  # type: ignore
+            Reservation.book_id.in_(book_ids),  # type: ignore
             Reservation.returned_at.is_(None),  # type: ignore
         )
     )
     return stmt
 
 
-def get_reservations_count_stmt() -> SelectOfScalar[int]:
+def get_insert_reservations_stmt() -> ReturningInsert[tuple[int, int]]:
+    """This function returns an insert statement of several reservations, the values of the
+       reservations are given when executing it.
+
+    The statement is not a cached lambda statement, the ORM bulk insert of the rows given
+    when executing it does not support them. Its compiled form is cached by SQLAlchemy.
+
+    Returns:
+        ReturningInsert[tuple[int, int]]: Insert statement returning the reservation ID and
+                                          book ID of each reservation.
+    """
+    stmt: ReturningInsert[tuple[int, int]] = insert(Reservation).returning(
+        Reservation.id,  # type: ignore
+        Reservation.book_id,  # type: ignore
+    )
+    return stmt
+
+
+def filter_reservations_stmt(stmt: S, filters: ReservationFilters | None) -> S:  # noqa: PLR0915
+    """This function adds the criteria of the reservation filters to a reservations statement.
+
+    Each filter is an optional cached criteria, it is covered by an index of the reservations:
+    `(user_id, returned_at)`, `(book_id, returned_at)`, `(status_id, id)` and
+    `(returned_at, due_date)`.
+
+    Args:
+        stmt (S): Cached select statement on the reservations.
+        filters (ReservationFilters | None): Filters of the reservations.
+
+    Returns:
+        S: Select statement with the criteria of the filters.
+    """
+    if filters is None:
+        return stmt
+
+    if filters.user_id is not None:
+        user_id = filters.user_id
+        stmt = cached_criteria(stmt, lambda s: s.where(Reservation.user_id == user_id))
+    if filters.book_id is not None:
+        book_id = filters.book_id
+        stmt = cached_criteria(stmt, lambda s: s.where(Reservation.book_id == book_id))
+    if filters.status is not None:
+        status = filters.status.value
+        stmt = cached_criteria(
+            stmt,
+            lambda s: s.where(
+                Reservation.status_id
+                == select(ReservationStatus.id)
+                .where(ReservationStatus.name == status)
+                .scalar_subquery()
+            ),
+        )
+    if filters.active or filters.overdue:
+        stmt = cached_criteria(stmt, lambda s: s.where(Reservation.returned_at.is_(None)))  # type: ignore
+    if filters.overdue:
+        now = datetime.now()
+        stmt = cached_criteria(stmt, lambda s: s.where(Reservation.due_date < now))
+    return stmt
+
+
+def get_reservations_count_stmt(
+    filters: ReservationFilters | None = None,
+) -> SelectOfScalar[int]:
     """This function returns a select statement to get the total number of reservations.
 
+    Without filters, the count is read from the table counts. With filters, the reservations
+    matching them are counted on the index of the filters.
+
+    Args:
+        filters (ReservationFilters | None, optional): Filters of the reservations.
+                                                       Defaults to None.
+
     Returns:
         SelectOfScalar[int]: Select statement for the reservations count.
     """
-    stmt = select(func.count().label("reservation_count")).select_from(Reservation)
-    return stmt
+    if filters is None or filters.is_empty:
+        stmt = get_table_count_stmt(Reservation.__tablename__)
+        return stmt
+
+    stmt = cached_statement(
+        lambda: select(func.count().label("reservation_count")).select_from(Reservation)
+    )
+    return filter_reservations_stmt(stmt, filters)
 
 
 def get_reservations_stmt_with_limit_and_offset(
-    *, offset: int, limit: int
-) -> SelectOfScalar[Reservation]:
-    """This function returns a select statement to get all reservations with pagination.
+    *, offset: int, limit: int, filters: ReservationFilters | None = None
+) -> Select[Any]:
+    """This function returns a select statement to get the columns of all reservations with
+       pagination.
+
+    Only the columns of `ReservationOut` are selected, with the name of the reservation
+    status, the rows are read with `fetch_rows`.
 
     Args:
         offset (int): Offset value.
         limit (int): Limit value.
+        filters (ReservationFilters | None, optional): Filters of the reservations.
+                                                       Defaults to None.
 
     Returns:
-        SelectOfScalar[Reservation]: Select statement for all Reservation.
+        Select[Any]: Select statement for all reservations.
     """
-    stmt = select(Reservation).limit(limit).offset(offset).order_by(Reservation.id.asc())  # type: ignore
+    stmt: Select[Any] = cached_statement(
+        lambda: select(*RESERVATION_OUT_COLUMNS)  # type: ignore
+        .join(ReservationStatus, Reservation.status_id == ReservationStatus.id)  # type: ignore
+        .limit(limit)
+        .offset(offset)
+        .order_by(Reservation.id.asc())  # type: ignore
+    )
+    return filter_reservations_stmt(stmt, filters)
+
+
+def get_reservations_export_stmt() -> Select[Any]:
+    """This function returns a select statement to get the columns of all the reservations, for
+       their export.
+
+    Returns:
+        Select[Any]: Select statement for all the reservations in id order.
+    """
+    stmt: Select[Any] = cached_statement(
+        lambda: select(*RESERVATION_OUT_COLUMNS)  # type: ignore
+        .join(ReservationStatus, Reservation.status_id == ReservationStatus.id)  # type: ignore
+        .order_by(Reservation.id.asc())  # type: ignore
+    )
     return stmt
 
 
+def get_reservations_stmt_with_limit_and_cursor(
+    *,
+    cursor_id: int,
+    is_previous: bool,
+    limit: int,
+    filters: ReservationFilters | None = None,
+) -> Select[Any]:
+    """This function returns a select statement to get the columns of the reservations after a
+       cursor.
+
+    The reservations are seeked on the id primary key instead of skipping the rows of the previous
+    pages. A previous cursor gets the reservations before it, in descending id order.
+
+    Args:
+        cursor_id (int): Id of the cursor.
+        is_previous (bool): Whether the cursor is a previous cursor.
+        limit (int): Limit value.
+        filters (ReservationFilters | None, optional): Filters of the reservations.
+                                                       Defaults to None.
+
+    Returns:
+        Select[Any]: Select statement for the reservations of the page.
+    """
+    if is_previous:
+        stmt: Select[Any] = cached_statement(
+            lambda: select(*RESERVATION_OUT_COLUMNS)  # type: ignore
+            .join(ReservationStatus, Reservation.status_id == ReservationStatus.id)  # type: ignore
+            .where(Reservation.id < cursor_id)  # type: ignore
+            .order_by(Reservation.id.desc())  # type: ignore
+            .limit(limit)
+        )
+    else:
+        stmt = cached_statement(
+            lambda: select(*RESERVATION_OUT_COLUMNS)  # type: ignore
+            .join(ReservationStatus, Reservation.status_id == ReservationStatus.id)  # type: ignore
+            .where(Reservation.id > cursor_id)  # type: ignore
+            .order_by(Reservation.id.asc())  # type: ignore
+            .limit(limit)
+        )
+    return filter_reservations_stmt(stmt, filters)
+
+
 def get_reservation_from_id_stmt(reservation_id: int) -> SelectOfScalar[Reservation]:
     """This function returns a select statement to get the reservation.
 
@@ -63,7 +297,56 @@ def get_reservation_from_id_stmt(reservation_id: int) -> SelectOfScalar[Reservat
     Returns:
         SelectOfScalar[Reservation]: Select statement for reservation.
     """
-    stmt = select(Reservation).where(Reservation.id == reservation_id)
+    stmt = cached_statement(lambda: select(Reservation).where(Reservation.id == reservation_id))
+    return stmt
+
+
+def get_reservations_from_ids_stmt(reservation_ids: list[int]) -> SelectOfScalar[Reservation]:
+    """This function returns a select statement to get several reservations.
+
+    Args:
+        reservation_ids (list[int]): The reservation ids
+
+    Returns:
+        SelectOfScalar[Reservation]: Select statement for reservations.
+    """
+    stmt = cached_statement(
+        lambda: select(Reservation).where(Reservation.id.in_(reservation_ids))  # type: ignore
+    )
+    return stmt
+
+
+def get_return_reservations_stmt(
+    *, reservation_ids: list[int], status_id: int, returned_at: datetime
+) -> ReturningUpdate[Any]:
+    """This function returns an update statement to return several reservations, only the
+       ones not returned yet.
+
+    Args:
+        reservation_ids (list[int]): The reservation ids
+        status_id (int): Returned status ID
+        returned_at (datetime): Return date
+
+    Returns:
+        ReturningUpdate[Any]: Update statement returning the columns of `ReservationOut` but
+                              the status of the returned reservations.
+    """
+    stmt: ReturningUpdate[Any] = cached_statement(
+        lambda: update(Reservation)
+        .where(
+            Reservation.id.in_(reservation_ids),  # type: ignore
+            Reservation.returned_at.is_(None),  # type: ignore
+        )
+        .values(returned_at=returned_at, status_id=status_id)
+        .returning(
+            Reservation.id,
+            Reservation.book_id,
+            Reservation.user_id,
+            Reservation.borrowed_at,
+            Reservation.due_date,
+            Reservation.returned_at.label("return_date"),  # type: ignore
+        )
+    )
     return stmt
 
 
@@ -82,12 +365,14 @@ def get_reservation_books_from_id_stmt(
         SelectOfScalar[Reservation]: Select statement for non returned books.
     """
 
-    stmt = select(Reservation).where(
-        and_(
-            Reservation.id == reservation_id,  # type: ignore
-            Reservation.user_id == user_id,  # type: ignore
-            Reservation.book_id == book_id,  # type: ignore
-            Reservation.returned_at.is_(None),  # type: ignore
+    stmt = cached_statement(
+        lambda: select(Reservation).where(
+            and_(
+                Reservation.id == reservation_id,  # type: ignore
+                Reservation.user_id == user_id,  # type: ignore
+                Reservation.book_id == book_id,  # type: ignore
+                Reservation.returned_at.is_(None),  # type: ignore
+            )
         )
     )
     return stmt
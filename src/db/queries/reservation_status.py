@@ -2,6 +2,7 @@ from sqlmodel import select
 from sqlmodel.sql._expression_select_cls import SelectOfScalar
 
 from src.db.models.reservation_status import ReservationStatus
+from src.db.statement_cache import cached_statement
 
 
 def get_reservation_status_stmt() -> SelectOfScalar[ReservationStatus]:
@@ -10,5 +11,5 @@ def get_reservation_status_stmt() -> SelectOfScalar[ReservationStatus]:
     Returns:
         SelectOfScalar[ReservationStatus]: Select statement for reservation status.
     """
-    stmt = select(ReservationStatus)
+    stmt = cached_statement(lambda: select(ReservationStatus))
     return stmt
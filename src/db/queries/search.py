@@ -0,0 +1,71 @@
+from typing import Any
+
+from sqlalchemy import ColumnElement, TableClause, column, func, literal_column, table
+from sqlmodel import select
+from sqlmodel.sql._expression_select_cls import Select, SelectOfScalar
+
+from src.db.models.author import Author
+from src.db.models.book import Book
+from src.db.queries.book import BOOK_OUT_COLUMNS
+from src.db.statement_cache import cached_statement
+
+# FTS5 index of the books (SQLite only, created by the migrations): its rowid is the book id
+BOOKS_SEARCH: TableClause = table("books_search", column("rowid"))
+
+# BM25 weights of the title, category, author first name and author last name columns
+BOOKS_SEARCH_WEIGHTS = (10.0, 2.0, 5.0, 5.0)
+
+
+def get_books_search_match(match: str) -> ColumnElement[bool]:
+    """Condition of the books matching a FTS5 query."""
+    return literal_column(BOOKS_SEARCH.name).op("MATCH")(match)  # type: ignore
+
+
+def get_books_search_stmt(*, match: str, offset: int, limit: int) -> Select[Any]:
+    """This function returns a select statement to get the books matching a full-text query,
+       the most relevant first.
+
+    The columns of `BookOut` and the names of the author are selected, the rows are read with
+    `fetch_rows`.
+
+    Args:
+        match (str): FTS5 query.
+        offset (int): Offset value.
+        limit (int): Limit value.
+
+    Returns:
+        Select[Any]: Select statement for the matching books.
+    """
+    stmt: Select[Any] = cached_statement(
+        lambda: select(  # type: ignore
+            *BOOK_OUT_COLUMNS,
+            Author.first_name.label("author_first_name"),  # type: ignore
+            Author.last_name.label("author_last_name"),  # type: ignore
+        )
+        .select_from(BOOKS_SEARCH)
+        .join(Book, Book.id == BOOKS_SEARCH.c.rowid)  # type: ignore
+        .join(Author, Author.id == Book.author_id)  # type: ignore
+        .where(get_books_search_match(match))
+        .order_by(
+            func.bm25(literal_column(BOOKS_SEARCH.name), *BOOKS_SEARCH_WEIGHTS),
+            Book.id.asc(),  # type: ignore
+        )
+        .limit(limit)
+        .offset(offset)
+    )
+    return stmt
+
+
+def get_books_search_count_stmt(match: str) -> SelectOfScalar[int]:
+    """This function returns a select statement to count the books matching a full-text query.
+
+    Args:
+        match (str): FTS5 query.
+
+    Returns:
+        SelectOfScalar[int]: Select statement for the count of the matching books.
+    """
+    stmt: SelectOfScalar[int] = cached_statement(
+        lambda: select(func.count()).select_from(BOOKS_SEARCH).where(get_books_search_match(match))
+    )
+    return stmt
@@ -1,8 +1,18 @@
-from sqlalchemy import Update, func, update
+from typing import Any
+
+from sqlalchemy import Update, case, exists, func, insert, update
+from sqlalchemy.sql.dml import ReturningInsert, ReturningUpdate
 from sqlmodel import select
-from sqlmodel.sql._expression_select_cls import SelectOfScalar
+from sqlmodel.sql._expression_select_cls import Select, SelectOfScalar
 
+from src.db.models.book import Book
+from src.db.models.reservation import Reservation
 from src.db.models.stock import Stock
+from src.db.queries.table_count import get_table_count_stmt
+from src.db.statement_cache import cached_statement
+
+# Columns of `StockOut`, the title and category come from the book joined to the stock
+STOCK_OUT_COLUMNS = (Stock.id, Stock.book_id, Stock.stock_quantity, Book.title, Book.category)
 
 
 def get_stock_book_stmt(book_id: int) -> SelectOfScalar[Stock]:
@@ -14,7 +24,7 @@ def get_stock_book_stmt(book_id: int) -> SelectOfScalar[Stock]:
     Returns:
         SelectOfScalar[Stock]: Select statement for Stock.
     """
-    stmt = select(Stock).where(Stock.book_id == book_id)
+    stmt = cached_statement(lambda: select(Stock).where(Stock.book_id == book_id))
     return stmt
 
 
@@ -24,41 +34,193 @@ def get_stocks_count_stmt() -> SelectOfScalar[int]:
     Returns:
         SelectOfScalar[int]: Select statement for the count of stocks.
     """
-    stmt = select(func.count().label("stocks_count")).select_from(Stock)
+    stmt = get_table_count_stmt(Stock.__tablename__)
+    return stmt
+
+
+def get_stock_out_from_book_id_stmt(book_id: int) -> Select[Any]:
+    """This function returns a select statement to get the columns of a stock and its book.
+
+    The book is joined to the stock, its title and category are read by the same query.
+
+    Args:
+        book_id (int): The book_id to get from DB.
+
+    Returns:
+        Select[Any]: Select statement for the stock of the book.
+    """
+    stmt: Select[Any] = cached_statement(
+        lambda: select(*STOCK_OUT_COLUMNS)  # type: ignore
+        .join(Book, Stock.book_id == Book.id)  # type: ignore
+        .where(Stock.book_id == book_id)  # type: ignore
+    )
+    return stmt
+
+
+def get_stock_version_stmt(book_id: int) -> Select[Any]:
+    """This function returns a select statement to get the id and update time of a stock.
+
+    The title and category of the book are part of the stock output, the update time is the
+    last one of the stock and of its book.
+
+    Args:
+        book_id (int): The book_id of the stock.
+
+    Returns:
+        Select[Any]: Select statement for the version of the stock of the book.
+    """
+    stmt: Select[Any] = cached_statement(
+        lambda: select(  # type: ignore
+            Stock.id,
+            case(
+                (Book.updated_at > Stock.updated_at, Book.updated_at),  # type: ignore
+                else_=Stock.updated_at,
+            ).label("updated_at"),
+        )
+        .join(Book, Stock.book_id == Book.id)  # type: ignore
+        .where(Stock.book_id == book_id)  # type: ignore
+    )
     return stmt
 
 
-def get_stocks_stmt_with_limit_and_offset(*, offset: int, limit: int) -> SelectOfScalar[Stock]:
-    """This function returns a select statement to get all stocks with pagination.
+def get_stocks_stmt_with_limit_and_offset(*, offset: int, limit: int) -> Select[Any]:
+    """This function returns a select statement to get the columns of all stocks with pagination.
+
+    Only the columns of `StockOut` are selected, the book of each stock is joined instead of
+    being loaded afterwards. The rows are read with `fetch_rows`.
 
     Args:
         offset (int): Offset value.
         limit (int): Limit value.
 
     Returns:
-        SelectOfScalar[Stock]: Select statement for all stocks.
+        Select[Any]: Select statement for all stocks.
     """
-    stmt = select(Stock).limit(limit).offset(offset).order_by(Stock.id.asc())  # type: ignore
+    stmt: Select[Any] = cached_statement(
+        lambda: select(*STOCK_OUT_COLUMNS)  # type: ignore
+        .join(Book, Stock.book_id == Book.id)  # type: ignore
+        .limit(limit)
+        .offset(offset)
+        .order_by(Stock.id.asc())  # type: ignore
+    )
     return stmt
 
 
-def get_decrement_stock_quantity_stmt(book_id: int) -> Update:
-    """This function return update stock quantity statement.
+def get_stocks_export_stmt() -> Select[Any]:
+    """This function returns a select statement to get the columns of all the stocks, for
+       their export.
+
+    Returns:
+        Select[Any]: Select statement for all the stocks in id order.
+    """
+    stmt: Select[Any] = cached_statement(
+        lambda: select(*STOCK_OUT_COLUMNS)  # type: ignore
+        .join(Book, Stock.book_id == Book.id)  # type: ignore
+        .order_by(Stock.id.asc())  # type: ignore
+    )
+    return stmt
+
+
+def get_stocks_stmt_with_limit_and_cursor(
+    *, cursor_id: int, is_previous: bool, limit: int
+) -> Select[Any]:
+    """This function returns a select statement to get the columns of the stocks after a cursor.
+
+    The stocks are seeked on the id primary key instead of skipping the rows of the previous
+    pages. A previous cursor gets the stocks before it, in descending id order.
+
+    Args:
+        cursor_id (int): Id of the cursor.
+        is_previous (bool): Whether the cursor is a previous cursor.
+        limit (int): Limit value.
+
+    Returns:
+        Select[Any]: Select statement for the stocks of the page.
+    """
+    if is_previous:
+        stmt: Select[Any] = cached_statement(
+            lambda: select(*STOCK_OUT_COLUMNS)  # type: ignore
+            .join(Book, Stock.book_id == Book.id)  # type: ignore
+            .where(Stock.id < cursor_id)  # type: ignore
+            .order_by(Stock.id.desc())  # type: ignore
+            .limit(limit)
+        )
+    else:
+        stmt = cached_statement(
+            lambda: select(*STOCK_OUT_COLUMNS)  # type: ignore
+            .join(Book, Stock.book_id == Book.id)  # type: ignore
+            .where(Stock.id > cursor_id)  # type: ignore
+            .order_by(Stock.id.asc())  # type: ignore
+            .limit(limit)
+        )
+    return stmt
+
+
+def get_decrement_stock_quantity_stmt(book_id: int) -> ReturningUpdate[tuple[int]]:
+    """This function return update stock quantity statement, only for an available book.
+
+    The availability check and the decrement are one statement: a book out of stock is not
+    updated and no row is returned, whatever the concurrent reservations.
 
     Args:
         book_id (int): Stock quantity to be decremented
 
     Returns:
-         Update: Update statement
+         ReturningUpdate[tuple[int]]: Update statement returning the new stock quantity
     """
-    stmt = (
-        update(Stock)
-        .where(Stock.book_id == book_id)  # type: ignore
+    stmt: ReturningUpdate[tuple[int]] = cached_statement(
+        lambda: update(Stock)
+        .where(Stock.book_id == book_id, Stock.stock_quantity > 0)  # type: ignore
         .values(stock_quantity=Stock.stock_quantity - 1)
+        .returning(Stock.stock_quantity)
     )
     return stmt
 
 
+def get_decrement_available_stocks_stmt(
+    *, user_id: int, book_ids: list[int]
+) -> ReturningUpdate[tuple[int]]:
+    """This function return update stock quantity statement of several books, only for the
+       available books which the user has not borrowed yet.
+
+    Args:
+        user_id (int): User ID
+        book_ids (list[int]): Book IDs
+
+    Returns:
+         ReturningUpdate[tuple[int]]: Update statement returning the book IDs of the
+                                      decremented stocks
+    """
+    stmt: ReturningUpdate[tuple[int]] = cached_statement(
+        lambda: update(Stock)
+        .where(
+            Stock.book_id.in_(book_ids),  # type: ignore
+            Stock.stock_quantity > 0,  # type: ignore
+            ~exists().where(
+                Reservation.user_id == user_id,  # type: ignore
+                Reservation.book_id == Stock.book_id,  # type: ignore
+                Reservation.returned_at.is_(None),  # type: ignore
+            ),
+        )
+        .values(stock_quantity=Stock.stock_quantity - 1)
+        .returning(Stock.book_id)
+    )
+    return stmt
+
+
+def get_stocks_from_book_ids_stmt(book_ids: list[int]) -> SelectOfScalar[Stock]:
+    """This function returns a select statement to get the Stocks of several books.
+
+    Args:
+        book_ids (list[int]): Book IDs
+
+    Returns:
+        SelectOfScalar[Stock]: Select statement for Stocks.
+    """
+    stmt = cached_statement(lambda: select(Stock).where(Stock.book_id.in_(book_ids)))  # type: ignore
+    return stmt
+
+
 def get_increment_stock_quantity_stmt(book_id: int) -> Update:
     """This function return update stock quantity statement.
 
@@ -68,14 +230,43 @@ def get_increment_stock_quantity_stmt(book_id: int) -> Update:
     Returns:
          Update: Update statement
     """
-    stmt = (
-        update(Stock)
+    stmt = cached_statement(
+        lambda: update(Stock)
         .where(Stock.book_id == book_id)  # type: ignore
         .values(stock_quantity=Stock.stock_quantity + 1)
     )
     return stmt
 
 
+def get_increment_returned_stocks_stmt(
+    *, book_ids: list[int], reservation_ids: list[int]
+) -> Update:
+    """This function return update stock quantity statement of several books, each stock is
+       incremented by its number of returned reservations.
+
+    Args:
+        book_ids (list[int]): Book IDs of the returned reservations.
+        reservation_ids (list[int]): IDs of the returned reservations.
+
+    Returns:
+         Update: Update statement
+    """
+    stmt = cached_statement(
+        lambda: update(Stock)
+        .where(Stock.book_id.in_(book_ids))  # type: ignore
+        .values(
+            stock_quantity=Stock.stock_quantity
+            + select(func.count())
+            .where(
+                Reservation.book_id == Stock.book_id,  # type: ignore
+                Reservation.id.in_(reservation_ids),  # type: ignore
+            )
+            .scalar_subquery()
+        )
+    )
+    return stmt
+
+
 def get_add_new_stock_quantity_stmt(book_id: int, stock_quantity: int) -> Update:
     """This function return update stock quantity statement.
 
@@ -86,9 +277,27 @@ def get_add_new_stock_quantity_stmt(book_id: int, stock_quantity: int) -> Update
     Returns:
          Update: Update statement
     """
-    stmt = (
-        update(Stock)
+    stmt = cached_statement(
+        lambda: update(Stock)
         .where(Stock.book_id == book_id)  # type: ignore
         .values(stock_quantity=Stock.stock_quantity + stock_quantity)
     )
     return stmt
+
+
+def get_insert_stocks_stmt() -> ReturningInsert[Any]:
+    """This function returns an insert statement of several stocks, the values of the
+       stocks are given when executing it.
+
+    The statement is not a cached lambda statement, the ORM bulk insert of the rows given
+    when executing it does not support them. Its compiled form is cached by SQLAlchemy.
+
+    Returns:
+        ReturningInsert[Any]: Insert statement returning the ID and the unique key (book ID) of
+                              each stock.
+    """
+    stmt: ReturningInsert[Any] = insert(Stock).returning(
+        Stock.id,  # type: ignore
+        Stock.book_id,  # type: ignore
+    )
+    return stmt
@@ -0,0 +1,43 @@
+from typing import Any
+
+from sqlmodel import select
+from sqlmodel.sql._expression_select_cls import Select, SelectOfScalar
+
+from src.db.models.table_count import TableCount
+from src.db.statement_cache import cached_statement
+
+
+def get_table_count_stmt(table_name: str) -> SelectOfScalar[int]:
+    """This function returns a select statement to get the row count of a table.
+
+    The counts are maintained by the insert and delete triggers of the tables, reading one is a
+    primary key lookup instead of a ``COUNT(*)`` over the whole table.
+
+    Args:
+        table_name (str): Table name.
+
+    Returns:
+        SelectOfScalar[int]: Select statement for the row count of the table.
+    """
+    stmt = cached_statement(
+        lambda: select(TableCount.row_count).where(TableCount.table_name == table_name)
+    )
+    return stmt
+
+
+def get_table_changes_stmt(table_names: list[str]) -> Select[Any]:
+    """This function returns a select statement to get the change count and time of tables.
+
+    Args:
+        table_names (list[str]): Table names.
+
+    Returns:
+        Select[Any]: Select statement for the change count and time of the tables, in the
+                     order of their names.
+    """
+    stmt = cached_statement(
+        lambda: select(TableCount.change_count, TableCount.changed_at)
+        .where(TableCount.table_name.in_(table_names))  # type: ignore
+        .order_by(TableCount.table_name)
+    )
+    return stmt
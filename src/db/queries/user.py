@@ -1,8 +1,16 @@
-from sqlalchemy import func
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.sql.dml import ReturningInsert
 from sqlmodel import select
-from sqlmodel.sql._expression_select_cls import SelectOfScalar
+from sqlmodel.sql._expression_select_cls import Select, SelectOfScalar
 
 from src.db.models.user import User
+from src.db.queries.table_count import get_table_count_stmt
+from src.db.statement_cache import cached_statement
+
+# Columns of `UserOut`, the rows of the list statements are read with `fetch_rows`
+USER_OUT_COLUMNS = (User.id, User.first_name, User.last_name, User.email)
 
 
 def get_user_from_id_stmt(user_id: int) -> SelectOfScalar[User]:
@@ -14,7 +22,22 @@ def get_user_from_id_stmt(user_id: int) -> SelectOfScalar[User]:
     Returns:
         SelectOfScalar[User]: Select statement for user.
     """
-    stmt = select(User).where(User.id == user_id)
+    stmt = cached_statement(lambda: select(User).where(User.id == user_id))
+    return stmt
+
+
+def get_user_version_stmt(user_id: int) -> Select[Any]:
+    """This function returns a select statement to get the id and update time of the User.
+
+    Args:
+        user_id (int): The user id
+
+    Returns:
+        Select[Any]: Select statement for the version of the user, a primary key lookup.
+    """
+    stmt: Select[Any] = cached_statement(
+        lambda: select(User.id, User.updated_at).where(User.id == user_id)  # type: ignore
+    )
     return stmt
 
 
@@ -24,19 +47,90 @@ def get_user_count_stmt() -> SelectOfScalar[int]:
     Returns:
         SelectOfScalar[int]: Select statement for the count of user.
     """
-    stmt = select(func.count().label("user_count")).select_from(User)
+    stmt = get_table_count_stmt(User.__tablename__)
     return stmt
 
 
-def get_users_stmt_with_limit_and_offset(*, offset: int, limit: int) -> SelectOfScalar[User]:
-    """This function returns a select statement to get all users with pagination.
+def get_users_stmt_with_limit_and_offset(*, offset: int, limit: int) -> Select[Any]:
+    """This function returns a select statement to get the columns of all users with pagination.
+
+    Only the columns of `UserOut` are selected, the rows are read with `fetch_rows`.
 
     Args:
         offset (int): Offset value.
         limit (int): Limit value.
 
     Returns:
-        SelectOfScalar[User]: Select statement for all users.
+        Select[Any]: Select statement for all users.
+    """
+    stmt: Select[Any] = cached_statement(
+        lambda: select(*USER_OUT_COLUMNS)  # type: ignore
+        .limit(limit)
+        .offset(offset)
+        .order_by(User.id.asc())  # type: ignore
+    )
+    return stmt
+
+
+def get_users_export_stmt() -> Select[Any]:
+    """This function returns a select statement to get the columns of all the users, for
+       their export.
+
+    Returns:
+        Select[Any]: Select statement for all the users in id order.
+    """
+    stmt: Select[Any] = cached_statement(
+        lambda: select(*USER_OUT_COLUMNS).order_by(User.id.asc())  # type: ignore
+    )
+    return stmt
+
+
+def get_users_stmt_with_limit_and_cursor(
+    *, cursor_id: int, is_previous: bool, limit: int
+) -> Select[Any]:
+    """This function returns a select statement to get the columns of the users after a cursor.
+
+    The users are seeked on the id primary key instead of skipping the rows of the previous
+    pages. A previous cursor gets the users before it, in descending id order.
+
+    Args:
+        cursor_id (int): Id of the cursor.
+        is_previous (bool): Whether the cursor is a previous cursor.
+        limit (int): Limit value.
+
+    Returns:
+        Select[Any]: Select statement for the users of the page.
+    """
+    if is_previous:
+        stmt: Select[Any] = cached_statement(
+            lambda: select(*USER_OUT_COLUMNS)  # type: ignore
+            .where(User.id < cursor_id)  # type: ignore
+            .order_by(User.id.desc())  # type: ignore
+            .limit(limit)
+        )
+    else:
+        stmt = cached_statement(
+            lambda: select(*USER_OUT_COLUMNS)  # type: ignore
+            .where(User.id > cursor_id)  # type: ignore
+            .order_by(User.id.asc())  # type: ignore
+            .limit(limit)
+        )
+    return stmt
+
+
+def get_insert_users_stmt() -> ReturningInsert[Any]:
+    """This function returns an insert statement of several users, the values of the
+       users are given when executing it.
+
+    The statement is not a cached lambda statement, the ORM bulk insert of the rows given
+    when executing it does not support them. Its compiled form is cached by SQLAlchemy.
+
+    Returns:
+        ReturningInsert[Any]: Insert statement returning the ID and the unique key (email) of
+                              each user.
     """
-    stmt = select(User).limit(limit).offset(offset).order_by(User.id.asc())  # type: ignore
+    stmt: ReturningInsert[Any] = insert(User).returning(
+        User.id,  # type: ignore
+        User.email,  # type: ignore
+    )
     return stmt
@@ -0,0 +1,176 @@
+import logging
+import threading
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, Callable
+
+from sqlalchemy import Engine
+from sqlmodel import Session
+from sqlmodel.sql._expression_select_cls import SelectOfScalar
+
+from src.db.engine import db_dependency, get_db_engine
+from src.db.execution import fetch_all
+from src.db.queries.reservation_status import get_reservation_status_stmt
+from src.exceptions.app import SqlException
+from src.models.http_response_code import HTTPResponseCode
+from src.models.reservation_status import ReservationStatus
+
+logger = logging.getLogger("app")
+
+RESERVATION_STATUS = "reservation_status"
+
+
+@dataclass(frozen=True)
+class LookupTable:
+    """Rows of a lookup table, indexed by ID and by name."""
+
+    names: dict[int, str]
+    ids: dict[str, int]
+
+    @classmethod
+    def from_names(cls, names: dict[int, str]) -> "LookupTable":
+        """Build the lookup table from the names of its rows by ID."""
+        return cls(names=names, ids={name: row_id for row_id, name in names.items()})
+
+    def get_name(self, row_id: int) -> str:
+        """Get the name of a row from its ID."""
+        return self.names[row_id]
+
+    def get_id(self, name: str) -> int:
+        """Get the ID of a row from its name."""
+        return self.ids[name]
+
+
+@dataclass(frozen=True)
+class LookupTableSource:
+    """Statement reading the rows (with an ``id`` and a ``name``) of a lookup table, and the
+    enum its names must match."""
+
+    get_stmt: Callable[[], SelectOfScalar[Any]]
+    enum: type[StrEnum] | None = None
+
+
+class ReferenceDataRegistry:
+    """Lookup tables of the database, read once and then looked up in memory.
+
+    The tables are loaded by the application startup, before any request, and can be
+    reloaded with `load` without a restart: the new tables replace the previous ones at once,
+    a request sees either of them. A table which is not loaded yet (an engine without the
+    startup, e.g. the tests) is read with the session of its first caller.
+
+    No lock is held while reading the database: in async mode the operations of several
+    requests share the event loop thread.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sources: dict[str, LookupTableSource] = {}
+        self._tables: dict[str, LookupTable] = {}
+
+    def register(
+        self,
+        name: str,
+        get_stmt: Callable[[], SelectOfScalar[Any]],
+        enum: type[StrEnum] | None = None,
+    ) -> None:
+        """Register a lookup table.
+
+        Args:
+            name (str): Name of the table.
+            get_stmt (Callable[[], SelectOfScalar[Any]]): Builder of the statement reading
+                                                          its rows.
+            enum (type[StrEnum] | None, optional): Enum whose values must be the names of the
+                                                   rows. Defaults to None.
+        """
+        self._sources[name] = LookupTableSource(get_stmt=get_stmt, enum=enum)
+
+    def load(self, db_session: db_dependency) -> dict[str, LookupTable]:
+        """Read every registered lookup table and replace the loaded ones.
+
+        Args:
+            db_session (db_dependency): Database session.
+
+        Raises:
+            SqlException: The names of a table do not match its enum.
+
+        Returns:
+            dict[str, LookupTable]: Loaded tables by name.
+        """
+        tables = {
+            name: read_lookup_table(db_session, name, source)
+            for name, source in self._sources.items()
+        }
+        with self._lock:
+            self._tables = tables
+        return tables
+
+    def get(self, db_session: db_dependency, name: str) -> LookupTable:
+        """Get a lookup table, read with the session if it is not loaded yet.
+
+        Args:
+            db_session (db_dependency): Database session.
+            name (str): Name of the table.
+
+        Returns:
+            LookupTable: Lookup table.
+        """
+        table = self._tables.get(name)
+        if table is None:
+            table = read_lookup_table(db_session, name, self._sources[name])
+            with self._lock:
+                self._tables = {**self._tables, name: table}
+        return table
+
+
+def read_lookup_table(
+    db_session: db_dependency, name: str, source: LookupTableSource
+) -> LookupTable:
+    """Read the rows of a lookup table and check them against its enum.
+
+    Args:
+        db_session (db_dependency): Database session.
+        name (str): Name of the table.
+        source (LookupTableSource): Statement and enum of the table.
+
+    Raises:
+        SqlException: The names of the table do not match its enum.
+
+    Returns:
+        LookupTable: Lookup table.
+    """
+    table = LookupTable.from_names(
+        {row.id: row.name for row in fetch_all(db_session, source.get_stmt())}
+    )
+    if source.enum is None:
+        return table
+
+    enum_names = {member.value for member in source.enum}
+    if set(table.ids) != enum_names:
+        raise SqlException(
+            status_code=HTTPResponseCode.INTERNAL_SERVER_ERROR,
+            message=(
+                f"{name} rows {sorted(table.ids)} do not match "
+                f"{source.enum.__name__} {sorted(enum_names)}"
+            ),
+        )
+    return table
+
+
+reference_data = ReferenceDataRegistry()
+reference_data.register(RESERVATION_STATUS, get_reservation_status_stmt, ReservationStatus)
+
+
+def get_reservation_statuses(db_session: db_dependency) -> LookupTable:
+    """Get the reservation statuses, see `ReferenceDataRegistry.get`."""
+    return reference_data.get(db_session, RESERVATION_STATUS)
+
+
+def load_reference_data(engine: Engine | None = None) -> None:
+    """Load the lookup tables at startup, and check them against their enums.
+
+    Args:
+        engine (Engine | None, optional): Engine to read. Defaults to the application engine.
+    """
+    with Session(engine or get_db_engine()) as db_session:
+        tables = reference_data.load(db_session)
+    logger.info(f"Reference data loaded ({', '.join(tables)}).")
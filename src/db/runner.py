@@ -0,0 +1,281 @@
+import asyncio
+import functools
+from abc import ABC, abstractmethod
+from collections.abc import Generator
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterator,
+    Callable,
+    Concatenate,
+    Iterator,
+    ParamSpec,
+    TypeVar,
+    cast,
+)
+
+from fastapi import Depends
+from sqlmodel import Session
+
+from src.config.config import APP_CONFIG
+from src.db.engine import async_db_dependency, db_dependency, db_writer_engine_dependency
+from src.db.executor import DatabaseExecutor, get_db_executor
+from src.db.group_commit import GroupCommitter, get_group_committer, is_group_commit_enabled
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Returned by `next_item` once the iteration of an operation is over
+END_OF_ITERATION = object()
+
+
+class DatabaseRunner(ABC):
+    """Run the database operations of `src.db.operations` from the async route handlers.
+
+    The operations are plain functions taking a session as first argument, the runner decides
+    where they run so that the routers stay the same whatever the execution mode.
+
+    The session is closed once the operation is done, its connection goes back to the pool
+    (the single SQLite writer connection above all) without waiting for the end of the
+    request. The operations return pydantic models, not the ORM objects of the session.
+    """
+
+    @abstractmethod
+    async def run(
+        self,
+        operation: Callable[Concatenate[Session, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        """Run a database operation.
+
+        Args:
+            operation (Callable[Concatenate[Session, P], R]): Operation to run, the session is
+                                                              passed as first argument.
+            *args (P.args): Positional arguments of the operation.
+            **kwargs (P.kwargs): Keyword arguments of the operation.
+
+        Returns:
+            R: Result of the operation.
+        """
+
+    @abstractmethod
+    def stream(
+        self,
+        operation: Callable[Concatenate[Session, P], Iterator[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> AsyncIterator[R]:
+        """Iterate over the items of a database operation, such as the batches of an export.
+
+        The iteration may go on after the route handler returned (a streamed response body),
+        the session is used again by the runner although the request dependency closed it,
+        and closed once the iteration ends.
+
+        Args:
+            operation (Callable[Concatenate[Session, P], Iterator[R]]): Operation to iterate
+                                                                        over, the session is
+                                                                        passed as first
+                                                                        argument.
+            *args (P.args): Positional arguments of the operation.
+            **kwargs (P.kwargs): Keyword arguments of the operation.
+
+        Returns:
+            AsyncIterator[R]: Items of the operation.
+        """
+
+
+def run_and_close_session(operation: Callable[[], R], db_session: Session) -> R:
+    """Run a database operation bound to its session, then close the session."""
+    try:
+        return operation()
+    finally:
+        db_session.close()
+
+
+def next_item(_db_session: Session, iterator: Iterator[R]) -> R | object:
+    """Get the next item of the iteration of a database operation, `END_OF_ITERATION` at its
+    end."""
+    return next(iterator, END_OF_ITERATION)
+
+
+def close_iteration_and_session(db_session: Session, iterator: Iterator[Any]) -> None:
+    """Close the iteration of a database operation (its cursor), then close the session."""
+    try:
+        if isinstance(iterator, Generator):
+            iterator.close()
+    finally:
+        db_session.close()
+
+
+class SyncDatabaseRunner(DatabaseRunner):
+    """Run the operations inline with a synchronous session (blocks the event loop)."""
+
+    def __init__(self, db_session: Session) -> None:
+        self.db_session = db_session
+
+    async def run(
+        self,
+        operation: Callable[Concatenate[Session, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        job = functools.partial(operation, self.db_session, *args, **kwargs)
+        return run_and_close_session(job, self.db_session)
+
+    async def stream(
+        self,
+        operation: Callable[Concatenate[Session, P], Iterator[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> AsyncIterator[R]:
+        iterator = operation(self.db_session, *args, **kwargs)
+        try:
+            for item in iterator:
+                yield item
+        finally:
+            close_iteration_and_session(self.db_session, iterator)
+
+
+class AsyncDatabaseRunner(DatabaseRunner):
+    """Run the operations through an async session and the asyncio driver of the backend.
+
+    The operation code is the synchronous one, executed by `AsyncSession.run_sync` in a
+    greenlet, so every query it makes is awaited and the event loop is never blocked.
+    """
+
+    def __init__(self, db_session: async_db_dependency) -> None:
+        self.db_session = db_session
+
+    async def run(
+        self,
+        operation: Callable[Concatenate[Session, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        try:
+            # run_sync passes the sqlmodel Session (`AsyncSession.sync_session_class`)
+            return await self.db_session.run_sync(operation, *args, **kwargs)  # type: ignore
+        finally:
+            await self.db_session.close()
+
+    async def stream(
+        self,
+        operation: Callable[Concatenate[Session, P], Iterator[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> AsyncIterator[R]:
+        iterator = operation(self.db_session.sync_session, *args, **kwargs)
+        try:
+            # Each item is fetched in its own greenlet, where the queries can be awaited
+            while (
+                item := await self.db_session.run_sync(next_item, iterator)  # type: ignore
+            ) is not END_OF_ITERATION:
+                yield cast(R, item)
+        finally:
+            await self.db_session.run_sync(close_iteration_and_session, iterator)  # type: ignore
+
+
+class ExecutorDatabaseRunner(DatabaseRunner):
+    """Run the operations with a synchronous session on the dedicated database executor.
+
+    The event loop only awaits the result, so it keeps serving the other requests while the
+    executor workers wait for the database.
+    """
+
+    def __init__(self, db_session: Session, executor: DatabaseExecutor) -> None:
+        self.db_session = db_session
+        self.executor = executor
+
+    async def run(
+        self,
+        operation: Callable[Concatenate[Session, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        job = functools.partial(operation, self.db_session, *args, **kwargs)
+        return await self.executor.run(run_and_close_session, job, self.db_session)
+
+    async def stream(
+        self,
+        operation: Callable[Concatenate[Session, P], Iterator[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> AsyncIterator[R]:
+        iterator = operation(self.db_session, *args, **kwargs)
+        try:
+            # Each item is fetched on the executor, the event loop only awaits it
+            while (
+                item := await self.executor.run(next_item, self.db_session, iterator)
+            ) is not END_OF_ITERATION:
+                yield cast(R, item)
+        finally:
+            close_iteration_and_session(self.db_session, iterator)
+
+
+class GroupCommitDatabaseRunner(DatabaseRunner):
+    """Run the operations on the group commit thread, sharing their commit with other requests.
+
+    The result is only returned once the transaction of the batch is committed. The streamed
+    operations only read, they are run by the runner of the execution mode.
+    """
+
+    def __init__(self, group_committer: GroupCommitter, db_runner: DatabaseRunner) -> None:
+        self.group_committer = group_committer
+        self.db_runner = db_runner
+
+    async def run(
+        self,
+        operation: Callable[Concatenate[Session, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        return await asyncio.wrap_future(self.group_committer.submit(operation, *args, **kwargs))
+
+    def stream(
+        self,
+        operation: Callable[Concatenate[Session, P], Iterator[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> AsyncIterator[R]:
+        return self.db_runner.stream(operation, *args, **kwargs)
+
+
+def get_sync_db_runner(db_session: db_dependency) -> DatabaseRunner:
+    """Get a runner using the synchronous session."""
+    return SyncDatabaseRunner(db_session)
+
+
+def get_async_db_runner(db_session: async_db_dependency) -> DatabaseRunner:
+    """Get a runner using the async session."""
+    return AsyncDatabaseRunner(db_session)
+
+
+def get_executor_db_runner(db_session: db_dependency) -> DatabaseRunner:
+    """Get a runner using the synchronous session on the database executor."""
+    return ExecutorDatabaseRunner(db_session, get_db_executor())
+
+
+DB_RUNNERS: dict[str, Callable[..., DatabaseRunner]] = {
+    "sync": get_sync_db_runner,
+    "async": get_async_db_runner,
+    "executor": get_executor_db_runner,
+}
+
+db_runner_dependency = Annotated[
+    DatabaseRunner, Depends(DB_RUNNERS[APP_CONFIG["database"]["execution"]["mode"]])
+]
+
+
+def get_group_commit_db_runner(
+    db_runner: db_runner_dependency, db_writer_engine: db_writer_engine_dependency
+) -> DatabaseRunner:
+    """Get the group commit runner if it is enabled, the runner of the execution mode if not."""
+    if is_group_commit_enabled():
+        return GroupCommitDatabaseRunner(get_group_committer(db_writer_engine), db_runner)
+
+    return db_runner
+
+
+# For the high-rate writes only (reservations and returns)
+group_commit_db_runner_dependency = Annotated[DatabaseRunner, Depends(get_group_commit_db_runner)]
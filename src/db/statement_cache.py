@@ -0,0 +1,123 @@
+import threading
+from types import CodeType
+from typing import Any, Callable, TypeVar, cast
+
+from sqlalchemy import Engine, event, lambda_stmt
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+S = TypeVar("S")
+
+
+class StatementCache:
+    """Build the statements of `src.db.queries` once per process and count the cache usage.
+
+    A builder wraps its statement in a lambda, SQLAlchemy analyses the lambda on its first
+    call only (keyed on its code object) and turns its closure variables into bound
+    parameters. The next calls skip building the ``select()`` and computing its cache key,
+    and the SQL compiled by the engine for the first call is reused.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._builders: set[CodeType] = set()
+        self._statement_hits = 0
+        self._statement_misses = 0
+        self._compiled_hits = 0
+        self._compiled_misses = 0
+
+    def statement(self, builder: Callable[[], S]) -> S:
+        """Get the cached statement of a builder lambda.
+
+        The returned lambda statement is executed like the statement built by the lambda,
+        it is typed as such for the callers. Select statements must be executed with
+        ``Session.scalars`` as it is not a ``SelectOfScalar``.
+
+        Args:
+            builder (Callable[[], S]): Lambda building the statement, the values it uses
+                                       must be closure variables (become bound parameters).
+
+        Returns:
+            S: Cached statement.
+        """
+        self._count_builder(builder)
+        return cast(S, lambda_stmt(builder))
+
+    def criteria(self, stmt: S, builder: Callable[[S], S]) -> S:
+        """Add criteria to a cached statement, e.g. an optional filter.
+
+        The criteria lambda is cached like the statement lambda, every combination of added
+        criteria is compiled once by the engine.
+
+        Args:
+            stmt (S): Statement returned by `statement`.
+            builder (Callable[[S], S]): Lambda getting the statement and returning it with
+                                        the criteria, the values it uses must be closure
+                                        variables.
+
+        Returns:
+            S: Cached statement with the criteria.
+        """
+        self._count_builder(builder)
+        return cast(S, cast(StatementLambdaElement, stmt).add_criteria(builder))
+
+    def _count_builder(self, builder: Callable[..., Any]) -> None:
+        """Count a statement or criteria builder as a hit or a miss."""
+        with self._lock:
+            if builder.__code__ in self._builders:
+                self._statement_hits += 1
+            else:
+                self._builders.add(builder.__code__)
+                self._statement_misses += 1
+
+    def register_engine(self, engine: Engine) -> None:
+        """Count the hits and misses of the compiled SQL cache of an engine.
+
+        Args:
+            engine (Engine): Database engine.
+        """
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def count_compiled_cache(
+            _connection: Any,
+            _cursor: Any,
+            _statement: str,
+            _parameters: Any,
+            context: Any,
+            _executemany: bool,
+        ) -> None:
+            if context is None or context.compiled is None:
+                return
+            with self._lock:
+                if context.cache_hit == CacheStats.CACHE_HIT:
+                    self._compiled_hits += 1
+                elif context.cache_hit == CacheStats.CACHE_MISS:
+                    self._compiled_misses += 1
+
+    def stats(self) -> dict[str, int]:
+        """Get the statement cache statistics.
+
+        Returns:
+            dict[str, int]: Hits and misses of the built statements and of the compiled SQL.
+        """
+        with self._lock:
+            return {
+                "statements": len(self._builders),
+                "statement_hits": self._statement_hits,
+                "statement_misses": self._statement_misses,
+                "compiled_hits": self._compiled_hits,
+                "compiled_misses": self._compiled_misses,
+            }
+
+
+statement_cache = StatementCache()
+
+
+def cached_statement(builder: Callable[[], S]) -> S:
+    """Get the cached statement of a builder lambda, see `StatementCache.statement`."""
+    return statement_cache.statement(builder)
+
+
+def cached_criteria(stmt: S, builder: Callable[[S], S]) -> S:
+    """Add criteria to a cached statement, see `StatementCache.criteria`."""
+    return statement_cache.criteria(stmt, builder)
@@ -0,0 +1,97 @@
+from typing import Any, Callable
+
+from sqlalchemy import Connection, event
+from sqlalchemy.orm import Mapper, ORMExecuteState, Session
+
+# Session info key of the tables written by the current transaction
+CHANGED_TABLES = "changed_tables"
+
+TableChangeListener = Callable[[set[str]], None]
+
+_listeners: list[TableChangeListener] = []
+
+
+def add_table_change_listener(listener: TableChangeListener) -> None:
+    """Call a listener with the names of the tables written by every committed transaction.
+
+    Args:
+        listener (TableChangeListener): Called with the names of the written tables.
+    """
+    _listeners.append(listener)
+
+
+def flag_changed_table(info: dict[Any, Any], table_name: str) -> None:
+    """Record a table written by the transaction of a session."""
+    info.setdefault(CHANGED_TABLES, set()).add(table_name)
+
+
+def notify_table_changes(tables: set[str]) -> None:
+    """Call the listeners with the tables written by a committed transaction."""
+    if tables:
+        for listener in _listeners:
+            listener(tables)
+
+
+def pop_changed_tables(db_session: Session) -> set[str]:
+    """Get and forget the tables written by a session and not notified yet.
+
+    Args:
+        db_session (Session): Database session.
+
+    Returns:
+        set[str]: Names of the written tables.
+    """
+    tables: set[str] = db_session.info.pop(CHANGED_TABLES, set())
+    return tables
+
+
+def is_in_outer_transaction(db_session: Session) -> bool:
+    """Whether the session runs in a savepoint of a transaction it does not commit."""
+    return isinstance(db_session.bind, Connection) and db_session.bind.in_transaction()
+
+
+def flag_row_change(mapper: Mapper[Any], _connection: Any, target: Any) -> None:
+    """Flag the table of a row written by the unit of work."""
+    session = Session.object_session(target)
+    if session is not None:
+        flag_changed_table(session.info, mapper.local_table.name)  # type: ignore
+
+
+def flag_statement_change(orm_execute_state: ORMExecuteState) -> None:
+    """Flag the table of an insert, update or delete statement."""
+    if orm_execute_state.is_select:
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None:
+        flag_changed_table(orm_execute_state.session.info, table.name)
+
+
+def notify_after_commit(session: Session) -> None:
+    """Notify the tables written by a committed session."""
+    if not is_in_outer_transaction(session):
+        notify_table_changes(pop_changed_tables(session))
+
+
+def forget_after_rollback(session: Session) -> None:
+    """Forget the tables written by a rolled back session."""
+    if not is_in_outer_transaction(session):
+        pop_changed_tables(session)
+
+
+def register_table_change_tracking() -> None:
+    """Track the tables written through the sessions, and notify them once committed.
+
+    The rows written by the unit of work and the ORM-enabled or Core insert, update and
+    delete statements flag their table in the session, the listeners are called after the
+    commit: a reader of the database sees the new rows once they are notified. A session
+    running in a savepoint of an outer transaction (the group commit) keeps its tables, the
+    owner of the transaction notifies them after its own commit (see `pop_changed_tables`).
+    """
+    for identifier in ("after_insert", "after_update", "after_delete"):
+        event.listen(Mapper, identifier, flag_row_change)
+    event.listen(Session, "do_orm_execute", flag_statement_change)
+    event.listen(Session, "after_commit", notify_after_commit)
+    event.listen(Session, "after_rollback", forget_after_rollback)
+
+
+register_table_change_tracking()
@@ -74,3 +74,9 @@ class ReservationException(AppException):
     """ReservationException base class"""
 
     pass
+
+
+class ServiceUnavailableException(AppException):
+    """ServiceUnavailableException base class"""
+
+    pass
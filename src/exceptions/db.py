@@ -18,6 +18,18 @@ def handle_db_exception(db_session: db_dependency, exc: Exception) -> None:
         SqlException: Raise SqlException
     """
     db_session.rollback()
+    raise_sql_exception(exc)
+
+
+def raise_sql_exception(exc: Exception) -> None:
+    """Logs the database error and raises it as an SqlException.
+
+    Args:
+        exc (Exception): SQlalchemy Exception
+
+    Raises:
+        SqlException: Raise SqlException
+    """
     error_type = exc.__class__.__name__
     logger.error(f"{error_type} occurred: {exc}")
     raise SqlException(
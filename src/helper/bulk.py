@@ -0,0 +1,148 @@
+from typing import Any, AsyncIterator, Callable, Sequence, TypeVar
+
+from fastapi import Request
+from pydantic import BaseModel, ValidationError
+from sqlmodel import Session
+
+from src.config.config import APP_CONFIG
+from src.db.runner import DatabaseRunner
+from src.models.bulk import BulkCreateItem, BulkCreateOut
+from src.models.http_response_code import HTTPResponseCode
+
+M = TypeVar("M", bound=BaseModel)
+
+# The bulk request bodies have one JSON object per line
+BULK_MEDIA_TYPE = "application/x-ndjson"
+
+
+def bulk_openapi_extra(model_type: type[BaseModel]) -> dict[str, Any]:
+    """Get the OpenAPI request body of a bulk route, the route reads its body itself.
+
+    Args:
+        model_type (type[BaseModel]): Input model of each line, already in the schemas.
+
+    Returns:
+        dict[str, Any]: `openapi_extra` of the route.
+    """
+    schema = {"$ref": f"#/components/schemas/{model_type.__name__}"}
+    return {"requestBody": {"required": True, "content": {BULK_MEDIA_TYPE: {"schema": schema}}}}
+
+
+async def iter_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Split a byte stream into lines as it is received, without reading it whole.
+
+    Args:
+        stream (AsyncIterator[bytes]): Byte stream, such as `Request.stream()`.
+
+    Yields:
+        bytes: Each line, without its line break.
+    """
+    # Parts of the current line, joined once its end is received
+    pending: list[bytes] = []
+    async for data in stream:
+        *lines, rest = data.split(b"\n")
+        for line in lines:
+            pending.append(line)
+            yield b"".join(pending)
+            pending = []
+        if rest:
+            pending.append(rest)
+
+    if pending:
+        yield b"".join(pending)
+
+
+def get_validation_message(exc: ValidationError) -> str:
+    """Get the message of a validation error of a line.
+
+    Args:
+        exc (ValidationError): Validation error.
+
+    Returns:
+        str: The errors of the line, with the field of each one.
+    """
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+        if error["loc"]
+        else error["msg"]
+        for error in exc.errors(include_url=False)
+    )
+
+
+async def read_bulk_chunks(  # noqa: PLR0915
+    stream: AsyncIterator[bytes], model_type: type[M], chunk_size: int
+) -> AsyncIterator[tuple[list[tuple[int, M]], list[BulkCreateItem]]]:
+    """Parse a bulk request body one chunk of rows at a time.
+
+    Each line is validated on its own, the lines which are not valid are failures of the chunk
+    and the blank lines are skipped. The lines are numbered from 1.
+
+    Args:
+        stream (AsyncIterator[bytes]): Byte stream of the request body.
+        model_type (type[M]): Input model of each line.
+        chunk_size (int): Number of valid rows of each chunk.
+
+    Yields:
+        tuple[list[tuple[int, M]], list[BulkCreateItem]]: The line and the model of the valid
+                                                           rows, the failures of the others.
+    """
+    rows: list[tuple[int, M]] = []
+    failures: list[BulkCreateItem] = []
+    line_number = 0
+    async for line in iter_lines(stream):
+        line_number += 1
+        if not line.strip():
+            continue
+
+        try:
+            rows.append((line_number, model_type.model_validate_json(line)))
+        except ValidationError as exc:
+            failures.append(
+                BulkCreateItem.trusted(
+                    line=line_number,
+                    status_code=HTTPResponseCode.BAD_REQUEST,
+                    message=get_validation_message(exc),
+                    id=None,
+                )
+            )
+
+        if len(rows) == chunk_size:
+            yield rows, failures
+            rows, failures = [], []
+
+    if rows or failures:
+        yield rows, failures
+
+
+async def create_in_bulk(
+    request: Request,
+    db_runner: DatabaseRunner,
+    model_type: type[M],
+    operation: Callable[[Session, Sequence[tuple[int, M]]], list[BulkCreateItem]],
+) -> BulkCreateOut:
+    """Create the rows of a bulk request body, read and inserted one chunk at a time.
+
+    Only one chunk of the body is held at a time, each chunk is inserted in its own
+    transaction: the chunks committed before a failure of the database stay committed.
+
+    Args:
+        request (Request): Request whose body has one row per line.
+        db_runner (DatabaseRunner): Runner of the database operations.
+        model_type (type[M]): Input model of each row.
+        operation (Callable[[Session, Sequence[tuple[int, M]]], list[BulkCreateItem]]):
+            Operation inserting a chunk of rows.
+
+    Returns:
+        BulkCreateOut: Result of each row.
+    """
+    chunk_size: int = APP_CONFIG["database"]["bulk"]["chunk_size"]
+    items: list[BulkCreateItem] = []
+    async for rows, failures in read_bulk_chunks(request.stream(), model_type, chunk_size):
+        items.extend(failures)
+        if rows:
+            items.extend(await db_runner.run(operation, rows))
+
+    items.sort(key=lambda item: item.line)
+    return BulkCreateOut.trusted(
+        number_of_created=sum(item.id is not None for item in items), items=items
+    )
@@ -0,0 +1,289 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, Mapping, NamedTuple, Sequence
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from sqlmodel import Session
+
+from src.db.execution import fetch_rows
+from src.db.queries.table_count import get_table_changes_stmt
+from src.db.runner import DatabaseRunner
+from src.helper.response import ModelJSONResponse
+from src.models.http_response_code import HTTPResponseCode
+
+# The clients may keep the responses but must revalidate them before any use
+CACHE_CONTROL = "private, no-cache"
+
+# Origin of the versions of the entities, the timestamp columns are naive UTC
+EPOCH = datetime(1970, 1, 1)
+
+
+class Validators(NamedTuple):
+    """ETag and Last-Modified of a response, from the changes of the tables it is read from
+    or from the update time of its entity."""
+
+    etag: str
+    last_modified: datetime | None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Headers of the responses with the validators."""
+        headers = {"ETag": self.etag, "Cache-Control": CACHE_CONTROL}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                self.last_modified.replace(tzinfo=timezone.utc), usegmt=True
+            )
+        return headers
+
+
+class Preconditions(NamedTuple):
+    """Conditional headers of a GET request."""
+
+    if_none_match: set[str] | None
+    if_modified_since: datetime | None
+
+    @classmethod
+    def from_request(cls, request: Request) -> "Preconditions":
+        """Read the conditional headers of a request, an invalid date is ignored.
+
+        Args:
+            request (Request): Request.
+
+        Returns:
+            Preconditions: Entity tags of If-None-Match (weak or not, compared the same way)
+                           and date of If-Modified-Since (UTC), None when absent.
+        """
+        if_none_match = request.headers.get("if-none-match")
+        if_modified_since = request.headers.get("if-modified-since")
+        return cls(
+            if_none_match=(
+                {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+                if if_none_match is not None
+                else None
+            ),
+            if_modified_since=get_http_date(if_modified_since) if if_modified_since else None,
+        )
+
+    def is_not_modified(self, validators: Validators) -> bool:
+        """Evaluate the conditions, If-Modified-Since is ignored with If-None-Match (RFC 9110).
+
+        Args:
+            validators (Validators): Validators of the current response.
+
+        Returns:
+            bool: True if the response of the client is still the current one.
+        """
+        if self.if_none_match is not None:
+            return validators.etag.removeprefix("W/") in self.if_none_match
+        if self.if_modified_since is not None and validators.last_modified is not None:
+            return validators.last_modified.replace(microsecond=0) <= self.if_modified_since
+        return False
+
+
+def get_http_date(value: str) -> datetime | None:
+    """Parse an HTTP date to a naive UTC datetime, None if invalid."""
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return date.astimezone(timezone.utc).replace(tzinfo=None) if date.tzinfo else date
+
+
+def get_change_version(change: Mapping[Any, Any]) -> str:
+    """Get the version of a table from its change count and time (epoch seconds).
+
+    The count alone restarts with a new or restored database, the time of the last change
+    tells its versions apart from the ones the clients got before.
+    """
+    changed_at: datetime | None = change["changed_at"]
+    epoch = int(changed_at.replace(tzinfo=timezone.utc).timestamp()) if changed_at else 0
+    return f"{change['change_count']}-{epoch}"
+
+
+def get_validators(changes: Sequence[Mapping[Any, Any]]) -> Validators:
+    """Get the validators of a response from the changes of its tables.
+
+    The ETag is made of the change counts and times of the tables, any write to one of them
+    changes it. Last-Modified is the time of the last change (one second precision), unknown
+    if a table has no change time.
+
+    Args:
+        changes (Sequence[Mapping[Any, Any]]): Change count and time of each table.
+
+    Returns:
+        Validators: Validators of the response.
+    """
+    changed_at = [change["changed_at"] for change in changes]
+    return Validators(
+        etag=f'W/"{".".join(get_change_version(change) for change in changes)}"',
+        last_modified=max(changed_at) if None not in changed_at else None,
+    )
+
+
+def get_entity_validators(version: Mapping[Any, Any]) -> Validators:
+    """Get the validators of a single entity from its id and update time.
+
+    The ETag is made of the id and the update time of the entity (microseconds since the
+    epoch), it only changes with the entity and not with the other rows of its table.
+    Last-Modified is its update time.
+
+    Args:
+        version (Mapping[Any, Any]): Id and update time of the entity.
+
+    Returns:
+        Validators: Validators of the response.
+    """
+    updated_at: datetime = version["updated_at"]
+    microseconds = (updated_at - EPOCH) // timedelta(microseconds=1)
+    return Validators(etag=f'W/"{version["id"]}-{microseconds}"', last_modified=updated_at)
+
+
+def read_if_modified(
+    db_session: Session,
+    table_names: list[str],
+    preconditions: Preconditions,
+    operation: Callable[..., BaseModel],
+    *args: Any,
+    **kwargs: Any,
+) -> tuple[Validators | None, BaseModel | None]:
+    """Read the validators of the tables, then run the operation unless not modified.
+
+    The validators are read before the response: a write in between makes the client get
+    the new response with the previous validators, and revalidate it on the next request.
+
+    Args:
+        db_session (Session): Database session.
+        table_names (list[str]): Tables the response is read from.
+        preconditions (Preconditions): Conditional headers of the request.
+        operation (Callable[..., BaseModel]): Operation reading the response.
+        *args (Any): Positional arguments of the operation.
+        **kwargs (Any): Keyword arguments of the operation.
+
+    Returns:
+        tuple[Validators | None, BaseModel | None]: Validators (None if a table is not
+                                                    tracked) and response, None if not
+                                                    modified.
+    """
+    changes = fetch_rows(db_session, get_table_changes_stmt(table_names))
+    # A table without changes row (not tracked) has no validators
+    validators = get_validators(changes) if len(changes) == len(table_names) else None
+    if validators is not None and preconditions.is_not_modified(validators):
+        return validators, None
+    return validators, operation(db_session, *args, **kwargs)
+
+
+def read_entity_if_modified(
+    db_session: Session,
+    get_version: Callable[..., Mapping[Any, Any] | None],
+    preconditions: Preconditions,
+    operation: Callable[..., BaseModel],
+    *args: Any,
+    **kwargs: Any,
+) -> tuple[Validators | None, BaseModel | None]:
+    """Read the version of an entity, then run the operation unless not modified.
+
+    Args:
+        db_session (Session): Database session.
+        get_version (Callable[..., Mapping[Any, Any] | None]): Operation reading the id and
+                                                               update time of the entity,
+                                                               None if not found.
+        preconditions (Preconditions): Conditional headers of the request.
+        operation (Callable[..., BaseModel]): Operation reading the entity.
+        *args (Any): Positional arguments of both operations.
+        **kwargs (Any): Keyword arguments of both operations.
+
+    Returns:
+        tuple[Validators | None, BaseModel | None]: Validators (None if not found) and
+                                                    response, None if not modified.
+    """
+    version = get_version(db_session, *args, **kwargs)
+    # Not found: the operation raises its own error
+    validators = get_entity_validators(version) if version is not None else None
+    if validators is not None and preconditions.is_not_modified(validators):
+        return validators, None
+    return validators, operation(db_session, *args, **kwargs)
+
+
+def get_validated_model_response(
+    validators: Validators | None, content: BaseModel | None
+) -> Response:
+    """Get the JSON response of a model with its validators, a 304 without the model."""
+    headers = validators.headers if validators is not None else None
+    if content is None:
+        return Response(status_code=HTTPResponseCode.NOT_MODIFIED, headers=headers)
+    return ModelJSONResponse(content, headers=headers)
+
+
+async def get_conditional_response(
+    request: Request,
+    db_runner: DatabaseRunner,
+    table_names: list[str],
+    operation: Callable[..., BaseModel],
+    *args: Any,
+    **kwargs: Any,
+) -> Response:
+    """Get the response of a GET route with its validators, or a 304 if not modified.
+
+    The validators and the response are read by a single operation of the runner: a 304
+    only costs the primary key lookup of the changes of the tables, the response model is not
+    built.
+
+    Args:
+        request (Request): Request.
+        db_runner (DatabaseRunner): Database runner.
+        table_names (list[str]): Tables the response is read from.
+        operation (Callable[..., BaseModel]): Operation reading the response.
+        *args (Any): Positional arguments of the operation.
+        **kwargs (Any): Keyword arguments of the operation.
+
+    Returns:
+        Response: JSON response or 304 Not Modified, with the validators.
+    """
+    validators, content = await db_runner.run(
+        read_if_modified,
+        table_names,
+        Preconditions.from_request(request),
+        operation,
+        *args,
+        **kwargs,
+    )
+    return get_validated_model_response(validators, content)
+
+
+async def get_entity_response(
+    request: Request,
+    db_runner: DatabaseRunner,
+    get_version: Callable[..., Mapping[Any, Any] | None],
+    operation: Callable[..., BaseModel],
+    *args: Any,
+    **kwargs: Any,
+) -> Response:
+    """Get the response of a GET route of a single entity with its validators, or a 304 if
+    not modified.
+
+    As `get_conditional_response`, but the validators come from the version of the entity:
+    a 304 only costs the primary key lookup of its id and update time, the entity is not
+    read and its response model is not built.
+
+    Args:
+        request (Request): Request.
+        db_runner (DatabaseRunner): Database runner.
+        get_version (Callable[..., Mapping[Any, Any] | None]): Operation reading the id and
+                                                               update time of the entity.
+        operation (Callable[..., BaseModel]): Operation reading the entity.
+        *args (Any): Positional arguments of both operations.
+        **kwargs (Any): Keyword arguments of both operations.
+
+    Returns:
+        Response: JSON response or 304 Not Modified, with the validators.
+    """
+    validators, content = await db_runner.run(
+        read_entity_if_modified,
+        get_version,
+        Preconditions.from_request(request),
+        operation,
+        *args,
+        **kwargs,
+    )
+    return get_validated_model_response(validators, content)
@@ -0,0 +1,66 @@
+import csv
+import io
+from datetime import date
+from typing import Any, AsyncIterator, Sequence
+
+from pydantic_core import to_json
+from sqlalchemy import RowMapping
+
+from src.models.export import ExportFormat
+
+# Media type and file extension of each export format
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: ("application/x-ndjson", "ndjson"),
+    ExportFormat.CSV: ("text/csv", "csv"),
+}
+
+
+async def encode_ndjson(batches: AsyncIterator[Sequence[RowMapping]]) -> AsyncIterator[bytes]:
+    """Encode batches of rows to NDJSON, one JSON object per row.
+
+    The values are encoded by pydantic-core as in the JSON responses (ISO 8601 dates).
+
+    Args:
+        batches (AsyncIterator[Sequence[RowMapping]]): Batches of rows.
+
+    Yields:
+        bytes: The lines of a batch.
+    """
+    async for batch in batches:
+        yield b"".join(to_json(dict(row)) + b"\n" for row in batch)
+
+
+def get_csv_value(value: Any) -> Any:
+    """Get the CSV value of a column, the dates are written in ISO 8601 as in JSON.
+
+    Args:
+        value (Any): Column value.
+
+    Returns:
+        Any: Value written by the CSV writer.
+    """
+    return value.isoformat() if isinstance(value, date) else value
+
+
+async def encode_csv(
+    batches: AsyncIterator[Sequence[RowMapping]], column_names: list[str]
+) -> AsyncIterator[str]:
+    """Encode batches of rows to CSV, with a header row of the column names.
+
+    Args:
+        batches (AsyncIterator[Sequence[RowMapping]]): Batches of rows.
+        column_names (list[str]): Names of the columns of the rows.
+
+    Yields:
+        str: The header, then the lines of a batch.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(column_names)
+    yield buffer.getvalue()
+
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([get_csv_value(value) for value in row.values()] for row in batch)
+        yield buffer.getvalue()
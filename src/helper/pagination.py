@@ -1,28 +1,154 @@
-from typing import Annotated
+import base64
+import binascii
+import json
+from typing import Annotated, Callable, NamedTuple, Sequence, TypedDict, TypeVar
 
 from fastapi import Depends, Query
 
+from src.exceptions.app import BadRequestException
+from src.models.http_response_code import HTTPResponseCode
+
+T = TypeVar("T")
+
+# Largest id of a cursor, a larger one overflows the 64-bit integer bound parameter
+MAX_CURSOR_ID = 2**63 - 1
+
+
+class Cursor(NamedTuple):
+    """Position of a page boundary, the page seeks on the id primary key from it."""
+
+    id: int
+    is_previous: bool
+
+
+class PagerParams(TypedDict):
+    """Pagination parameters of the collection endpoints."""
+
+    skip: int
+    limit: int
+    cursor: Cursor | None
+    include_total: bool
+
 
 def pagination_details(
-    *, offset: int, limit: int, counts: int
-) -> tuple[int, int, int | None, int | None]:
+    *,
+    offset: int,
+    limit: int,
+    counts: int | None,
+    cursor: Cursor | None = None,
+    has_next: bool = False,
+) -> tuple[int | None, int | None, int | None, int | None]:
     """Calculate the pagination details.
 
     Args:
         offset (int): Offset value.
         limit (int): Limit value.
-        counts (int): Total number of counts.
+        counts (int | None): Total number of counts, None when it is not counted.
+        cursor (Cursor | None, optional): Cursor of the page, the page numbers are unknown
+                                          with a cursor. Defaults to None.
+        has_next (bool, optional): Whether there is a page after, only used without the total
+                                   number of counts. Defaults to False.
 
     Returns:
         Tuple: Tuple of number of pages, current page, next page, and previous page.
     """
-    number_of_pages = (counts + limit - 1) // limit
+    number_of_pages = (counts + limit - 1) // limit if counts is not None else None
+    if cursor is not None:
+        return number_of_pages, None, None, None
+
     current_page = (offset // limit) + 1
-    next_page = current_page + 1 if current_page < number_of_pages else None
+    if number_of_pages is not None:
+        has_next = current_page < number_of_pages
+    next_page = current_page + 1 if has_next else None
     previous_page = current_page - 1 if current_page > 1 else None
     return number_of_pages, current_page, next_page, previous_page
 
 
+def encode_cursor(cursor: Cursor) -> str:
+    """Encode a cursor to the opaque value given to the clients.
+
+    Args:
+        cursor (Cursor): Cursor.
+
+    Returns:
+        str: URL safe cursor value.
+    """
+    payload = json.dumps({"id": cursor.id, "previous": cursor.is_previous}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(value: str) -> Cursor:
+    """Decode a cursor value given by a client.
+
+    Args:
+        value (str): Cursor value.
+
+    Raises:
+        BadRequestException: The value is not a cursor.
+
+    Returns:
+        Cursor: Cursor.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)))
+        cursor = Cursor(id=payload["id"], is_previous=payload["previous"])
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError) as exc:
+        raise BadRequestException(
+            status_code=HTTPResponseCode.BAD_REQUEST, message=f"Invalid cursor {value!r}"
+        ) from exc
+
+    # A boolean is an int in Python, the types are compared exactly
+    if (
+        type(cursor.id) is not int
+        or not 0 <= cursor.id <= MAX_CURSOR_ID
+        or type(cursor.is_previous) is not bool
+    ):
+        raise BadRequestException(
+            status_code=HTTPResponseCode.BAD_REQUEST, message=f"Invalid cursor {value!r}"
+        )
+    return cursor
+
+
+def cursor_details(
+    rows: Sequence[T],
+    *,
+    limit: int,
+    offset: int,
+    cursor: Cursor | None,
+    get_id: Callable[[T], int],
+) -> tuple[list[T], str | None, str | None]:
+    """Get the page of a pagination query and the cursors of the next and previous pages.
+
+    The query fetches ``limit + 1`` rows in its seek order (descending ids for a previous
+    cursor), the extra row only tells whether there is a page after.
+
+    Args:
+        rows (Sequence[T]): Rows fetched by the pagination query.
+        limit (int): Limit value.
+        offset (int): Offset value, used when there is no cursor.
+        cursor (Cursor | None): Cursor of the request.
+        get_id (Callable[[T], int]): Get the id of a row.
+
+    Returns:
+        tuple[list[T], str | None, str | None]: Page rows in ascending id order, next cursor
+                                                and previous cursor.
+    """
+    has_more = len(rows) > limit
+    page = list(rows[:limit])
+    if cursor is not None and cursor.is_previous:
+        page.reverse()
+        has_next, has_previous = True, has_more
+    else:
+        has_next, has_previous = has_more, cursor is not None or offset > 0
+
+    if not page:
+        return page, None, None
+
+    next_cursor = encode_cursor(Cursor(id=get_id(page[-1]), is_previous=False))
+    previous_cursor = encode_cursor(Cursor(id=get_id(page[0]), is_previous=True))
+    return page, next_cursor if has_next else None, previous_cursor if has_previous else None
+
+
 async def pager_params(
     skip: int = Query(
         default=0,
@@ -39,7 +165,18 @@ async def pager_params(
         description="Limit should be between 1 and 1000",
         examples=[100],
     ),
-) -> dict[str, int]:
+    after: str | None = Query(
+        default=None,
+        title="After",
+        description="Cursor of the page to get (next_cursor or previous_cursor of a page), "
+        "skip is ignored when it is given",
+    ),
+    include_total: bool = Query(
+        default=True,
+        title="Include total",
+        description="Count the items and pages, the totals are null when it is false",
+    ),
+) -> PagerParams:
     """Get the pagination parameters.
 
     Args:
@@ -51,11 +188,19 @@ async def pager_params(
                                ge=1, le=1000, title="Limit",
                                description="Limit should be between 1 and 1000",
                                example=100, ).
+        after (str | None, optional): Cursor value. Defaults to Query(default=None,
+                                      title="After", ...).
+        include_total (bool, optional): Whether to count the items. Defaults to
+                                        Query(default=True, title="Include total", ...).
+
+    Raises:
+        BadRequestException: The cursor value is invalid.
 
     Returns:
-        Dict[str, int]: Dictionary of skip and limit values.
+        PagerParams: Dictionary of skip, limit, decoded cursor and include_total values.
     """
-    return {"skip": skip, "limit": limit}
+    cursor = decode_cursor(after) if after is not None else None
+    return {"skip": skip, "limit": limit, "cursor": cursor, "include_total": include_total}
 
 
-pager_params_dependency = Annotated[dict[str, int], Depends(pager_params)]
+pager_params_dependency = Annotated[PagerParams, Depends(pager_params)]
@@ -0,0 +1,31 @@
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+class ModelJSONResponse(Response):
+    """JSON response encoding a Pydantic model straight to bytes in a single pass.
+
+    A route returning a model lets FastAPI validate it against the ``response_model``, dump
+    it to Python objects and encode them with ``json.dumps``. Returning this response skips
+    all of that: the model is serialized once by pydantic-core. The ``response_model`` of
+    the route is still used for the OpenAPI schema.
+
+    The model must already be a valid response (built by the route from validated data).
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Encode the model to JSON.
+
+        Args:
+            content (Any): Pydantic model.
+
+        Returns:
+            bytes: JSON body.
+        """
+        if not isinstance(content, BaseModel):
+            raise TypeError(f"ModelJSONResponse needs a Pydantic model, got {type(content)}")
+        return content.__pydantic_serializer__.to_json(content, warnings=False)
@@ -0,0 +1,242 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from src.config.config import APP_CONFIG
+from src.db.runner import DatabaseRunner
+from src.db.table_changes import add_table_change_listener
+from src.helper.conditional import (
+    Preconditions,
+    Validators,
+    get_conditional_response,
+    read_if_modified,
+)
+from src.helper.response import ModelJSONResponse
+from src.models.http_response_code import HTTPResponseCode
+
+
+class CachedResponse(NamedTuple):
+    """Encoded body of a response and its validators."""
+
+    body: bytes
+    validators: Validators | None
+
+
+class CacheEntry(NamedTuple):
+    """Cached response, the tables it is read from and its expiry (monotonic seconds)."""
+
+    response: CachedResponse
+    table_names: frozenset[str]
+    expires_at: float
+
+
+class ResponseCache:
+    """Keep the encoded bodies of the list routes, dropped when their tables are written.
+
+    Every table has a generation, incremented when a transaction of the process writing it
+    is committed: the entries read from the table are dropped at once, and a response read
+    before the write is not added afterwards (its generations are outdated). An entry also
+    expires after ``ttl`` seconds, the bound of the staleness for the writes made by other
+    processes. The least recently used entries are evicted once the bodies exceed
+    ``max_bytes``.
+    """
+
+    def __init__(self, *, max_bytes: int, ttl: float) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def is_enabled(self) -> bool:
+        """Whether responses are cached (a zero size or TTL disables the cache)."""
+        return self.max_bytes > 0 and self.ttl > 0
+
+    def get_generations(self, table_names: list[str]) -> tuple[int, ...]:
+        """Get the generations of tables, to read before the response.
+
+        Args:
+            table_names (list[str]): Tables the response is read from.
+
+        Returns:
+            tuple[int, ...]: Generation of each table.
+        """
+        return tuple(self._generations.get(table_name, 0) for table_name in table_names)
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry, the lock must be held."""
+        self._bytes -= len(self._entries.pop(key).response.body)
+
+    def get(self, key: Hashable) -> CachedResponse | None:
+        """Get a response which has not expired.
+
+        Args:
+            key (Hashable): Route and parameters of the response.
+
+        Returns:
+            CachedResponse | None: Cached response, None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.response
+
+            if entry is not None:
+                self._remove(key)
+            self._misses += 1
+            return None
+
+    def add(
+        self,
+        key: Hashable,
+        table_names: list[str],
+        generations: tuple[int, ...],
+        response: CachedResponse,
+    ) -> None:
+        """Add a response read from the database.
+
+        The response is not added if one of its tables was written since the given
+        generations were read, nor if its body alone exceeds the size of the cache.
+
+        Args:
+            key (Hashable): Route and parameters of the response.
+            table_names (list[str]): Tables the response is read from.
+            generations (tuple[int, ...]): Generations of the tables read before the response.
+            response (CachedResponse): Response to cache.
+        """
+        size = len(response.body)
+        if not self.is_enabled or size > self.max_bytes:
+            return
+
+        with self._lock:
+            if generations != self.get_generations(table_names):
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = CacheEntry(
+                response=response,
+                table_names=frozenset(table_names),
+                expires_at=time.monotonic() + self.ttl,
+            )
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, table_names: set[str]) -> None:
+        """Drop the responses read from written tables.
+
+        Args:
+            table_names (set[str]): Tables written by a committed transaction.
+        """
+        with self._lock:
+            for table_name in table_names:
+                self._generations[table_name] = self._generations.get(table_name, 0) + 1
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if not entry.table_names.isdisjoint(table_names)
+            ]
+            for key in keys:
+                self._remove(key)
+            self._invalidations += len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Get the response cache statistics.
+
+        Returns:
+            dict[str, Any]: Entries and bytes cached, hits, misses, hit rate, evictions (size
+                            bound) and invalidations (writes) of the cache.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+
+response_cache = ResponseCache(
+    max_bytes=APP_CONFIG["response_cache"]["max_bytes"],
+    ttl=APP_CONFIG["response_cache"]["ttl"],
+)
+add_table_change_listener(response_cache.invalidate)
+
+
+def get_validated_response(preconditions: Preconditions, response: CachedResponse) -> Response:
+    """Get a cached response, or a 304 if the client has it already."""
+    headers = response.validators.headers if response.validators is not None else None
+    if response.validators is not None and preconditions.is_not_modified(response.validators):
+        return Response(status_code=HTTPResponseCode.NOT_MODIFIED, headers=headers)
+    return Response(response.body, media_type=ModelJSONResponse.media_type, headers=headers)
+
+
+async def get_cached_response(
+    request: Request,
+    db_runner: DatabaseRunner,
+    table_names: list[str],
+    operation: Callable[..., BaseModel],
+    **kwargs: Any,
+) -> Response:
+    """Get the response of a list route from the cache, or read and cache it.
+
+    A hit runs no query: neither the count nor the page are read, and the body is sent as
+    it was encoded. A miss is a conditional GET (see `get_conditional_response`), its
+    encoded body is cached under the path and the parameters of the route.
+
+    Args:
+        request (Request): Request.
+        db_runner (DatabaseRunner): Database runner.
+        table_names (list[str]): Tables the response is read from.
+        operation (Callable[..., BaseModel]): Operation reading the response.
+        **kwargs (Any): Keyword arguments of the operation, the key of the response with
+                        the path.
+
+    Returns:
+        Response: JSON response or 304 Not Modified, with the validators.
+    """
+    if not response_cache.is_enabled:
+        return await get_conditional_response(request, db_runner, table_names, operation, **kwargs)
+
+    key = (request.url.path, tuple(sorted(kwargs.items())))
+    preconditions = Preconditions.from_request(request)
+    cached_response = response_cache.get(key)
+    if cached_response is not None:
+        return get_validated_response(preconditions, cached_response)
+
+    generations = response_cache.get_generations(table_names)
+    validators, content = await db_runner.run(
+        read_if_modified, table_names, preconditions, operation, **kwargs
+    )
+    if content is None:
+        return get_validated_response(preconditions, CachedResponse(b"", validators))
+
+    response = ModelJSONResponse(
+        content, headers=validators.headers if validators is not None else None
+    )
+    response_cache.add(key, table_names, generations, CachedResponse(response.body, validators))
+    return response
@@ -7,15 +7,27 @@ from fastapi.responses import JSONResponse
 
 from src.config.config import APP_CONFIG
 from src.db.check import db_settings_initializations
-from src.db.engine import get_db_engine
+from src.db.engine import (
+    get_db_async_engine,
+    get_db_async_writer_engine,
+    get_db_engine,
+    get_db_writer_engine,
+)
+from src.db.executor import shutdown_db_executor
+from src.db.group_commit import shutdown_group_committers
+from src.db.reference_data import load_reference_data
 from src.exceptions.app import AppException
 from src.helper.logging import init_loggers
 from src.models.http_response_code import HTTPResponseCode
+from src.router.auth import router as auth_router
 from src.router.author import router as author_router
 from src.router.book import router as book_router
 from src.router.docs import router as docs_router
+from src.router.export import router as export_router
 from src.router.health import router as health_router
+from src.router.reference_data import router as reference_data_router
 from src.router.reservation import router as reservation_router
+from src.router.search import router as search_router
 from src.router.stock import router as stock_router
 from src.router.user import router as user_router
 
@@ -27,6 +39,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: PLR0915
     logger = logging.getLogger("app")
     try:
         db_settings_initializations()
+        load_reference_data()
         logger.info("Starting up the application...")
         yield
     except Exception as exc:
@@ -35,8 +48,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: PLR0915
     finally:
         #  Close all open db pool connections
         logger.info("Shutting down the application...")
+        # Commit the pending group commit batch before closing the pools
+        shutdown_group_committers()
+        shutdown_db_executor()
         engine = get_db_engine()
         engine.dispose()
+        get_db_writer_engine().dispose()
+        await get_db_async_engine().dispose()
+        await get_db_async_writer_engine().dispose()
         logger.info("All DB pool connections are closed")
 
 
@@ -73,8 +92,12 @@ async def exception_handler(_request: Request, exc: Exception) -> JSONResponse:
 # Manually add all routers to the FastApi application
 app.include_router(docs_router)
 app.include_router(health_router)
+app.include_router(auth_router)
 app.include_router(author_router)
 app.include_router(book_router)
 app.include_router(stock_router)
 app.include_router(user_router)
 app.include_router(reservation_router)
+app.include_router(export_router)
+app.include_router(reference_data_router)
+app.include_router(search_router)
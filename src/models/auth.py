@@ -0,0 +1,11 @@
+from pydantic import Field
+
+from src.models.trusted import TrustedModel
+
+
+class AccessTokenOut(TrustedModel):
+    """Pydantic model to represent an access token issued to an admin user."""
+
+    access_token: str = Field(..., description="Signed token, sent as `Authorization: Bearer`")
+    token_type: str = Field(..., description="Type of the token, always bearer")
+    expires_in: int = Field(..., description="Seconds before the token expires")
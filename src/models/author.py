@@ -3,6 +3,7 @@ from datetime import date
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.models.pagination import Pagination
+from src.models.trusted import TrustedModel
 
 
 class AuthorBase(BaseModel):
@@ -38,7 +39,7 @@ class AuthorIn(AuthorBase):
     pass
 
 
-class AuthorOut(AuthorBase):
+class AuthorOut(AuthorBase, TrustedModel):
     """Pydantic model to represent the author for output."""
 
     id: int = Field(
@@ -50,5 +51,7 @@ class AuthorOut(AuthorBase):
 class AuthorsList(Pagination):
     """Pydantic model to represent a list of authors."""
 
-    number_of_authors: int = Field(..., description="Total number of authors")
+    number_of_authors: int | None = Field(
+        ..., description="Total number of authors, None with include_total=false"
+    )
     authors: list[AuthorOut] = Field(..., description="List of authors")
@@ -3,6 +3,7 @@ from datetime import date
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.models.pagination import Pagination
+from src.models.trusted import TrustedModel
 
 
 class BookBase(BaseModel):
@@ -38,7 +39,7 @@ class BookIn(BookBase):
     pass
 
 
-class BookOut(BookBase):
+class BookOut(BookBase, TrustedModel):
     """Pydantic model to represent the book for output."""
 
     id: int = Field(
@@ -50,5 +51,7 @@ class BookOut(BookBase):
 class BooksList(Pagination):
     """Pydantic model to represent a list of books."""
 
-    number_of_books: int = Field(..., description="Total number of books")
+    number_of_books: int | None = Field(
+        ..., description="Total number of books, None with include_total=false"
+    )
     books: list[BookOut] = Field(..., description="List of books")
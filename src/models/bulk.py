@@ -0,0 +1,21 @@
+from pydantic import Field
+
+from src.models.trusted import TrustedModel
+
+
+class BulkCreateItem(TrustedModel):
+    """Pydantic model to represent the result of the creation of a row of a bulk request."""
+
+    line: int = Field(..., title="Line of the row in the request body, starting from 1")
+    status_code: int = Field(..., title="Status code of the creation of the row")
+    message: str | None = Field(..., title="Reason of the failure")
+    id: int | None = Field(..., title="Created ID, None on failure")
+
+
+class BulkCreateOut(TrustedModel):
+    """Pydantic model to represent the results of a bulk creation."""
+
+    number_of_created: int = Field(..., description="Number of rows created")
+    items: list[BulkCreateItem] = Field(
+        ..., description="Result of each row, in the order of the request body"
+    )
@@ -0,0 +1,18 @@
+from enum import StrEnum
+
+
+class ExportEntity(StrEnum):
+    """Enum representing the tables which can be exported."""
+
+    AUTHORS = "authors"
+    BOOKS = "books"
+    USERS = "users"
+    STOCKS = "stocks"
+    RESERVATIONS = "reservations"
+
+
+class ExportFormat(StrEnum):
+    """Enum representing the formats of an export."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
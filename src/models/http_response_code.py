@@ -7,10 +7,13 @@ class HTTPResponseCode:
     OK = status.HTTP_200_OK
     CREATED = status.HTTP_201_CREATED
     NO_CONTENT = status.HTTP_204_NO_CONTENT
+    NOT_MODIFIED = status.HTTP_304_NOT_MODIFIED
     BAD_REQUEST = status.HTTP_400_BAD_REQUEST
     UNAUTHORIZED = status.HTTP_401_UNAUTHORIZED
     FORBIDDEN = status.HTTP_403_FORBIDDEN
     NOT_FOUND = status.HTTP_404_NOT_FOUND
     INTERNAL_SERVER_ERROR = status.HTTP_500_INTERNAL_SERVER_ERROR
+    NOT_IMPLEMENTED = status.HTTP_501_NOT_IMPLEMENTED
+    SERVICE_UNAVAILABLE = status.HTTP_503_SERVICE_UNAVAILABLE
 
     # We can add more custom status codes here
@@ -1,10 +1,16 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from src.models.trusted import TrustedModel
 
-class Pagination(BaseModel):
+
+class Pagination(TrustedModel):
     """Pydantic model to represent pagination."""
 
-    number_of_pages: int = Field(..., description="Total number of pages")
-    current_page: int = Field(..., description="Current page")
+    number_of_pages: int | None = Field(
+        ..., description="Total number of pages, None with include_total=false"
+    )
+    current_page: int | None = Field(..., description="Current page, None with a cursor")
     next_page: int | None = Field(..., description="Next page")
     previous_page: int | None = Field(..., description="Previous page")
+    next_cursor: str | None = Field(default=None, description="Cursor of the next page")
+    previous_cursor: str | None = Field(default=None, description="Cursor of the previous page")
@@ -1,8 +1,11 @@
 from datetime import datetime
+from typing import Annotated
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.models.pagination import Pagination
+from src.models.reservation_status import ReservationStatus
+from src.models.trusted import TrustedModel
 
 
 class ReservationBase(BaseModel):
@@ -20,7 +23,36 @@ class ReservationIn(ReservationBase):
     pass
 
 
-class ReservationOut(ReservationBase):
+# Books reserved at once by a checkout
+MAX_BATCH_RESERVATIONS = 20
+# Reservations returned at once by a book drop
+MAX_BATCH_RETURNS = 500
+
+
+class ReservationBatchIn(BaseModel):
+    """Pydantic model to represent the reservation of several books for input."""
+
+    user_id: int = Field(..., gt=0, title="User ID")
+    book_ids: list[Annotated[int, Field(gt=0)]] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_RESERVATIONS, title="Book IDs"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"user_id": 456, "book_ids": [123, 124, 125]}}
+    )
+
+
+class ReservationReturnsIn(BaseModel):
+    """Pydantic model to represent the return of several reservations for input."""
+
+    reservation_ids: list[Annotated[int, Field(gt=0)]] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_RETURNS, title="Reservation IDs"
+    )
+
+    model_config = ConfigDict(json_schema_extra={"example": {"reservation_ids": [1, 2, 3]}})
+
+
+class ReservationOut(ReservationBase, TrustedModel):
     """Pydantic base model to represent the reservation."""
 
     id: int = Field(..., gt=0, title="Reservation ID")
@@ -30,8 +62,64 @@ class ReservationOut(ReservationBase):
     return_date: datetime | None = Field(..., title="Due date")
 
 
+class ReservationBatchItem(TrustedModel):
+    """Pydantic model to represent the result of the reservation of a book of a batch."""
+
+    book_id: int = Field(..., title="Book ID")
+    status_code: int = Field(..., title="Status code of the reservation of the book")
+    message: str | None = Field(..., title="Reason of the failure")
+    reservation: ReservationOut | None = Field(..., title="Reservation, None on failure")
+
+
+class ReservationBatchOut(TrustedModel):
+    """Pydantic model to represent the results of the reservation of several books."""
+
+    user_id: int = Field(..., title="User ID")
+    number_of_reservation: int = Field(..., description="Number of books reserved")
+    reservations: list[ReservationBatchItem] = Field(
+        ..., description="Result of each book, in the order of the request"
+    )
+
+
+class ReservationReturnItem(TrustedModel):
+    """Pydantic model to represent the result of the return of a reservation of a batch."""
+
+    reservation_id: int = Field(..., title="Reservation ID")
+    status_code: int = Field(..., title="Status code of the return of the reservation")
+    message: str | None = Field(..., title="Reason of the failure")
+    reservation: ReservationOut | None = Field(..., title="Reservation, None on failure")
+
+
+class ReservationReturnsOut(TrustedModel):
+    """Pydantic model to represent the results of the return of several reservations."""
+
+    number_of_reservation: int = Field(..., description="Number of reservations returned")
+    reservations: list[ReservationReturnItem] = Field(
+        ..., description="Result of each reservation, in the order of the request"
+    )
+
+
 class ReservationsList(Pagination):
     """Pydantic model to represent a list of reservations."""
 
-    number_of_reservation: int = Field(..., description="Total number of reservations")
+    number_of_reservation: int | None = Field(
+        ..., description="Total number of reservations, None with include_total=false"
+    )
     reservations: list[ReservationOut] = Field(..., description="List of reservations")
+
+
+class ReservationFilters(BaseModel):
+    """Pydantic model to represent the filters of the reservations list."""
+
+    user_id: int | None = Field(default=None, gt=0, description="Reservations of the user")
+    book_id: int | None = Field(default=None, gt=0, description="Reservations of the book")
+    status: ReservationStatus | None = Field(default=None, description="Reservation status")
+    active: bool = Field(default=False, description="Only the books not returned yet")
+    overdue: bool = Field(
+        default=False, description="Only the books not returned yet and past their due date"
+    )
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether no filter is set."""
+        return self == ReservationFilters()
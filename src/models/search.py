@@ -0,0 +1,20 @@
+from pydantic import Field
+
+from src.models.book import BookOut
+from src.models.pagination import Pagination
+
+
+class BookSearchOut(BookOut):
+    """Pydantic model to represent a book found by a search, with the names of its author."""
+
+    author_first_name: str = Field(..., description="First name of the author")
+    author_last_name: str = Field(..., description="Last name of the author")
+
+
+class BooksSearchList(Pagination):
+    """Pydantic model to represent the books found by a search, the most relevant first."""
+
+    number_of_results: int | None = Field(
+        ..., description="Total number of matching books, None with include_total=false"
+    )
+    results: list[BookSearchOut] = Field(..., description="List of matching books")
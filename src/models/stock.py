@@ -1,6 +1,7 @@
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.models.pagination import Pagination
+from src.models.trusted import TrustedModel
 
 
 class StockBase(BaseModel):
@@ -23,7 +24,7 @@ class StockQuantityAdd(BaseModel):
     stock_quantity: int = Field(..., gt=0, title="Number of stock to be added")
 
 
-class StockOut(StockBase):
+class StockOut(StockBase, TrustedModel):
     """Pydantic model to represent the stock for output."""
 
     id: int = Field(
@@ -42,5 +43,7 @@ class StockOut(StockBase):
 class StocksList(Pagination):
     """Pydantic model to represent a list of stocks."""
 
-    number_of_stocks: int = Field(..., description="Total number of stocks")
+    number_of_stocks: int | None = Field(
+        ..., description="Total number of stocks, None with include_total=false"
+    )
     stocks: list[StockOut] = Field(..., description="List of available stocks")
@@ -0,0 +1,27 @@
+from typing import Any
+
+from pydantic import BaseModel
+from typing_extensions import Self
+
+
+class TrustedModel(BaseModel):
+    """Pydantic base model for the responses built from data which is already valid.
+
+    The rows read from the database went through the input models before being written, so
+    the output models can be built from them without being validated a second time.
+    """
+
+    @classmethod
+    def trusted(cls, **values: Any) -> Self:
+        """Build the model without validation, the values are used as they are.
+
+        Only use it with trusted values (database rows, models already validated), keys which
+        are not fields of the model are ignored.
+
+        Args:
+            **values (Any): Field values.
+
+        Returns:
+            Self: Model instance.
+        """
+        return cls.model_construct(**values)
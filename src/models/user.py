@@ -1,6 +1,7 @@
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 from src.models.pagination import Pagination
+from src.models.trusted import TrustedModel
 
 
 class UserBase(BaseModel):
@@ -32,7 +33,7 @@ class UserIn(UserBase):
     pass
 
 
-class UserOut(UserBase):
+class UserOut(UserBase, TrustedModel):
     """Pydantic model to represent the user for output."""
 
     id: int = Field(
@@ -44,5 +45,7 @@ class UserOut(UserBase):
 class UsersList(Pagination):
     """Pydantic model to represent a list of users."""
 
-    number_of_users: int = Field(..., description="Total number of users")
+    number_of_users: int | None = Field(
+        ..., description="Total number of users, None with include_total=false"
+    )
     users: list[UserOut] = Field(..., description="List of users")
@@ -0,0 +1,67 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response
+from fastapi.security import (
+    HTTPAuthorizationCredentials,
+    HTTPBasic,
+    HTTPBasicCredentials,
+)
+from sqlmodel import Session
+
+from src.config.config import APP_CONFIG
+from src.db.engine import db_reader_engine_dependency
+from src.exceptions.app import AuthenticationException
+from src.models.auth import AccessTokenOut
+from src.models.error_response import ErrorResponse
+from src.models.http_response_code import HTTPResponseCode
+from src.utils.access_token import create_access_token, revoke_access_token
+from src.utils.security import bearer_security, verify_credentials
+
+router = APIRouter()
+
+
+@router.post(
+    "/auth/token",
+    response_model=AccessTokenOut,
+    responses={
+        "401": {"model": ErrorResponse},
+        "500": {"model": ErrorResponse},
+    },
+    summary="To exchange the Basic credentials of an admin user for a short-lived access token.",
+    tags=["Authentication"],
+    status_code=HTTPResponseCode.OK,
+)
+def create_token(
+    credentials: Annotated[HTTPBasicCredentials, Depends(HTTPBasic())],
+    db_engine: db_reader_engine_dependency,
+) -> AccessTokenOut:
+    # Read only, the admin user is looked up without taking the writer connection
+    with Session(db_engine) as db_session:
+        user_id = verify_credentials(credentials, db_session)
+    return AccessTokenOut.trusted(
+        access_token=create_access_token(user_id),
+        token_type="bearer",
+        expires_in=APP_CONFIG["authentication"]["token"]["ttl"],
+    )
+
+
+@router.post(
+    "/auth/revoke",
+    responses={
+        "401": {"model": ErrorResponse},
+        "500": {"model": ErrorResponse},
+    },
+    summary="To revoke the access token of the request until it expires.",
+    tags=["Authentication"],
+    status_code=HTTPResponseCode.NO_CONTENT,
+)
+def revoke_token(
+    bearer_credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_security)],
+) -> Response:
+    if bearer_credentials is None:
+        raise AuthenticationException(
+            status_code=HTTPResponseCode.UNAUTHORIZED, message="Missing access token"
+        )
+
+    revoke_access_token(bearer_credentials.credentials)
+    return Response(status_code=HTTPResponseCode.NO_CONTENT)
@@ -1,19 +1,27 @@
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Request, Response
 
-from src.db.engine import db_dependency
 from src.db.operations.author import (
+    AUTHOR_TABLES,
     create_author_on_db,
+    create_authors_on_db,
     delete_author_on_db,
     get_author_out_from_db,
+    get_author_version_from_db,
     get_authors_with_offset_and_limit,
     update_author_on_db,
 )
+from src.db.runner import db_runner_dependency
+from src.helper.bulk import bulk_openapi_extra, create_in_bulk
+from src.helper.conditional import get_entity_response
 from src.helper.pagination import pager_params_dependency
+from src.helper.response import ModelJSONResponse
+from src.helper.response_cache import get_cached_response
 from src.models.author import (
     AuthorIn,
     AuthorOut,
     AuthorsList,
 )
+from src.models.bulk import BulkCreateOut
 from src.models.error_response import ErrorResponse
 from src.models.http_response_code import HTTPResponseCode
 from src.utils.security import user_is_authenticated
@@ -33,13 +41,33 @@ router = APIRouter(dependencies=[Depends(user_is_authenticated)])
     status_code=HTTPResponseCode.CREATED,
 )
 async def create_author(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
     author_in: AuthorIn,
 ) -> AuthorOut | ErrorResponse:
-    new_author = create_author_on_db(db_session, author_in)
+    new_author = await db_runner.run(create_author_on_db, author_in)
     return new_author
 
 
+@router.post(
+    "/authors/bulk",
+    response_model=BulkCreateOut,
+    responses={
+        "401": {"model": ErrorResponse},
+        "500": {"model": ErrorResponse},
+    },
+    summary="To create authors from a body of one author per line (NDJSON).",
+    tags=["Authors"],
+    status_code=HTTPResponseCode.OK,
+    openapi_extra=bulk_openapi_extra(AuthorIn),
+)
+async def create_authors(
+    db_runner: db_runner_dependency,
+    request: Request,
+) -> ModelJSONResponse:
+    authors = await create_in_bulk(request, db_runner, AuthorIn, create_authors_on_db)
+    return ModelJSONResponse(authors)
+
+
 @router.get(
     "/authors/{author_id}",
     response_model=AuthorOut,
@@ -52,15 +80,17 @@ async def create_author(
     tags=["Authors"],
 )
 async def get_author(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
+    request: Request,
     author_id: int = Path(
         ...,
         title="Author ID",
         examples=[1],
     ),
-) -> AuthorOut | ErrorResponse:
-    author_out = get_author_out_from_db(db_session, author_id)
-    return author_out
+) -> Response:
+    return await get_entity_response(
+        request, db_runner, get_author_version_from_db, get_author_out_from_db, author_id
+    )
 
 
 @router.get(
@@ -74,15 +104,20 @@ async def get_author(
     tags=["Authors"],
 )
 async def get_all_authors(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
+    request: Request,
     pager_params: pager_params_dependency,
-) -> AuthorsList | ErrorResponse:
-    authors = get_authors_with_offset_and_limit(
-        db_session,
+) -> Response:
+    return await get_cached_response(
+        request,
+        db_runner,
+        AUTHOR_TABLES,
+        get_authors_with_offset_and_limit,
         offset=pager_params["skip"],
         limit=pager_params["limit"],
+        cursor=pager_params["cursor"],
+        include_total=pager_params["include_total"],
     )
-    return authors
 
 
 @router.put(
@@ -97,11 +132,11 @@ async def get_all_authors(
     tags=["Authors"],
 )
 async def update_author(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
     author_in: AuthorIn,
     author_id: int = Path(..., title="Author ID", examples=[1]),
 ) -> AuthorOut | ErrorResponse:
-    updated_author = update_author_on_db(db_session, author_id, author_in)
+    updated_author = await db_runner.run(update_author_on_db, author_id, author_in)
     return updated_author
 
 
@@ -120,11 +155,11 @@ async def update_author(
     tags=["Authors"],
 )
 async def delete_author(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
     author_id: int = Path(
         ...,
         title="Author ID",
         examples=[1],
     ),
 ) -> None:
-    delete_author_on_db(db_session, author_id)
+    await db_runner.run(delete_author_on_db, author_id)
@@ -1,15 +1,23 @@
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Request, Response
 
-from src.db.engine import db_dependency
 from src.db.operations.book import (
+    BOOK_TABLES,
     create_book_on_db,
+    create_books_on_db,
     delete_book_on_db,
     get_book_out_from_db,
+    get_book_version_from_db,
     get_books_with_offset_and_limit,
     update_book_on_db,
 )
+from src.db.runner import db_runner_dependency
+from src.helper.bulk import bulk_openapi_extra, create_in_bulk
+from src.helper.conditional import get_entity_response
 from src.helper.pagination import pager_params_dependency
+from src.helper.response import ModelJSONResponse
+from src.helper.response_cache import get_cached_response
 from src.models.book import BookIn, BookOut, BooksList
+from src.models.bulk import BulkCreateOut
 from src.models.error_response import ErrorResponse
 from src.models.http_response_code import HTTPResponseCode
 from src.utils.security import user_is_authenticated
@@ -29,13 +37,33 @@ router = APIRouter(dependencies=[Depends(user_is_authenticated)])
     status_code=HTTPResponseCode.CREATED,
 )
 async def create_book(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
     book_in: BookIn,
 ) -> BookOut | ErrorResponse:
-    new_book = create_book_on_db(db_session, book_in)
+    new_book = await db_runner.run(create_book_on_db, book_in)
     return new_book
 
 
+@router.post(
+    "/books/bulk",
+    response_model=BulkCreateOut,
+    responses={
+        "401": {"model": ErrorResponse},
+        "500": {"model": ErrorResponse},
+    },
+    summary="To create books from a body of one book per line (NDJSON).",
+    tags=["Books"],
+    status_code=HTTPResponseCode.OK,
+    openapi_extra=bulk_openapi_extra(BookIn),
+)
+async def create_books(
+    db_runner: db_runner_dependency,
+    request: Request,
+) -> ModelJSONResponse:
+    books = await create_in_bulk(request, db_runner, BookIn, create_books_on_db)
+    return ModelJSONResponse(books)
+
+
 @router.get(
     "/books/{book_id}",
     response_model=BookOut,
@@ -48,15 +76,17 @@ async def create_book(
     tags=["Books"],
 )
 async def get_book(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
+    request: Request,
     book_id: int = Path(
         ...,
         title="Book ID",
         examples=[1],
     ),
-) -> BookOut | ErrorResponse:
-    book_out = get_book_out_from_db(db_session, book_id)
-    return book_out
+) -> Response:
+    return await get_entity_response(
+        request, db_runner, get_book_version_from_db, get_book_out_from_db, book_id
+    )
 
 
 @router.get(
@@ -70,15 +100,20 @@ async def get_book(
     tags=["Books"],
 )
 async def get_all_books(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
+    request: Request,
     pager_params: pager_params_dependency,
-) -> BooksList | ErrorResponse:
-    books = get_books_with_offset_and_limit(
-        db_session,
+) -> Response:
+    return await get_cached_response(
+        request,
+        db_runner,
+        BOOK_TABLES,
+        get_books_with_offset_and_limit,
         offset=pager_params["skip"],
         limit=pager_params["limit"],
+        cursor=pager_params["cursor"],
+        include_total=pager_params["include_total"],
     )
-    return books
 
 
 @router.put(
@@ -93,11 +128,11 @@ async def get_all_books(
     tags=["Books"],
 )
 async def update_book(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
     book_in: BookIn,
     book_id: int = Path(..., title="Book ID", examples=[1]),
 ) -> BookOut | ErrorResponse:
-    updated_author = update_book_on_db(db_session, book_id, book_in)
+    updated_author = await db_runner.run(update_book_on_db, book_id, book_in)
     return updated_author
 
 
@@ -113,11 +148,11 @@ async def update_book(
     tags=["Books"],
 )
 async def delete_book(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
     book_id: int = Path(
         ...,
         title="Book ID",
         examples=[1],
     ),
 ) -> None:
-    delete_book_on_db(db_session, book_id)
+    await db_runner.run(delete_book_on_db, book_id)
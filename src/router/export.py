@@ -0,0 +1,58 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Path, Query
+from fastapi.responses import StreamingResponse
+
+from src.config.config import APP_CONFIG
+from src.db.operations.export import export_rows_from_db, get_export_column_names
+from src.db.runner import db_runner_dependency
+from src.helper.export import EXPORT_MEDIA_TYPES, encode_csv, encode_ndjson
+from src.models.error_response import ErrorResponse
+from src.models.export import ExportEntity, ExportFormat
+from src.utils.security import user_is_authenticated
+
+router = APIRouter(dependencies=[Depends(user_is_authenticated)])
+
+
+@router.get(
+    "/export/{entity}",
+    response_class=StreamingResponse,
+    responses={
+        "200": {"content": {"application/x-ndjson": {}, "text/csv": {}}},
+        "401": {"model": ErrorResponse},
+        "500": {"model": ErrorResponse},
+    },
+    summary="To export all the rows of a table as NDJSON or CSV, streamed in id order.",
+    tags=["Export"],
+)
+async def export_entity(
+    db_runner: db_runner_dependency,
+    entity: Annotated[ExportEntity, Path(title="Exported table")],
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+    snapshot: Annotated[
+        bool,
+        Query(
+            description=(
+                "Read all the rows from a single snapshot, consistent across concurrent "
+                "writes, instead of reading each batch on its own"
+            )
+        ),
+    ] = False,
+) -> StreamingResponse:
+    batches = db_runner.stream(
+        export_rows_from_db,
+        entity,
+        snapshot=snapshot,
+        batch_size=APP_CONFIG["database"]["export"]["batch_size"],
+    )
+    media_type, extension = EXPORT_MEDIA_TYPES[export_format]
+    content = (
+        encode_csv(batches, get_export_column_names(entity))
+        if export_format == ExportFormat.CSV
+        else encode_ndjson(batches)
+    )
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{entity}.{extension}"'},
+    )
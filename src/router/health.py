@@ -1,7 +1,16 @@
+from typing import Any
+
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
+from src.config.config import APP_CONFIG
+from src.db.engine import db_writer_engine_dependency
+from src.db.executor import get_db_executor
+from src.db.group_commit import find_group_committer
+from src.db.statement_cache import statement_cache
+from src.helper.response_cache import response_cache
 from src.models.http_response_code import HTTPResponseCode
+from src.utils.credential_cache import credential_cache
 
 router = APIRouter()
 
@@ -9,3 +18,25 @@ router = APIRouter()
 @router.get("/health", include_in_schema=False)
 def health_check() -> JSONResponse:
     return JSONResponse(status_code=HTTPResponseCode.OK, content={"status": "ok"})
+
+
+@router.get("/health/database", include_in_schema=False)
+async def database_health_check(db_writer_engine: db_writer_engine_dependency) -> JSONResponse:
+    """Expose the database execution mode, the statement, credential and response caches and
+    the executor and group commit statistics."""
+    mode = APP_CONFIG["database"]["execution"]["mode"]
+    content: dict[str, Any] = {
+        "status": "ok",
+        "execution_mode": mode,
+        "statement_cache": statement_cache.stats(),
+        "credential_cache": credential_cache.stats(),
+        "response_cache": response_cache.stats(),
+    }
+    if mode == "executor":
+        content["executor"] = get_db_executor().stats()
+    # Only a group committer already running is reported, it is created by the first write
+    group_committer = find_group_committer(db_writer_engine)
+    if group_committer is not None:
+        content["group_commit"] = group_committer.stats()
+
+    return JSONResponse(status_code=HTTPResponseCode.OK, content=content)
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends
+
+from src.db.operations.reference_data import refresh_reference_data_on_db
+from src.db.runner import db_runner_dependency
+from src.models.error_response import ErrorResponse
+from src.utils.security import user_is_authenticated
+
+router = APIRouter(dependencies=[Depends(user_is_authenticated)])
+
+
+@router.post(
+    "/reference-data/refresh",
+    responses={
+        "401": {"model": ErrorResponse},
+        "500": {"model": ErrorResponse},
+    },
+    summary="To reload the lookup tables (reservation statuses) of this worker from the database.",
+    tags=["Reference data"],
+)
+async def refresh_reference_data(db_runner: db_runner_dependency) -> dict[str, dict[int, str]]:
+    return await db_runner.run(refresh_reference_data_on_db)
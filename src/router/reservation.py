@@ -1,16 +1,30 @@
-from fastapi import APIRouter, Depends, Path
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Path, Query
 
-from src.db.engine import db_dependency
 from src.db.operations.reservation import (
     create_reservation_on_db,
+    create_reservations_on_db,
     get_reservation_out_from_db,
     get_reservations_with_offset_and_limit,
+    return_reservations_on_db,
     update_reservation_on_db,
 )
+from src.db.runner import db_runner_dependency, group_commit_db_runner_dependency
 from src.helper.pagination import pager_params_dependency
+from src.helper.response import ModelJSONResponse
 from src.models.error_response import ErrorResponse
 from src.models.http_response_code import HTTPResponseCode
-from src.models.reservation import ReservationIn, ReservationOut, ReservationsList
+from src.models.reservation import (
+    ReservationBatchIn,
+    ReservationBatchOut,
+    ReservationFilters,
+    ReservationIn,
+    ReservationOut,
+    ReservationReturnsIn,
+    ReservationReturnsOut,
+    ReservationsList,
+)
 from src.utils.security import user_is_authenticated
 
 router = APIRouter(dependencies=[Depends(user_is_authenticated)])
@@ -30,13 +44,33 @@ router = APIRouter(dependencies=[Depends(user_is_authenticated)])
     status_code=HTTPResponseCode.CREATED,
 )
 async def create_reservation(
-    db_session: db_dependency,
+    db_runner: group_commit_db_runner_dependency,
     reservation_in: ReservationIn,
 ) -> ReservationOut | ErrorResponse:
-    new_reservation = create_reservation_on_db(db_session, reservation_in)
+    new_reservation = await db_runner.run(create_reservation_on_db, reservation_in)
     return new_reservation
 
 
+@router.post(
+    "/reservations/batch",
+    response_model=ReservationBatchOut,
+    responses={
+        "401": {"model": ErrorResponse},
+        "404": {"model": ErrorResponse},
+        "500": {"model": ErrorResponse},
+    },
+    summary="To reserve several books for a user, with the result of each book.",
+    tags=["Reservations"],
+    status_code=HTTPResponseCode.OK,
+)
+async def create_reservations(
+    db_runner: group_commit_db_runner_dependency,
+    batch_in: ReservationBatchIn,
+) -> ReservationBatchOut | ErrorResponse:
+    reservations = await db_runner.run(create_reservations_on_db, batch_in)
+    return reservations
+
+
 @router.get(
     "/reservations/{reservation_id}",
     response_model=ReservationOut,
@@ -49,14 +83,14 @@ async def create_reservation(
     tags=["Reservations"],
 )
 async def get_reservation(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
     reservation_id: int = Path(
         ...,
         title="Reservation ID",
         examples=[1],
     ),
 ) -> ReservationOut | ErrorResponse:
-    reservation_out = get_reservation_out_from_db(db_session, reservation_id)
+    reservation_out = await db_runner.run(get_reservation_out_from_db, reservation_id)
     return reservation_out
 
 
@@ -71,14 +105,36 @@ async def get_reservation(
     tags=["Reservations"],
 )
 async def get_all_reservations(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
     pager_params: pager_params_dependency,
-) -> ReservationsList | ErrorResponse:
-    reservations = get_reservations_with_offset_and_limit(
-        db_session,
+    filters: Annotated[ReservationFilters, Query()],
+) -> ModelJSONResponse:
+    reservations = await db_runner.run(
+        get_reservations_with_offset_and_limit,
         offset=pager_params["skip"],
         limit=pager_params["limit"],
+        cursor=pager_params["cursor"],
+        include_total=pager_params["include_total"],
+        filters=filters,
     )
+    return ModelJSONResponse(reservations)
+
+
+@router.put(
+    "/reservations/returns",
+    response_model=ReservationReturnsOut,
+    responses={
+        "401": {"model": ErrorResponse},
+        "500": {"model": ErrorResponse},
+    },
+    summary="To return several borrowed books, with the result of each reservation.",
+    tags=["Reservations"],
+)
+async def return_reservations(
+    db_runner: group_commit_db_runner_dependency,
+    returns_in: ReservationReturnsIn,
+) -> ReservationReturnsOut | ErrorResponse:
+    reservations = await db_runner.run(return_reservations_on_db, returns_in)
     return reservations
 
 
@@ -95,9 +151,11 @@ async def get_all_reservations(
     tags=["Reservations"],
 )
 async def update_reservation(
-    db_session: db_dependency,
+    db_runner: group_commit_db_runner_dependency,
     reservation_in: ReservationIn,
     reservation_id: int = Path(..., title="Reservation ID", examples=[1]),
 ) -> ReservationOut | ErrorResponse:
-    updated_reservation = update_reservation_on_db(db_session, reservation_id, reservation_in)
+    updated_reservation = await db_runner.run(
+        update_reservation_on_db, reservation_id, reservation_in
+    )
     return updated_reservation
@@ -0,0 +1,61 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from src.db.operations.search import SEARCH_TABLES, search_books_on_db
+from src.db.runner import db_runner_dependency
+from src.exceptions.app import BadRequestException
+from src.helper.conditional import get_conditional_response
+from src.helper.pagination import pager_params_dependency
+from src.models.error_response import ErrorResponse
+from src.models.http_response_code import HTTPResponseCode
+from src.models.search import BooksSearchList
+from src.utils.security import user_is_authenticated
+
+router = APIRouter(dependencies=[Depends(user_is_authenticated)])
+
+
+@router.get(
+    "/search",
+    response_model=BooksSearchList,
+    responses={
+        "400": {"model": ErrorResponse},
+        "401": {"model": ErrorResponse},
+        "500": {"model": ErrorResponse},
+        "501": {"model": ErrorResponse},
+    },
+    summary="To search the books by title, category and author names, the most relevant first.",
+    tags=["Search"],
+)
+async def search_books(
+    db_runner: db_runner_dependency,
+    request: Request,
+    pager_params: pager_params_dependency,
+    q: Annotated[
+        str,
+        Query(
+            min_length=1,
+            max_length=200,
+            title="Search text",
+            description="Words starting a word of the title, category or author names",
+            examples=["pride austen"],
+        ),
+    ],
+) -> Response:
+    # The results are ranked, a page is only reached by its offset
+    if pager_params["cursor"] is not None:
+        raise BadRequestException(
+            status_code=HTTPResponseCode.BAD_REQUEST,
+            message="The search results are paginated with skip, not with a cursor",
+        )
+
+    return await get_conditional_response(
+        request,
+        db_runner,
+        SEARCH_TABLES,
+        search_books_on_db,
+        text=q,
+        offset=pager_params["skip"],
+        limit=pager_params["limit"],
+        include_total=pager_params["include_total"],
+    )
@@ -1,13 +1,21 @@
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Request, Response
 
-from src.db.engine import db_dependency
 from src.db.operations.stock import (
+    STOCK_TABLES,
     add_new_quantity_to_the_existing_stocks_on_db,
     create_stock_on_db,
+    create_stocks_on_db,
     get_stock_book_out_from_db,
+    get_stock_version_from_db,
     get_stocks_with_offset_and_limit,
 )
+from src.db.runner import db_runner_dependency
+from src.helper.bulk import bulk_openapi_extra, create_in_bulk
+from src.helper.conditional import get_entity_response
 from src.helper.pagination import pager_params_dependency
+from src.helper.response import ModelJSONResponse
+from src.helper.response_cache import get_cached_response
+from src.models.bulk import BulkCreateOut
 from src.models.error_response import ErrorResponse
 from src.models.http_response_code import HTTPResponseCode
 from src.models.stock import StockIn, StockOut, StockQuantityAdd, StocksList
@@ -28,13 +36,33 @@ router = APIRouter(dependencies=[Depends(user_is_authenticated)])
     status_code=HTTPResponseCode.CREATED,
 )
 async def create_stock(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
     stock_in: StockIn,
 ) -> StockOut | ErrorResponse:
-    new_stock = create_stock_on_db(db_session, stock_in)
+    new_stock = await db_runner.run(create_stock_on_db, stock_in)
     return new_stock
 
 
+@router.post(
+    "/stocks/bulk",
+    response_model=BulkCreateOut,
+    responses={
+        "401": {"model": ErrorResponse},
+        "500": {"model": ErrorResponse},
+    },
+    summary="To create stocks from a body of one stock per line (NDJSON).",
+    tags=["Stocks"],
+    status_code=HTTPResponseCode.OK,
+    openapi_extra=bulk_openapi_extra(StockIn),
+)
+async def create_stocks(
+    db_runner: db_runner_dependency,
+    request: Request,
+) -> ModelJSONResponse:
+    stocks = await create_in_bulk(request, db_runner, StockIn, create_stocks_on_db)
+    return ModelJSONResponse(stocks)
+
+
 @router.get(
     "/stocks/{book_id}",
     response_model=StockOut,
@@ -47,15 +75,17 @@ async def create_stock(
     tags=["Stocks"],
 )
 async def get_stock(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
+    request: Request,
     book_id: int = Path(
         ...,
         title="Book ID",
         examples=[1],
     ),
-) -> StockOut | ErrorResponse:
-    stock_out = get_stock_book_out_from_db(db_session, book_id)
-    return stock_out
+) -> Response:
+    return await get_entity_response(
+        request, db_runner, get_stock_version_from_db, get_stock_book_out_from_db, book_id
+    )
 
 
 @router.get(
@@ -69,15 +99,20 @@ async def get_stock(
     tags=["Stocks"],
 )
 async def get_all_stocks(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
+    request: Request,
     pager_params: pager_params_dependency,
-) -> StocksList | ErrorResponse:
-    stocks = get_stocks_with_offset_and_limit(
-        db_session,
+) -> Response:
+    return await get_cached_response(
+        request,
+        db_runner,
+        STOCK_TABLES,
+        get_stocks_with_offset_and_limit,
         offset=pager_params["skip"],
         limit=pager_params["limit"],
+        cursor=pager_params["cursor"],
+        include_total=pager_params["include_total"],
     )
-    return stocks
 
 
 @router.put(
@@ -92,11 +127,11 @@ async def get_all_stocks(
     tags=["Stocks"],
 )
 async def update_stocks(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
     stock_quantity: StockQuantityAdd,
     book_id: int = Path(..., title="Book ID", examples=[1]),
 ) -> StockOut | ErrorResponse:
-    updated_stock = add_new_quantity_to_the_existing_stocks_on_db(
-        db_session, book_id, stock_quantity
+    updated_stock = await db_runner.run(
+        add_new_quantity_to_the_existing_stocks_on_db, book_id, stock_quantity
     )
     return updated_stock
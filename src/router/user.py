@@ -1,13 +1,21 @@
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Request, Response
 
-from src.db.engine import db_dependency
 from src.db.operations.user import (
+    USER_TABLES,
     create_user_on_db,
+    create_users_on_db,
     get_user_out_from_db,
+    get_user_version_from_db,
     get_users_with_offset_and_limit,
     update_user_on_db,
 )
+from src.db.runner import db_runner_dependency
+from src.helper.bulk import bulk_openapi_extra, create_in_bulk
+from src.helper.conditional import get_entity_response
 from src.helper.pagination import pager_params_dependency
+from src.helper.response import ModelJSONResponse
+from src.helper.response_cache import get_cached_response
+from src.models.bulk import BulkCreateOut
 from src.models.error_response import ErrorResponse
 from src.models.http_response_code import HTTPResponseCode
 from src.models.user import UserIn, UserOut, UsersList
@@ -28,13 +36,33 @@ router = APIRouter(dependencies=[Depends(user_is_authenticated)])
     status_code=HTTPResponseCode.CREATED,
 )
 async def create_user(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
     user_in: UserIn,
 ) -> UserOut | ErrorResponse:
-    new_user = create_user_on_db(db_session, user_in)
+    new_user = await db_runner.run(create_user_on_db, user_in)
     return new_user
 
 
+@router.post(
+    "/users/bulk",
+    response_model=BulkCreateOut,
+    responses={
+        "401": {"model": ErrorResponse},
+        "500": {"model": ErrorResponse},
+    },
+    summary="To create users from a body of one user per line (NDJSON), emails should be unique.",
+    tags=["Users"],
+    status_code=HTTPResponseCode.OK,
+    openapi_extra=bulk_openapi_extra(UserIn),
+)
+async def create_users(
+    db_runner: db_runner_dependency,
+    request: Request,
+) -> ModelJSONResponse:
+    users = await create_in_bulk(request, db_runner, UserIn, create_users_on_db)
+    return ModelJSONResponse(users)
+
+
 @router.get(
     "/users/{user_id}",
     response_model=UserOut,
@@ -47,15 +75,17 @@ async def create_user(
     tags=["Users"],
 )
 async def get_user(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
+    request: Request,
     user_id: int = Path(
         ...,
         title="User ID",
         examples=[1],
     ),
-) -> UserOut | ErrorResponse:
-    user_out = get_user_out_from_db(db_session, user_id)
-    return user_out
+) -> Response:
+    return await get_entity_response(
+        request, db_runner, get_user_version_from_db, get_user_out_from_db, user_id
+    )
 
 
 @router.get(
@@ -69,15 +99,20 @@ async def get_user(
     tags=["Users"],
 )
 async def get_all_users(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
+    request: Request,
     pager_params: pager_params_dependency,
-) -> UsersList | ErrorResponse:
-    users = get_users_with_offset_and_limit(
-        db_session,
+) -> Response:
+    return await get_cached_response(
+        request,
+        db_runner,
+        USER_TABLES,
+        get_users_with_offset_and_limit,
         offset=pager_params["skip"],
         limit=pager_params["limit"],
+        cursor=pager_params["cursor"],
+        include_total=pager_params["include_total"],
     )
-    return users
 
 
 @router.put(
@@ -92,9 +127,9 @@ async def get_all_users(
     tags=["Users"],
 )
 async def update_user(
-    db_session: db_dependency,
+    db_runner: db_runner_dependency,
     user_in: UserIn,
     user_id: int = Path(..., title="User ID", examples=[1]),
 ) -> UserOut | ErrorResponse:
-    updated_user = update_user_on_db(db_session, user_id, user_in)
+    updated_user = await db_runner.run(update_user_on_db, user_id, user_in)
     return updated_user
@@ -0,0 +1,172 @@
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import threading
+import time
+from typing import Any
+
+from src.config.config import APP_CONFIG
+from src.exceptions.app import AuthenticationException
+from src.models.http_response_code import HTTPResponseCode
+
+
+class TokenDenyList:
+    """Identifiers of the revoked access tokens, kept in memory until the tokens expire.
+
+    A token expires a few minutes after being issued, the list only holds the tokens revoked
+    during that time. It is not shared between processes: a token revoked by one worker is
+    still accepted by the other ones until it expires.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._expirations: dict[str, float] = {}
+
+    def add(self, token_id: str, expires_at: float) -> None:
+        """Revoke a token until its expiry, dropping the revocations of expired tokens.
+
+        Args:
+            token_id (str): Identifier of the token.
+            expires_at (float): Expiry of the token (seconds since the epoch).
+        """
+        now = time.time()
+        with self._lock:
+            self._expirations = {
+                other_id: other_expires_at
+                for other_id, other_expires_at in self._expirations.items()
+                if other_expires_at > now
+            }
+            self._expirations[token_id] = expires_at
+
+    def contains(self, token_id: str) -> bool:
+        """Check whether a token was revoked.
+
+        Args:
+            token_id (str): Identifier of the token.
+
+        Returns:
+            bool: True if the token was revoked.
+        """
+        with self._lock:
+            return token_id in self._expirations
+
+
+def get_token_secret() -> bytes:
+    """Get the key signing the access tokens.
+
+    Without a configured secret, a random key is drawn for the process: the tokens are only
+    accepted by the process which issued them and not after a restart.
+
+    Returns:
+        bytes: Signing key.
+    """
+    secret = APP_CONFIG["authentication"]["token"]["secret"]
+    return secret.encode() if secret else secrets.token_bytes(32)
+
+
+TOKEN_SECRET = get_token_secret()
+token_deny_list = TokenDenyList()
+
+# Type of each claim of the access tokens, see `create_access_token`
+CLAIM_TYPES: dict[str, type] = {"sub": str, "exp": int, "jti": str}
+
+
+def encode_base64url(data: bytes) -> str:
+    """Encode bytes to unpadded base64url."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def decode_base64url(data: str) -> bytes:
+    """Decode unpadded base64url, raising a ValueError if invalid."""
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def has_valid_claims(claims: Any) -> bool:
+    """Check that the claims of a token are an object with the claims of `CLAIM_TYPES`, of
+    their exact type (a boolean is not an expiry)."""
+    return isinstance(claims, dict) and all(
+        type(claims.get(name)) is claim_type for name, claim_type in CLAIM_TYPES.items()
+    )
+
+
+def get_signature(payload: str) -> str:
+    """Get the HMAC-SHA256 signature of an encoded payload."""
+    return encode_base64url(
+        hmac.new(TOKEN_SECRET, payload.encode("ascii"), hashlib.sha256).digest()
+    )
+
+
+def create_access_token(user_id: str) -> str:
+    """Create a signed access token for an admin user.
+
+    The token is ``<payload>.<signature>``: the base64url JSON of the admin user ID
+    (``sub``), the expiry (``exp``, seconds since the epoch) and a random identifier
+    (``jti``, used to revoke it), followed by its HMAC-SHA256 signature.
+
+    Args:
+        user_id (str): Admin user ID.
+
+    Returns:
+        str: Access token.
+    """
+    claims = {
+        "sub": user_id,
+        "exp": int(time.time()) + APP_CONFIG["authentication"]["token"]["ttl"],
+        "jti": secrets.token_hex(16),
+    }
+    payload = encode_base64url(json.dumps(claims, separators=(",", ":")).encode())
+    return f"{payload}.{get_signature(payload)}"
+
+
+def verify_access_token(token: str) -> dict[str, Any]:
+    """Verify the signature, the expiry and the revocation of an access token.
+
+    No database query nor password hash is needed, the claims are trusted once the
+    signature matches.
+
+    Args:
+        token (str): Access token.
+
+    Raises:
+        AuthenticationException: The token is malformed (claims included), forged, expired
+                                 or revoked.
+
+    Returns:
+        dict[str, Any]: Claims of the token.
+    """
+    auth_exception = AuthenticationException(
+        status_code=HTTPResponseCode.UNAUTHORIZED,
+        message="Invalid or expired token",
+    )
+    payload, _, signature = token.partition(".")
+    if not token.isascii() or not secrets.compare_digest(signature, get_signature(payload)):
+        raise auth_exception
+
+    try:
+        claims: dict[str, Any] = json.loads(decode_base64url(payload))
+    except ValueError as exc:
+        raise auth_exception from exc
+
+    if (
+        not has_valid_claims(claims)
+        or claims["exp"] <= time.time()
+        or token_deny_list.contains(claims["jti"])
+    ):
+        raise auth_exception
+
+    return claims
+
+
+def revoke_access_token(token: str) -> None:
+    """Revoke a valid access token until its expiry.
+
+    Args:
+        token (str): Access token.
+
+    Raises:
+        AuthenticationException: The token is malformed, forged, expired or revoked.
+    """
+    claims = verify_access_token(token)
+    token_deny_list.add(claims["jti"], claims["exp"])
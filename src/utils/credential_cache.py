@@ -0,0 +1,162 @@
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, object_session
+
+from src.config.config import APP_CONFIG
+from src.db.models.admin_user import AdminUser
+
+# Session info flag set when the admin users are written in the current transaction
+ADMIN_USERS_CHANGED = "admin_users_changed"
+
+
+class CredentialCache:
+    """Remember the Basic credentials successfully verified against `admin_users`.
+
+    The entries are keyed by an HMAC-SHA256 of the username and password with a random key
+    of the process, the plain-text passwords are not kept in memory. Only successful
+    verifications are cached: a wrong password always pays the database lookup and the hash.
+    An entry expires after ``ttl`` seconds, the least recently used one is evicted past
+    ``max_size`` entries, and every entry is dropped when the admin users are changed
+    through the ORM of the process. A change made by another process (a migration, another
+    worker) is seen once the entries have expired.
+    """
+
+    def __init__(self, *, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._key = secrets.token_bytes(32)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, float] = OrderedDict()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def is_enabled(self) -> bool:
+        """Whether verifications are cached (a zero size or TTL disables the cache)."""
+        return self.max_size > 0 and self.ttl > 0
+
+    @property
+    def generation(self) -> int:
+        """Number of invalidations of the cache, to read before verifying credentials."""
+        return self._generation
+
+    def _get_digest(self, username: str, password: str) -> bytes:
+        """Get the keyed digest of credentials, a Basic username cannot contain a colon."""
+        return hmac.new(self._key, f"{username}:{password}".encode(), hashlib.sha256).digest()
+
+    def contains(self, username: str, password: str) -> bool:
+        """Check whether credentials were verified and have not expired.
+
+        Args:
+            username (str): Basic username.
+            password (str): Basic password.
+
+        Returns:
+            bool: True if the credentials are valid according to the cache.
+        """
+        if not self.is_enabled:
+            return False
+
+        digest = self._get_digest(username, password)
+        with self._lock:
+            expires_at = self._entries.get(digest)
+            if expires_at is not None and expires_at > time.monotonic():
+                self._entries.move_to_end(digest)
+                self._hits += 1
+                return True
+
+            if expires_at is not None:
+                del self._entries[digest]
+            self._misses += 1
+            return False
+
+    def add(self, username: str, password: str, generation: int) -> None:
+        """Remember credentials verified against the database.
+
+        The credentials are not added if the cache was invalidated since the given
+        generation: the admin user read to verify them may be outdated.
+
+        Args:
+            username (str): Basic username.
+            password (str): Basic password.
+            generation (int): Generation of the cache read before the verification.
+        """
+        if not self.is_enabled:
+            return
+
+        digest = self._get_digest(username, password)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[digest] = time.monotonic() + self.ttl
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. after a change of the admin users."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._invalidations += 1
+
+    def stats(self) -> dict[str, int]:
+        """Get the credential cache statistics.
+
+        Returns:
+            dict[str, int]: Size, hits, misses and invalidations of the cache.
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+            }
+
+
+def register_admin_user_invalidation(cache: CredentialCache) -> None:  # noqa: PLR0915
+    """Clear a credential cache when a transaction writing the admin users is committed.
+
+    The admin users written by the unit of work or by ORM-enabled insert, update and delete
+    statements flag their session, the cache is cleared once the session commits.
+
+    Args:
+        cache (CredentialCache): Credential cache.
+    """
+
+    def flag_admin_user_change(_mapper: Any, _connection: Any, target: AdminUser) -> None:
+        session = object_session(target)
+        if session is not None:
+            session.info[ADMIN_USERS_CHANGED] = True
+
+    for identifier in ("after_insert", "after_update", "after_delete"):
+        event.listen(AdminUser, identifier, flag_admin_user_change)
+
+    @event.listens_for(Session, "do_orm_execute")
+    def flag_admin_user_statement(orm_execute_state: ORMExecuteState) -> None:
+        if orm_execute_state.is_select or orm_execute_state.bind_mapper is None:
+            return
+        if orm_execute_state.bind_mapper.class_ is AdminUser:
+            orm_execute_state.session.info[ADMIN_USERS_CHANGED] = True
+
+    @event.listens_for(Session, "after_commit")
+    def clear_after_admin_user_change(session: Session) -> None:
+        if session.info.pop(ADMIN_USERS_CHANGED, False):
+            cache.clear()
+
+
+credential_cache = CredentialCache(
+    max_size=APP_CONFIG["authentication"]["basic"]["cache"]["max_size"],
+    ttl=APP_CONFIG["authentication"]["basic"]["cache"]["ttl"],
+)
+register_admin_user_invalidation(credential_cache)
@@ -2,17 +2,27 @@ import hashlib
 import secrets
 from typing import Annotated
 
-from fastapi import Depends
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from fastapi import Depends, HTTPException
+from fastapi.security import (
+    HTTPAuthorizationCredentials,
+    HTTPBasic,
+    HTTPBasicCredentials,
+    HTTPBearer,
+)
+from sqlmodel import Session
 
 from src.config.config import APP_CONFIG
 from src.constants.security import PASSWORD_MIN_LEN
-from src.db.engine import db_dependency
+from src.db.engine import db_dependency, db_reader_engine_dependency
 from src.db.operations.admin_user import get_admin_user
 from src.exceptions.app import AuthenticationException
 from src.models.http_response_code import HTTPResponseCode
+from src.utils.access_token import verify_access_token
+from src.utils.credential_cache import credential_cache
 
-security = HTTPBasic()
+# Either scheme may authenticate a request, each one lets the other be used
+security = HTTPBasic(auto_error=False)
+bearer_security = HTTPBearer(auto_error=False)
 
 
 def hash_password(password: str) -> str:
@@ -51,24 +61,30 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return secrets.compare_digest(hash_password(plain_password), hashed_password)
 
 
-def user_is_authenticated(
-    credentials: Annotated[HTTPBasicCredentials, Depends(security)], db_session: db_dependency
-) -> None:
-    """The method is used to valid the authentication
+def verify_credentials(  # noqa: PLR0915
+    credentials: HTTPBasicCredentials, db_session: db_dependency
+) -> str:
+    """Verify Basic credentials against the admin users.
+
+    Credentials verified by a previous request are accepted from the credential cache,
+    without reading the admin user nor hashing the password.
 
     Args:
-        credentials (Annotated[HTTPBasicCredentials, Depends): Basic credentials
+        credentials (HTTPBasicCredentials): Basic credentials
         db_session (db_dependency): Database session.
 
     Raises:
         AuthenticationException: Raise exception if it's not a valid username or password
-    """
-    if not APP_CONFIG["authentication"]["basic"]["enable"]:
-        return None
 
+    Returns:
+        str: Admin user ID.
+    """
     username = credentials.username
     password = credentials.password
+    if credential_cache.contains(username, password):
+        return username
 
+    generation = credential_cache.generation
     admin_user = get_admin_user(db_session, username)
     auth_exception = AuthenticationException(
         status_code=HTTPResponseCode.UNAUTHORIZED,
@@ -83,3 +99,51 @@ def user_is_authenticated(
 
     if not (is_correct_username and is_correct_password):
         raise auth_exception
+
+    credential_cache.add(username, password, generation)
+    return username
+
+
+def user_is_authenticated(
+    credentials: Annotated[HTTPBasicCredentials | None, Depends(security)],
+    db_engine: db_reader_engine_dependency,
+    bearer_credentials: Annotated[
+        HTTPAuthorizationCredentials | None, Depends(bearer_security)
+    ] = None,
+) -> None:
+    """The method is used to valid the authentication
+
+    A bearer access token is checked from its signature only, with no database query. Basic
+    credentials are verified by `verify_credentials` with a session of the reader engine,
+    closed before the route runs: the lookup never takes the session of the request, which
+    is on the writer connection for the mutating requests (a SQLite write lock held by a
+    dependency would lock out the writer of the route in async mode).
+
+    Args:
+        credentials (Annotated[HTTPBasicCredentials | None, Depends): Basic credentials
+        db_engine (db_reader_engine_dependency): Reader database engine.
+        bearer_credentials (Annotated[HTTPAuthorizationCredentials | None, Depends): Bearer
+            access token.
+
+    Raises:
+        HTTPException: Raise exception if the request has no credentials
+        AuthenticationException: Raise exception if it's not a valid token, username or
+            password
+    """
+    if not APP_CONFIG["authentication"]["basic"]["enable"]:
+        return None
+
+    if bearer_credentials is not None:
+        verify_access_token(bearer_credentials.credentials)
+        return None
+
+    if credentials is None:
+        # Same response as HTTPBasic without credentials
+        raise HTTPException(
+            status_code=HTTPResponseCode.UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Basic"},
+        )
+
+    with Session(db_engine) as db_session:
+        verify_credentials(credentials, db_session)
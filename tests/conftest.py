@@ -8,9 +8,20 @@ from alembic.config import Config
 from fastapi.testclient import TestClient
 from sqlmodel import text
 
-from src.config.config import APP_CONFIG
 from src.db.check import db_settings_initializations
-from src.db.engine import get_db_session, get_db_test_session
+from src.db.engine import (
+    TESTING_PROFILE,
+    get_database_url,
+    get_db_async_session,
+    get_db_async_test_session,
+    get_db_engine,
+    get_db_session,
+    get_db_test_engine,
+    get_db_test_session,
+    get_db_writer_engine,
+    get_sqlite_database_file,
+)
+from src.db.reference_data import load_reference_data
 from src.main import app
 from src.utils.security import user_is_authenticated
 
@@ -33,12 +44,10 @@ def setup_db() -> Iterator:  # type: ignore
 
     alembic_path = get_alembic_path()
     alembic_cfg = Config(alembic_path)
-    alembic_cfg.set_main_option(
-        "sqlalchemy.url",
-        f"sqlite:///{APP_CONFIG['testing_db']['file']}",
-    )
+    alembic_cfg.set_main_option("sqlalchemy.url", get_database_url(TESTING_PROFILE))
     command.upgrade(alembic_cfg, "head")
-    db_settings_initializations()
+    db_settings_initializations(get_db_test_engine())
+    load_reference_data(get_db_test_engine())
     delete_data_from_tables()
     yield
     # command.downgrade(alembic_cfg, "base")
@@ -46,19 +55,22 @@ def setup_db() -> Iterator:  # type: ignore
 
 
 def remove_test_db_file() -> None:
-    """Remove test db file."""
-    if os.path.exists(APP_CONFIG["testing_db"]["file"]):
-        os.remove(APP_CONFIG["testing_db"]["file"])
+    """Remove test db file (only SQLite databases are backed by a file)."""
+    test_db_file = get_sqlite_database_file(get_database_url(TESTING_PROFILE))
+    if test_db_file is not None and os.path.exists(test_db_file):
+        os.remove(test_db_file)
 
 
 def delete_data_from_tables() -> None:
     """Delete the data."""
+    tables = ("reservations", "users", "stocks", "books", "authors")
     session = next(get_db_test_session())
-    session.execute(text("DELETE FROM reservations;"))
-    session.execute(text("DELETE FROM users;"))
-    session.execute(text("DELETE FROM stocks;"))
-    session.execute(text("DELETE FROM books;"))
-    session.execute(text("DELETE FROM authors;"))
+    if session.get_bind().dialect.name == "postgresql":
+        # Restart the sequences as well, the tests rely on the ids starting from 1.
+        session.execute(text(f"TRUNCATE {', '.join(tables)} RESTART IDENTITY;"))
+    else:
+        for table in tables:
+            session.execute(text(f"DELETE FROM {table};"))
     session.commit()
     session.close()
 
@@ -71,6 +83,9 @@ def mock_user_is_authenticated() -> None:
 def client():  # type: ignore
     """Fixture to override the FastAPI app's dependency."""
     app.dependency_overrides[get_db_session] = get_db_test_session
+    app.dependency_overrides[get_db_async_session] = get_db_async_test_session
+    app.dependency_overrides[get_db_engine] = get_db_test_engine
+    app.dependency_overrides[get_db_writer_engine] = get_db_test_engine
     # Disable Basic authentication
     app.dependency_overrides[user_is_authenticated] = mock_user_is_authenticated
 
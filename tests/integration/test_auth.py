@@ -0,0 +1,57 @@
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.db.engine import get_db_test_session
+from src.db.models.admin_user import AdminUser
+from src.db.operations.admin_user import get_admin_user
+from src.exceptions.app import AuthenticationException
+from src.main import app
+from src.models.http_response_code import HTTPResponseCode
+from src.utils.security import hash_password, user_is_authenticated
+
+USERNAME = "token@library.com"
+PASSWORD = "tokenpassword"
+
+
+@pytest.fixture
+def authenticated_client(client: TestClient) -> Iterator[TestClient]:
+    """Client of the application with the authentication enabled and an admin user."""
+    session = next(get_db_test_session())
+    if get_admin_user(session, USERNAME) is None:
+        session.add(AdminUser(user_id=USERNAME, password=hash_password(PASSWORD)))
+        session.commit()
+    session.close()
+
+    override = app.dependency_overrides.pop(user_is_authenticated)
+    yield client
+    app.dependency_overrides[user_is_authenticated] = override
+
+
+def test_access_token(authenticated_client: TestClient) -> None:
+    """Test the exchange of credentials for an access token, then its revocation."""
+    response = authenticated_client.post("/auth/token", auth=(USERNAME, PASSWORD))
+    assert response.status_code == HTTPResponseCode.OK
+    assert response.json()["token_type"] == "bearer"
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    assert authenticated_client.get("/authors", headers=headers).status_code == HTTPResponseCode.OK
+
+    response = authenticated_client.post("/auth/revoke", headers=headers)
+    assert response.status_code == HTTPResponseCode.NO_CONTENT
+    with pytest.raises(AuthenticationException) as exc_info:
+        authenticated_client.get("/authors", headers=headers)
+    assert exc_info.value.status_code == HTTPResponseCode.UNAUTHORIZED
+
+
+def test_access_token_with_wrong_credentials(authenticated_client: TestClient) -> None:
+    """Test that no token is issued for wrong credentials nor accepted when forged."""
+    with pytest.raises(AuthenticationException) as exc_info:
+        authenticated_client.post("/auth/token", auth=(USERNAME, "wrongpassword"))
+    assert exc_info.value.status_code == HTTPResponseCode.UNAUTHORIZED
+
+    with pytest.raises(AuthenticationException) as exc_info:
+        authenticated_client.get("/authors", headers={"Authorization": "Bearer forged"})
+    assert exc_info.value.status_code == HTTPResponseCode.UNAUTHORIZED
+    assert authenticated_client.get("/authors").status_code == HTTPResponseCode.UNAUTHORIZED
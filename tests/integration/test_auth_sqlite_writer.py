@@ -0,0 +1,103 @@
+import shutil
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator
+
+import pytest
+from fastapi import Request
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.db.engine import (
+    TESTING_PROFILE,
+    create_async_engine_from_profile,
+    create_engine_from_profile,
+    get_database_profile,
+    get_database_url,
+    get_db_async_session,
+    get_db_engine,
+    get_db_session,
+    get_sqlite_database_file,
+    is_write_request,
+)
+from src.db.models.admin_user import AdminUser
+from src.main import app
+from src.models.http_response_code import HTTPResponseCode
+from src.utils.credential_cache import credential_cache
+from src.utils.security import hash_password, user_is_authenticated
+
+USERNAME = "writer@library.com"
+PASSWORD = "writerpassword"
+
+
+def get_writer_profile(database_file: Path) -> dict[str, Any]:
+    """Profile of the test database copy with the SQLite writer, as in the dev profile."""
+    return {
+        **get_database_profile(TESTING_PROFILE),
+        "url": f"sqlite:///{database_file}",
+        "pool": {"class": "QueuePool", "size": 5, "max_overflow": 0, "timeout": 5},
+        "sqlite_pragmas": {"busy_timeout": 1000, "journal_mode": "WAL", "foreign_keys": "ON"},
+        "sqlite_writer": {"enable": True, "timeout": 5},
+    }
+
+
+@pytest.fixture
+def writer_client(client: TestClient, tmp_path: Path) -> Iterator[TestClient]:  # noqa: PLR0915
+    """Client of the application on reader and writer engines, with the authentication."""
+    test_database_file = get_sqlite_database_file(get_database_url(TESTING_PROFILE))
+    if test_database_file is None:
+        pytest.skip("The SQLite writer only applies to a SQLite test database")
+    database_file = tmp_path / "writer.db"
+    shutil.copy(test_database_file, database_file)
+
+    profile = get_writer_profile(database_file)
+    engines: dict[bool, Engine] = {
+        is_writer: create_engine_from_profile(profile, is_writer=is_writer)
+        for is_writer in (False, True)
+    }
+    async_engines: dict[bool, AsyncEngine] = {
+        is_writer: create_async_engine_from_profile(profile, is_writer=is_writer)
+        for is_writer in (False, True)
+    }
+    with Session(engines[True]) as session:
+        session.add(AdminUser(user_id=USERNAME, password=hash_password(PASSWORD)))
+        session.commit()
+
+    def get_session(request: Request) -> Iterator[Session]:
+        with Session(engines[is_write_request(request)]) as session:
+            yield session
+
+    async def get_async_session(request: Request) -> AsyncIterator[AsyncSession]:
+        async with AsyncSession(async_engines[is_write_request(request)]) as session:
+            yield session
+
+    overrides = dict(app.dependency_overrides)
+    app.dependency_overrides.pop(user_is_authenticated)
+    app.dependency_overrides[get_db_session] = get_session
+    app.dependency_overrides[get_db_async_session] = get_async_session
+    app.dependency_overrides[get_db_engine] = lambda: engines[False]
+    credential_cache.clear()
+    yield client
+
+    credential_cache.clear()
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(overrides)
+    for engine in engines.values():
+        engine.dispose()
+    for async_engine in async_engines.values():
+        async_engine.sync_engine.dispose()
+
+
+def test_authenticated_write_with_the_sqlite_writer(writer_client: TestClient) -> None:
+    """The credential lookup of a write request does not hold the writer of its route."""
+    author = {"birth_date": "1950-01-01", "first_name": "Ada", "last_name": "Writer"}
+    for last_name in ("Writer", "Cached"):
+        response = writer_client.post(
+            "/authors", json={**author, "last_name": last_name}, auth=(USERNAME, PASSWORD)
+        )
+        assert response.status_code == HTTPResponseCode.CREATED
+
+    response = writer_client.post("/auth/token", auth=(USERNAME, PASSWORD))
+    assert response.status_code == HTTPResponseCode.OK
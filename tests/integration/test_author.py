@@ -1,3 +1,4 @@
+import json
 from typing import Any
 
 from fastapi.testclient import TestClient
@@ -111,3 +112,33 @@ def test_create_five_authors(client: TestClient) -> None:
         author_copy["last_name"] = f"{author_copy['last_name'] + ' ' + str(i)}"
         response = client.post("/authors", json=author_copy)
         assert response.status_code == HTTPResponseCode.CREATED
+
+
+def test_create_authors_in_bulk(client: TestClient) -> None:
+    """Test the bulk creation of authors, with the result of each line."""
+    lines = [
+        json.dumps({**author, "first_name": "Bulk"}),
+        "not json",
+        json.dumps({**author, "first_name": "Bulk"}),
+        json.dumps({**author, "first_name": "Other", "nationality": "US"}),
+        json.dumps({**author, "first_name": "Other"}),
+    ]
+    response = client.post(
+        "/authors/bulk",
+        content="\n".join(lines),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == HTTPResponseCode.OK
+
+    response_json = response.json()
+    assert response_json["number_of_created"] == COUNT_TWO
+    items = response_json["items"]
+    assert [(item["line"], item["status_code"]) for item in items] == [
+        (1, HTTPResponseCode.CREATED),
+        (2, HTTPResponseCode.BAD_REQUEST),
+        (3, HTTPResponseCode.BAD_REQUEST),
+        (4, HTTPResponseCode.BAD_REQUEST),
+        (5, HTTPResponseCode.CREATED),
+    ]
+    response = client.get(f"/authors/{items[4]['id']}")
+    assert response.json()["first_name"] == "Other"
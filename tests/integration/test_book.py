@@ -1,8 +1,10 @@
+import json
 from typing import Any
 
+import pytest
 from fastapi.testclient import TestClient
 
-from src.exceptions.app import NotFoundException, SqlException
+from src.exceptions.app import BadRequestException, NotFoundException, SqlException
 from src.models.http_response_code import HTTPResponseCode
 from tests.integration.constant import COUNT_ONE, COUNT_TWO, COUNT_ZERO
 
@@ -101,12 +103,96 @@ def test_book_delete_endpoint(client: TestClient) -> None:  # noqa: PLR0915
 
 def test_create_five_books(client: TestClient) -> None:
     """Test creation of books endpoint."""
-    # For the future testings
-    for i in range(1, 6):
-        # Add second author
+    # For the future testings, one book for each of the first five authors
+    authors = client.get("/authors", params={"limit": 5}).json()["authors"]
+    for i, author in enumerate(authors, start=1):
         book_copy = book.copy()
         book_copy["title"] = f"{book_copy['title'] + ' ' + str(i)}"
         book_copy["category"] = f"{book_copy['category'] + ' ' + str(i)}"
-        book_copy["author_id"] = i
+        book_copy["author_id"] = author["id"]
         response = client.post("/books", json=book_copy)
         assert response.status_code == HTTPResponseCode.CREATED
+
+
+def test_books_cursor_pagination(client: TestClient) -> None:  # noqa: PLR0915
+    """Test the pages of the books endpoint with cursors."""
+    limit = 2
+    all_ids = [book["id"] for book in client.get("/books").json()["books"]]
+
+    # Walk forward with the next cursors, the first page comes from skip and limit
+    page = client.get("/books", params={"limit": limit}).json()
+    assert page["previous_cursor"] is None
+    pages = [[book["id"] for book in page["books"]]]
+    while page["next_cursor"] is not None:
+        page = client.get("/books", params={"limit": limit, "after": page["next_cursor"]}).json()
+        assert page["current_page"] is None
+        pages.append([book["id"] for book in page["books"]])
+    assert [book_id for ids in pages for book_id in ids] == all_ids
+
+    # And back with the previous cursors
+    backward_pages = [[book["id"] for book in page["books"]]]
+    while page["previous_cursor"] is not None:
+        page = client.get(
+            "/books", params={"limit": limit, "after": page["previous_cursor"]}
+        ).json()
+        backward_pages.append([book["id"] for book in page["books"]])
+    assert backward_pages == pages[::-1]
+
+
+def test_books_invalid_cursor(client: TestClient) -> None:
+    """Test the books endpoint with an invalid cursor."""
+    try:
+        response = client.get("/books", params={"after": "not-a-cursor"})
+        assert response.status_code == HTTPResponseCode.BAD_REQUEST
+    except BadRequestException as exc:
+        assert exc.status_code == HTTPResponseCode.BAD_REQUEST
+
+    # A valid cursor payload with a boolean id
+    tampered = "eyJpZCI6dHJ1ZSwicHJldmlvdXMiOmZhbHNlfQ"
+    with pytest.raises(BadRequestException) as exc_info:
+        client.get("/books", params={"after": tampered})
+    assert exc_info.value.status_code == HTTPResponseCode.BAD_REQUEST
+
+
+def test_books_count_and_include_total(client: TestClient) -> None:  # noqa: PLR0915
+    """Test the books count kept by the triggers and the pages without it."""
+    books = client.get("/books").json()
+    assert books["number_of_books"] == len(books["books"])
+
+    response = client.post("/books", json={**book, "title": "Counted book"})
+    assert response.status_code == HTTPResponseCode.CREATED
+    assert client.get("/books").json()["number_of_books"] == len(books["books"]) + 1
+
+    client.delete(f"/books/{response.json()['id']}")
+    assert client.get("/books").json()["number_of_books"] == len(books["books"])
+
+    page = client.get("/books", params={"limit": 1, "include_total": False}).json()
+    assert page["number_of_books"] is None
+    assert page["number_of_pages"] is None
+    assert (page["current_page"], page["next_page"], page["previous_page"]) == (1, 2, None)
+
+
+def test_create_books_in_bulk(client: TestClient) -> None:
+    """Test the bulk creation of books, a book of an unknown author is a failure of its line."""
+    lines = [
+        json.dumps({**book, "title": "Bulk book"}),
+        json.dumps({**book, "title": "Book of an unknown author", "author_id": 9999}),
+        json.dumps({**book, "title": "Bulk book"}),
+    ]
+    response = client.post(
+        "/books/bulk",
+        content="\n".join(lines),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == HTTPResponseCode.OK
+
+    response_json = response.json()
+    assert response_json["number_of_created"] == COUNT_ONE
+    items = response_json["items"]
+    assert [item["status_code"] for item in items] == [
+        HTTPResponseCode.CREATED,
+        HTTPResponseCode.BAD_REQUEST,
+        HTTPResponseCode.BAD_REQUEST,
+    ]
+    response = client.get(f"/books/{items[0]['id']}")
+    assert response.json()["title"] == "Bulk book"
@@ -0,0 +1,35 @@
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+from src.helper.response_cache import response_cache
+from src.models.http_response_code import HTTPResponseCode
+
+author: dict[str, Any] = {
+    "birth_date": "1968-07-21",
+    "first_name": "Cached",
+    "last_name": "List",
+    "nationality": "FRA",
+}
+
+
+def test_cached_list_until_a_write(client: TestClient) -> None:  # noqa: PLR0915
+    """A page is served from the cache until its table is written."""
+    response_cache.clear()
+    response = client.get("/authors?limit=100")
+    hits = response_cache.stats()["hits"]
+
+    cached_response = client.get("/authors?limit=100")
+    assert cached_response.status_code == HTTPResponseCode.OK
+    assert cached_response.content == response.content
+    assert cached_response.headers["etag"] == response.headers["etag"]
+    assert response_cache.stats()["hits"] == hits + 1
+
+    response = client.get("/authors?limit=100", headers={"If-None-Match": response.headers["etag"]})
+    assert response.status_code == HTTPResponseCode.NOT_MODIFIED
+
+    client.post("/authors", json=author)
+    response = client.get("/authors?limit=100")
+    assert response.content != cached_response.content
+    assert author["last_name"] in [row["last_name"] for row in response.json()["authors"]]
+    assert response_cache.stats()["hits"] == hits + 2  # noqa: PLR2004
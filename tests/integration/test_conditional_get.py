@@ -0,0 +1,83 @@
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+from src.models.http_response_code import HTTPResponseCode
+
+author: dict[str, Any] = {
+    "birth_date": "1975-02-11",
+    "first_name": "Jane",
+    "last_name": "Roe",
+    "nationality": "GBR",
+}
+
+
+def test_conditional_get_not_modified_until_a_write(client: TestClient) -> None:  # noqa: PLR0915
+    """A GET with the current ETag is answered by a 304 until the table is written."""
+    response = client.get("/authors")
+    assert response.status_code == HTTPResponseCode.OK
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert "last-modified" in response.headers
+
+    response = client.get("/authors", headers={"If-None-Match": etag})
+    assert response.status_code == HTTPResponseCode.NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    users_etag = client.get("/users").headers["etag"]
+    author_id = client.post("/authors", json=author).json()["id"]
+    response = client.get("/authors", headers={"If-None-Match": etag})
+    assert response.status_code == HTTPResponseCode.OK
+    assert response.headers["etag"] != etag
+    # The other tables keep their ETag
+    response = client.get("/users", headers={"If-None-Match": users_etag})
+    assert response.status_code == HTTPResponseCode.NOT_MODIFIED
+
+    response = client.get(f"/authors/{author_id}")
+    etag = response.headers["etag"]
+    response = client.get(f"/authors/{author_id}", headers={"If-None-Match": f'{etag}, W/"0"'})
+    assert response.status_code == HTTPResponseCode.NOT_MODIFIED
+
+
+def test_conditional_get_of_an_entity(client: TestClient) -> None:  # noqa: PLR0915
+    """The validators of an entity only change with the entity, not with the other rows."""
+    author_id = client.post("/authors", json={**author, "last_name": "Entity"}).json()["id"]
+    response = client.get(f"/authors/{author_id}")
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+    assert etag.startswith(f'W/"{author_id}-')
+
+    client.post("/authors", json={**author, "last_name": "Other"})
+    response = client.get(f"/authors/{author_id}", headers={"If-None-Match": etag})
+    assert response.status_code == HTTPResponseCode.NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert response.headers["last-modified"] == last_modified
+    response = client.get(f"/authors/{author_id}", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == HTTPResponseCode.NOT_MODIFIED
+    response = client.get(
+        f"/authors/{author_id}", headers={"If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"}
+    )
+    assert response.status_code == HTTPResponseCode.OK
+
+    client.put(f"/authors/{author_id}", json={**author, "last_name": "Updated"})
+    response = client.get(f"/authors/{author_id}", headers={"If-None-Match": etag})
+    assert response.status_code == HTTPResponseCode.OK
+    assert response.json()["last_name"] == "Updated"
+    assert response.headers["etag"] != etag
+
+
+def test_conditional_get_stocks_depend_on_books(client: TestClient) -> None:
+    """The ETag of the stocks changes with the books, their titles are part of the output."""
+    etag = client.get("/stocks").headers["etag"]
+    client.post(
+        "/books",
+        json={
+            "author_id": 1,
+            "category": "Poetry",
+            "published_date": "1990-01-01",
+            "title": "Conditional",
+        },
+    )
+    response = client.get("/stocks", headers={"If-None-Match": etag})
+    assert response.status_code == HTTPResponseCode.OK
@@ -0,0 +1,36 @@
+import csv
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.models.http_response_code import HTTPResponseCode
+
+
+@pytest.mark.parametrize("snapshot", [False, True])
+def test_export_books_ndjson(client: TestClient, snapshot: bool) -> None:
+    """Test the NDJSON export of the books, the rows of the list endpoint in id order."""
+    books = client.get("/books", params={"limit": 100}).json()["books"]
+
+    response = client.get("/export/books", params={"snapshot": snapshot})
+    assert response.status_code == HTTPResponseCode.OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="books.ndjson"'
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows == sorted(books, key=lambda book: book["id"])
+
+
+def test_export_authors_csv(client: TestClient) -> None:
+    """Test the CSV export of the authors, with a header row."""
+    authors = client.get("/authors", params={"limit": 100}).json()["authors"]
+
+    response = client.get("/export/authors", params={"format": "csv"})
+    assert response.status_code == HTTPResponseCode.OK
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["id"] for row in rows] == [str(author["id"]) for author in authors]
+    assert set(rows[0]) == set(authors[0])
+    assert rows[0]["birth_date"] == authors[0]["birth_date"]
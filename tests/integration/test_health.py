@@ -1,5 +1,7 @@
+import pytest
 from fastapi.testclient import TestClient
 
+from src.config.config import APP_CONFIG
 from src.models.http_response_code import HTTPResponseCode
 
 
@@ -8,3 +10,22 @@ def test_health_check(client: TestClient) -> None:
     response = client.get("/health")
     assert response.status_code == HTTPResponseCode.OK
     assert response.json() == {"status": "ok"}
+
+
+def test_database_health_check(client: TestClient) -> None:
+    """Test the database health check endpoint."""
+    response = client.get("/health/database")
+    assert response.status_code == HTTPResponseCode.OK
+    assert response.json()["status"] == "ok"
+    assert response.json()["execution_mode"] in ("sync", "async", "executor")
+
+
+def test_database_health_check_does_not_start_the_group_commit(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The group commit is only reported once its committer runs, the check does not create
+    it (a SQLite engine without the writer connection would reject it)."""
+    monkeypatch.setitem(APP_CONFIG["database"]["execution"]["group_commit"], "enable", True)
+    response = client.get("/health/database")
+    assert response.status_code == HTTPResponseCode.OK
+    assert "group_commit" not in response.json()
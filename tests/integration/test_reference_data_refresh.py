@@ -0,0 +1,11 @@
+from fastapi.testclient import TestClient
+
+from src.models.http_response_code import HTTPResponseCode
+from src.models.reservation_status import ReservationStatus
+
+
+def test_refresh_reference_data(client: TestClient) -> None:
+    """Test the reload of the lookup tables."""
+    response = client.post("/reference-data/refresh")
+    assert response.status_code == HTTPResponseCode.OK
+    assert sorted(response.json()["reservation_status"].values()) == sorted(ReservationStatus)
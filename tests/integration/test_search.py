@@ -0,0 +1,62 @@
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.db.engine import TESTING_PROFILE, get_database_url, get_sqlite_database_file
+from src.exceptions.app import BadRequestException, SqlException
+from src.models.http_response_code import HTTPResponseCode
+from tests.integration.constant import COUNT_ONE, COUNT_ZERO
+
+book: dict[str, Any] = {
+    "author_id": 1,
+    "category": "Mystery",
+    "published_date": "2001-09-30",
+    "title": "The Zephyrine Chronicles",
+}
+
+# The search index is an FTS5 table, the route answers 501 on the other databases
+is_sqlite = get_sqlite_database_file(get_database_url(TESTING_PROFILE)) is not None
+sqlite_only = pytest.mark.skipif(not is_sqlite, reason="The search needs SQLite FTS5")
+
+
+def search(client: TestClient, q: str) -> list[dict[str, Any]]:
+    """Get the books found by a search."""
+    response = client.get("/search", params={"q": q})
+    assert response.status_code == HTTPResponseCode.OK
+    results: list[dict[str, Any]] = response.json()["results"]
+    return results
+
+
+@sqlite_only
+def test_search_follows_the_book_writes(client: TestClient) -> None:  # noqa: PLR0915
+    """A created book is found by the prefixes of its words, and not after its update."""
+    book_id = client.post("/books", json=book).json()["id"]
+    author = client.get("/authors/1").json()
+
+    results = search(client, f"zephyr {author['last_name']}")
+    assert [result["id"] for result in results] == [book_id]
+    assert results[0]["author_first_name"] == author["first_name"]
+
+    response = client.get("/search", params={"q": "zephyr", "include_total": False})
+    assert response.json()["number_of_results"] is None
+
+    client.put(f"/books/{book_id}", json={**book, "title": "The Aurelian Chronicles"})
+    assert len(search(client, "zephyr")) == COUNT_ZERO
+    assert len(search(client, "aurelian mystery")) == COUNT_ONE
+
+
+@sqlite_only
+def test_search_without_word(client: TestClient) -> None:
+    """A search text without any word is rejected."""
+    with pytest.raises(BadRequestException) as exc_info:
+        client.get("/search", params={"q": '"*"'})
+    assert exc_info.value.status_code == HTTPResponseCode.BAD_REQUEST
+
+
+@pytest.mark.skipif(is_sqlite, reason="The search is available on SQLite")
+def test_search_not_implemented(client: TestClient) -> None:
+    """The search route is not implemented on the databases without FTS5."""
+    with pytest.raises(SqlException) as exc_info:
+        client.get("/search", params={"q": "chronicles"})
+    assert exc_info.value.status_code == HTTPResponseCode.NOT_IMPLEMENTED
@@ -1,10 +1,11 @@
+import json
 from typing import Any
 
 from fastapi.testclient import TestClient
 
 from src.exceptions.app import NotFoundException, SqlException
 from src.models.http_response_code import HTTPResponseCode
-from tests.integration.constant import COUNT_ZERO
+from tests.integration.constant import COUNT_ONE, COUNT_TWO, COUNT_ZERO
 
 stock: dict[str, Any] = {"book_id": 1, "stock_quantity": 1}
 
@@ -64,3 +65,43 @@ def test_book_stocks_endpoint_fail(client: TestClient) -> None:
 
     response_json = response.json()
     assert response_json["stock_quantity"] == 11  # noqa: PLR2004
+
+
+def test_create_stocks_in_bulk(client: TestClient) -> None:
+    """Test the bulk creation of stocks, a book already in the stocks is a failure of its line."""
+    book = {"title": "Book without stock", "author_id": 1, "published_date": "1980-05-15"}
+    book_id = client.post("/books", json=book).json()["id"]
+    lines = [
+        json.dumps({"book_id": 1, "stock_quantity": 1}),
+        json.dumps({"book_id": book_id, "stock_quantity": 2}),
+        json.dumps({"book_id": book_id}),
+    ]
+    response = client.post(
+        "/stocks/bulk",
+        content="\n".join(lines),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == HTTPResponseCode.OK
+
+    response_json = response.json()
+    assert response_json["number_of_created"] == COUNT_ONE
+    assert [item["status_code"] for item in response_json["items"]] == [
+        HTTPResponseCode.BAD_REQUEST,
+        HTTPResponseCode.CREATED,
+        HTTPResponseCode.BAD_REQUEST,
+    ]
+    response = client.get(f"/stocks/{book_id}")
+    assert response.json()["stock_quantity"] == COUNT_TWO
+
+
+def test_conditional_get_of_a_stock_depends_on_its_book(client: TestClient) -> None:
+    """The ETag of a stock changes with its book, its title is part of the output."""
+    book_id = client.get("/stocks").json()["stocks"][0]["book_id"]
+    etag = client.get(f"/stocks/{book_id}").headers["etag"]
+
+    book = client.get(f"/books/{book_id}").json()
+    book.pop("id")
+    client.put(f"/books/{book_id}", json={**book, "title": "Versioned"})
+    response = client.get(f"/stocks/{book_id}", headers={"If-None-Match": etag})
+    assert response.status_code == HTTPResponseCode.OK
+    assert response.json()["title"] == "Versioned"
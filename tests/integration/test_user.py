@@ -1,10 +1,11 @@
+import json
 from typing import Any
 
 from fastapi.testclient import TestClient
 
 from src.exceptions.app import NotFoundException, SqlException
 from src.models.http_response_code import HTTPResponseCode
-from tests.integration.constant import COUNT_ZERO
+from tests.integration.constant import COUNT_TWO, COUNT_ZERO
 
 user: dict[str, Any] = {"email": "john.doe@example.com", "first_name": "John", "last_name": "Doe"}
 
@@ -63,3 +64,25 @@ def test_book_users_endpoint_fail(client: TestClient) -> None:
     user_copy["email"] = "user1@test.fr"
     response = client.put("/users/1", json=user_copy)
     assert response.status_code == HTTPResponseCode.OK
+
+
+def test_create_users_in_bulk(client: TestClient) -> None:
+    """Test the bulk creation of users, an email already used is a failure of its line."""
+    lines = [
+        json.dumps({**user, "email": f"bulk{index}@test.fr"}) for index in range(COUNT_TWO)
+    ] + [json.dumps({**user, "email": "user1@test.fr"}), json.dumps({**user, "email": "bulk"})]
+    response = client.post(
+        "/users/bulk",
+        content="\n".join(lines),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == HTTPResponseCode.OK
+
+    response_json = response.json()
+    assert response_json["number_of_created"] == COUNT_TWO
+    assert [item["status_code"] for item in response_json["items"]] == [
+        HTTPResponseCode.CREATED,
+        HTTPResponseCode.CREATED,
+        HTTPResponseCode.BAD_REQUEST,
+        HTTPResponseCode.BAD_REQUEST,
+    ]
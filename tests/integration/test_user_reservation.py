@@ -66,6 +66,24 @@ def test_update_reservations(client: TestClient) -> None:
         assert exp.status_code == HTTPResponseCode.BAD_REQUEST
 
 
+def test_filter_reservations(client: TestClient) -> None:
+    """Test the filters of the reservations details endpoint."""
+    filters_counts: list[tuple[dict[str, Any], int]] = [
+        ({"user_id": 1}, COUNT_ONE),
+        ({"user_id": 1, "status": "returned"}, COUNT_ONE),
+        ({"book_id": 1, "status": "confirmed"}, COUNT_ZERO),
+        ({"active": True}, COUNT_ZERO),
+        ({"overdue": True}, COUNT_ZERO),
+        ({"user_id": 2}, COUNT_ZERO),
+    ]
+    for filters, count in filters_counts:
+        response = client.get("/reservations", params=filters)
+        assert response.status_code == HTTPResponseCode.OK
+        response_json = response.json()
+        assert len(response_json["reservations"]) == count
+        assert response_json["number_of_reservation"] == count
+
+
 def test_user_case_verification(client: TestClient) -> None:  # noqa: PLR0915
     """Application use case verification"""
 
@@ -120,3 +138,44 @@ def test_user_case_verification(client: TestClient) -> None:  # noqa: PLR0915
         client.get(f"/books/{book_id}")
     except NotFoundException as exc:
         assert exc.status_code == HTTPResponseCode.NOT_FOUND
+
+
+def test_batch_reservations(client: TestClient) -> None:
+    """Test the batch reservations endpoint."""
+    response = client.post("/reservations/batch", json={"user_id": 1, "book_ids": [1, 1, 9999]})
+    assert response.status_code == HTTPResponseCode.OK
+    response_json = response.json()
+    assert response_json["number_of_reservation"] == COUNT_ONE
+    assert [item["status_code"] for item in response_json["reservations"]] == [
+        HTTPResponseCode.CREATED,
+        HTTPResponseCode.BAD_REQUEST,
+        HTTPResponseCode.NOT_FOUND,
+    ]
+    assert response_json["reservations"][0]["reservation"]["book_id"] == 1
+
+    try:
+        client.post("/reservations/batch", json={"user_id": 9999, "book_ids": [1]})
+    except NotFoundException as exc:
+        assert exc.status_code == HTTPResponseCode.NOT_FOUND
+
+
+def test_batch_returns(client: TestClient) -> None:
+    """Test the batch returns endpoint."""
+    response = client.get("/reservations", params={"user_id": 1, "active": True})
+    reservation_ids = [reservation["id"] for reservation in response.json()["reservations"]]
+    assert len(reservation_ids) == COUNT_ONE
+
+    response = client.put(
+        "/reservations/returns", json={"reservation_ids": [*reservation_ids, 9999]}
+    )
+    assert response.status_code == HTTPResponseCode.OK
+    response_json = response.json()
+    assert response_json["number_of_reservation"] == COUNT_ONE
+    assert [item["status_code"] for item in response_json["reservations"]] == [
+        HTTPResponseCode.OK,
+        HTTPResponseCode.NOT_FOUND,
+    ]
+    assert response_json["reservations"][0]["reservation"]["status"] == "returned"
+
+    response = client.get("/reservations", params={"user_id": 1, "active": True})
+    assert len(response.json()["reservations"]) == COUNT_ZERO
@@ -0,0 +1,54 @@
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine
+
+from src.config.config import APP_CONFIG
+from src.db.engine import (
+    TESTING_PROFILE,
+    create_engine_from_profile,
+    get_database_profile,
+    get_db_writer_engine,
+)
+from src.db.group_commit import shutdown_group_committers
+from src.main import app
+from src.models.http_response_code import HTTPResponseCode
+
+
+@pytest.fixture
+def writer_engine(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> Iterator[Engine]:
+    """Writer engine of the test database, used by the group commit of the reservations."""
+    profile = get_database_profile(TESTING_PROFILE)
+    engine = create_engine_from_profile(
+        {**profile, "sqlite_writer": {"enable": True, "timeout": 5}}, is_writer=True
+    )
+
+    monkeypatch.setitem(APP_CONFIG["database"]["execution"]["group_commit"], "enable", True)
+
+    # The test engine of the client fixture is restored afterwards
+    test_writer_engine = app.dependency_overrides[get_db_writer_engine]
+    app.dependency_overrides[get_db_writer_engine] = lambda: engine
+    yield engine
+
+    shutdown_group_committers()
+    app.dependency_overrides[get_db_writer_engine] = test_writer_engine
+    engine.dispose()
+
+
+def test_reservation_with_group_commit(client: TestClient, writer_engine: Engine) -> None:
+    """A reservation runs in a batch of the group committer of the writer engine."""
+    user_id = client.post(
+        "/users",
+        json={"email": "grouped@library.com", "first_name": "Group", "last_name": "Commit"},
+    ).json()["id"]
+    stocks = client.get("/stocks").json()["stocks"]
+    book_id = next(stock["book_id"] for stock in stocks if stock["stock_quantity"] > 0)
+
+    response = client.post("/reservations", json={"book_id": book_id, "user_id": user_id})
+    assert response.status_code == HTTPResponseCode.CREATED
+    assert response.json()["user_id"] == user_id
+
+    group_commit = client.get("/health/database").json()["group_commit"]
+    assert group_commit["batches"] == 1
+    assert group_commit["operations"] == 1
@@ -0,0 +1,119 @@
+import json
+import time
+from typing import Any, Iterator
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, create_engine
+
+from src.db.models.admin_user import AdminUser
+from src.exceptions.app import AuthenticationException
+from src.models.http_response_code import HTTPResponseCode
+from src.utils import access_token as access_token_module
+from src.utils.access_token import (
+    TokenDenyList,
+    create_access_token,
+    encode_base64url,
+    get_signature,
+    revoke_access_token,
+    verify_access_token,
+)
+from src.utils.security import user_is_authenticated
+
+USER_ID = "admin@library.com"
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    """In-memory database with the admin users table."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine, tables=[AdminUser.__table__])  # type: ignore
+    yield engine
+    engine.dispose()
+
+
+def test_verify_access_token() -> None:
+    """A token carries the admin user ID and its expiry."""
+    claims = verify_access_token(create_access_token(USER_ID))
+    assert claims["sub"] == USER_ID
+    assert claims["exp"] > time.time()
+
+
+@pytest.mark.parametrize(
+    "forge",
+    [
+        lambda token: token[:-2] + ("AA" if token[-2:] != "AA" else "BB"),
+        lambda token: "e30." + token.partition(".")[2],
+        lambda token: token.partition(".")[0],
+        lambda token: token + "é",
+    ],
+)
+def test_verify_forged_access_token(forge: Any) -> None:
+    """A token with another signature or payload is rejected."""
+    with pytest.raises(AuthenticationException):
+        verify_access_token(forge(create_access_token(USER_ID)))
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        [],
+        {"sub": USER_ID, "jti": "1"},
+        {"sub": USER_ID, "exp": "4102444800", "jti": "1"},
+        {"sub": USER_ID, "exp": True, "jti": "1"},
+        {"sub": USER_ID, "exp": 4102444800, "jti": ["1"]},
+        {"sub": None, "exp": 4102444800, "jti": "1"},
+    ],
+)
+def test_verify_signed_access_token_with_invalid_claims(claims: Any) -> None:
+    """A signed token without the claims of their type is rejected as unauthorized."""
+    payload = encode_base64url(json.dumps(claims).encode())
+    with pytest.raises(AuthenticationException) as exc_info:
+        verify_access_token(f"{payload}.{get_signature(payload)}")
+    assert exc_info.value.status_code == HTTPResponseCode.UNAUTHORIZED
+
+
+def test_verify_expired_access_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A token is rejected once expired."""
+    token = create_access_token(USER_ID)
+    expires_at = verify_access_token(token)["exp"]
+    monkeypatch.setattr(access_token_module.time, "time", lambda: expires_at)
+    with pytest.raises(AuthenticationException):
+        verify_access_token(token)
+
+
+def test_revoke_access_token() -> None:
+    """A revoked token is rejected, the other tokens are still valid."""
+    token = create_access_token(USER_ID)
+    other_token = create_access_token(USER_ID)
+    revoke_access_token(token)
+
+    with pytest.raises(AuthenticationException):
+        verify_access_token(token)
+    assert verify_access_token(other_token)["sub"] == USER_ID
+
+
+def test_deny_list_drops_expired_revocations() -> None:
+    """The revocations of expired tokens are dropped when a token is revoked."""
+    deny_list = TokenDenyList()
+    deny_list.add("expired", time.time() - 1)
+    deny_list.add("valid", time.time() + 60)
+    assert not deny_list.contains("expired")
+    assert deny_list.contains("valid")
+
+
+def test_authentication_with_token_skips_the_database(engine: Engine) -> None:
+    """A request with an access token is authenticated without any query."""
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        statements.append(statement)
+
+    bearer_credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=create_access_token(USER_ID)
+    )
+    user_is_authenticated(None, engine, bearer_credentials)
+    assert statements == []
@@ -0,0 +1,56 @@
+import asyncio
+from datetime import date
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from sqlmodel import Session, SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.db.engine import create_async_engine_from_profile, get_database_profile
+from src.db.models.author import Author
+from src.db.operations.author import (
+    create_author_on_db,
+    delete_author_on_db,
+    get_author_out_from_db,
+)
+from src.db.runner import AsyncDatabaseRunner
+from src.exceptions.app import NotFoundException
+from src.models.author import AuthorIn
+
+
+def iterate_author_names(db_session: Session) -> Iterator[str]:
+    """Streamed read operation."""
+    yield from db_session.exec(select(Author.last_name).order_by(Author.id))  # type: ignore
+
+
+def test_async_runner_runs_the_sync_operations(tmp_path: Path) -> None:  # noqa: PLR0915
+    """The synchronous operations run unchanged through the async runner and its driver."""
+    profile = {**get_database_profile("dev"), "url": f"sqlite:///{tmp_path / 'async.db'}"}
+    # Reads and writes go through the same read-write engine
+    profile["sqlite_writer"] = {"enable": False}
+    engine = create_async_engine_from_profile(profile)
+
+    async def scenario() -> None:  # noqa: PLR0915
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+
+        author_in = AuthorIn(first_name="John", last_name="Doe", birth_date=date(1980, 5, 15))
+        async with AsyncSession(engine) as session:
+            author_out = await AsyncDatabaseRunner(session).run(create_author_on_db, author_in)
+        async with AsyncSession(engine) as session:
+            found = await AsyncDatabaseRunner(session).run(get_author_out_from_db, author_out.id)
+            assert found.first_name == "John"
+        async with AsyncSession(engine) as session:
+            names = AsyncDatabaseRunner(session).stream(iterate_author_names)
+            assert [name async for name in names] == ["Doe"]
+
+        async with AsyncSession(engine) as session:
+            await AsyncDatabaseRunner(session).run(delete_author_on_db, author_out.id)
+        async with AsyncSession(engine) as session:
+            with pytest.raises(NotFoundException):
+                await AsyncDatabaseRunner(session).run(get_author_out_from_db, author_out.id)
+
+        await engine.dispose()
+
+    asyncio.run(scenario())
@@ -0,0 +1,158 @@
+import asyncio
+from datetime import date
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator
+
+import pytest
+from sqlalchemy import Engine, event
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from src.db.models import reservation, reservation_status  # noqa # pylint: disable=unused-import
+from src.db.models.author import Author
+from src.db.models.book import Book
+from src.db.models.stock import Stock
+from src.db.operations.author import create_authors_on_db
+from src.db.operations.stock import create_stocks_on_db
+from src.helper.bulk import read_bulk_chunks
+from src.models.author import AuthorIn
+from src.models.bulk import BulkCreateItem
+from src.models.http_response_code import HTTPResponseCode
+from src.models.stock import StockIn
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Iterator[Engine]:  # noqa: PLR0915
+    """File database with the foreign keys enforced, an author (author_id=1) and a book
+    (book_id=1)."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+
+    @event.listens_for(engine, "connect")
+    def enable_foreign_keys(dbapi_connection: Any, _record: Any) -> None:
+        dbapi_connection.execute("PRAGMA foreign_keys = ON")
+
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Author(first_name="Jane", last_name="Austen", birth_date=date(1775, 12, 16)))
+        session.commit()
+        session.add(Book(title="Emma", author_id=1, published_date=date(1815, 12, 23)))
+        session.commit()
+
+    yield engine
+    engine.dispose()
+
+
+def record_inserts(engine: Engine) -> list[str]:
+    """Record the insert statements executed on the engine."""
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        if statement.startswith("INSERT"):
+            statements.append(statement)
+
+    return statements
+
+
+def get_author_in(first_name: str) -> AuthorIn:
+    """Get an author born on the birth date of the author of the fixture."""
+    return AuthorIn(first_name=first_name, last_name="Austen", birth_date=date(1775, 12, 16))
+
+
+def test_read_bulk_chunks() -> None:  # noqa: PLR0915
+    """The lines are parsed as they arrive, split across the parts of the stream."""
+    body = [
+        b'{"book_id": 1, "stock_quantity": 2}\n{"book_id": 2, ',
+        b'"stock_quantity": 3}\n\nnot json\n{"book_id": 3, "stock_quantity": -1}\n',
+        b'{"book_id": 4, "stock_quantity": 1}',
+    ]
+
+    async def stream() -> AsyncIterator[bytes]:
+        for part in body:
+            yield part
+
+    async def read() -> list[tuple[list[tuple[int, StockIn]], list[BulkCreateItem]]]:
+        return [chunk async for chunk in read_bulk_chunks(stream(), StockIn, chunk_size=2)]
+
+    chunks = asyncio.run(read())
+
+    assert [[(line, stock_in.book_id) for line, stock_in in rows] for rows, _ in chunks] == [
+        [(1, 1), (2, 2)],
+        [(6, 4)],
+    ]
+    failures = [failure for _, chunk_failures in chunks for failure in chunk_failures]
+    assert [(failure.line, failure.status_code) for failure in failures] == [
+        (4, HTTPResponseCode.BAD_REQUEST),
+        (5, HTTPResponseCode.BAD_REQUEST),
+    ]
+    assert failures[0].message is not None
+    assert failures[0].message.startswith("Invalid JSON")
+    assert failures[1].message is not None
+    assert failures[1].message.startswith("stock_quantity:")
+
+
+def test_create_authors_in_one_insert(engine: Engine) -> None:
+    """A chunk without failure is a single insert, the IDs are those of each row."""
+    first_names = ["Anne", "Charlotte", "Emily"]
+    statements = record_inserts(engine)
+    with Session(engine) as session:
+        items = create_authors_on_db(
+            session, [(line, get_author_in(name)) for line, name in enumerate(first_names, 1)]
+        )
+
+    assert len(statements) == 1
+    assert [(item.line, item.status_code) for item in items] == [
+        (1, HTTPResponseCode.CREATED),
+        (2, HTTPResponseCode.CREATED),
+        (3, HTTPResponseCode.CREATED),
+    ]
+    with Session(engine) as session:
+        names = {author.id: author.first_name for author in session.exec(select(Author))}
+    assert [names[item.id] for item in items if item.id is not None] == first_names
+
+
+def test_create_authors_with_failures(engine: Engine) -> None:
+    """The failing rows of a chunk are isolated, the other rows of the chunk are created."""
+    first_names = ["Anne", "Jane", "Charlotte", "Anne", "Emily"]
+    with Session(engine) as session:
+        items = create_authors_on_db(
+            session, [(line, get_author_in(name)) for line, name in enumerate(first_names, 1)]
+        )
+
+    assert [item.status_code for item in items] == [
+        HTTPResponseCode.CREATED,
+        HTTPResponseCode.BAD_REQUEST,
+        HTTPResponseCode.CREATED,
+        HTTPResponseCode.BAD_REQUEST,
+        HTTPResponseCode.CREATED,
+    ]
+    assert items[1].message is not None
+    assert "UNIQUE constraint failed" in items[1].message
+    with Session(engine) as session:
+        names = {author.id: author.first_name for author in session.exec(select(Author))}
+    assert sorted(names.values()) == ["Anne", "Charlotte", "Emily", "Jane"]
+    assert [names[item.id] for item in items if item.id is not None] == [
+        "Anne",
+        "Charlotte",
+        "Emily",
+    ]
+
+
+def test_create_stocks_of_unknown_books(engine: Engine) -> None:
+    """A stock of an unknown book breaks the foreign key, a stock of a stocked book the unique
+    key."""
+    stocks_in = [StockIn(book_id=1, stock_quantity=2), StockIn(book_id=2, stock_quantity=1)]
+    with Session(engine) as session:
+        items = create_stocks_on_db(session, list(enumerate(stocks_in, 1)))
+        assert [item.status_code for item in items] == [
+            HTTPResponseCode.CREATED,
+            HTTPResponseCode.BAD_REQUEST,
+        ]
+        assert items[1].message is not None
+        assert "FOREIGN KEY constraint failed" in items[1].message
+
+        items = create_stocks_on_db(session, [(1, StockIn(book_id=1, stock_quantity=3))])
+        assert items[0].status_code == HTTPResponseCode.BAD_REQUEST
+
+    with Session(engine) as session:
+        stock = session.exec(select(Stock)).one()
+    assert (stock.book_id, stock.stock_quantity) == (1, 2)
@@ -0,0 +1,127 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from src.helper.conditional import (
+    Preconditions,
+    Validators,
+    get_entity_validators,
+    get_http_date,
+    get_validators,
+    read_entity_if_modified,
+)
+
+CHANGED_AT = datetime(2026, 10, 17, 9, 4, 14, 500000)
+
+
+class Entity(BaseModel):
+    """Response model of an entity."""
+
+    id: int
+
+
+def get_preconditions(headers: dict[str, str]) -> Preconditions:
+    """Read the preconditions of a GET request with the headers."""
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "headers": [(key.lower().encode(), value.encode()) for key, value in headers.items()],
+        }
+    )
+    return Preconditions.from_request(request)
+
+
+def test_validators_from_the_table_changes() -> None:
+    """The ETag joins the change counts and times, Last-Modified is the last change."""
+    validators = get_validators(
+        [
+            {"change_count": 3, "changed_at": CHANGED_AT},
+            {"change_count": 7, "changed_at": datetime(2026, 1, 1)},
+        ]
+    )
+    assert validators == Validators(etag='W/"3-1792227854.7-1767225600"', last_modified=CHANGED_AT)
+    assert validators.headers["Last-Modified"] == "Sat, 17 Oct 2026 09:04:14 GMT"
+
+    unknown = get_validators([{"change_count": 3, "changed_at": None}])
+    assert unknown == Validators(etag='W/"3-0"', last_modified=None)
+    assert "Last-Modified" not in unknown.headers
+
+    # A new database reaching the same count later gets another ETag
+    recreated = get_validators([{"change_count": 3, "changed_at": datetime(2026, 11, 1)}])
+    assert recreated.etag != get_validators([{"change_count": 3, "changed_at": CHANGED_AT}]).etag
+
+
+def test_validators_from_the_entity_version() -> None:
+    """The ETag of an entity is its id and update time, Last-Modified its update time."""
+    validators = get_entity_validators({"id": 4, "updated_at": CHANGED_AT})
+    assert validators == Validators(etag='W/"4-1792227854500000"', last_modified=CHANGED_AT)
+    assert validators.headers["Last-Modified"] == "Sat, 17 Oct 2026 09:04:14 GMT"
+
+    # Updated again within the same second
+    updated_at = CHANGED_AT.replace(microsecond=900000)
+    assert get_entity_validators({"id": 4, "updated_at": updated_at}).etag != validators.etag
+
+
+def test_entity_not_modified_without_its_operation() -> None:
+    """The entity is not read once its version matches, and read if it does not."""
+
+    def get_version(_db_session: Any, entity_id: int) -> dict[str, Any]:
+        return {"id": entity_id, "updated_at": CHANGED_AT}
+
+    def fail(_db_session: Any, _entity_id: int) -> BaseModel:
+        raise AssertionError("The entity must not be read")
+
+    etag = get_entity_validators(get_version(None, 4)).etag
+    for headers in (
+        {"If-None-Match": etag},
+        {"If-Modified-Since": "Sat, 17 Oct 2026 09:04:14 GMT"},
+    ):
+        preconditions = get_preconditions(headers)
+        validators, content = read_entity_if_modified(
+            None,  # type: ignore
+            get_version,
+            preconditions,
+            fail,
+            4,
+        )
+        assert (validators.etag if validators else None, content) == (etag, None)
+
+    model = Entity(id=4)
+    preconditions = get_preconditions({"If-None-Match": 'W/"4-0"'})
+    assert (
+        read_entity_if_modified(
+            None,  # type: ignore
+            get_version,
+            preconditions,
+            lambda _db_session, _entity_id: model,
+            4,
+        )[1]
+        is model
+    )
+    # Not found: the operation raises its error
+    assert read_entity_if_modified(
+        None,  # type: ignore
+        lambda _db_session, _entity_id: None,
+        preconditions,
+        lambda _db_session, _entity_id: model,
+        4,
+    ) == (None, model)
+
+
+def test_preconditions() -> None:
+    """If-None-Match is compared weakly and takes precedence over If-Modified-Since."""
+    validators = Validators(etag='W/"3.7"', last_modified=CHANGED_AT)
+    assert not get_preconditions({}).is_not_modified(validators)
+    assert get_preconditions({"If-None-Match": '"1", "3.7"'}).is_not_modified(validators)
+    assert not get_preconditions({"If-None-Match": "*"}).is_not_modified(validators)
+
+    last_modified = validators.headers["Last-Modified"]
+    assert get_preconditions({"If-Modified-Since": last_modified}).is_not_modified(validators)
+    assert not get_preconditions(
+        {"If-None-Match": 'W/"1"', "If-Modified-Since": last_modified}
+    ).is_not_modified(validators)
+    assert not get_preconditions({"If-Modified-Since": "yesterday"}).is_not_modified(validators)
+    assert get_http_date("Sat, 17 Oct 2026 11:04:14 +0200") == CHANGED_AT.replace(microsecond=0)
@@ -0,0 +1,116 @@
+from typing import Any, Iterator
+
+import pytest
+from fastapi.security import HTTPBasicCredentials
+from sqlalchemy import Engine, event, update
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.db.models.admin_user import AdminUser
+from src.exceptions.app import AuthenticationException
+from src.utils import credential_cache as credential_cache_module
+from src.utils.credential_cache import CredentialCache, credential_cache
+from src.utils.security import hash_password, user_is_authenticated
+
+USERNAME = "admin"
+PASSWORD = "adminpassword"
+TTL = 60
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    """In-memory database with an admin user."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine, tables=[AdminUser.__table__])  # type: ignore
+    with Session(engine) as session:
+        session.add(AdminUser(user_id=USERNAME, password=hash_password(PASSWORD)))
+        session.commit()
+
+    credential_cache.clear()
+    yield engine
+    credential_cache.clear()
+    engine.dispose()
+
+
+def record_selects(engine: Engine) -> list[str]:
+    """Record the select statements executed on the engine."""
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+def authenticate(engine: Engine, password: str = PASSWORD) -> None:
+    """Authenticate the admin user against the engine."""
+    user_is_authenticated(HTTPBasicCredentials(username=USERNAME, password=password), engine)
+
+
+def test_cache_expiry_and_eviction(monkeypatch: pytest.MonkeyPatch) -> None:  # noqa: PLR0915
+    """Entries expire after the TTL and the least recently used one is evicted."""
+    now = 0.0
+    monkeypatch.setattr(credential_cache_module.time, "monotonic", lambda: now)
+    cache = CredentialCache(max_size=2, ttl=TTL)
+
+    cache.add("first", PASSWORD, cache.generation)
+    cache.add("second", PASSWORD, cache.generation)
+    assert cache.contains("first", PASSWORD)
+    assert not cache.contains("first", "wrongpassword")
+
+    cache.add("third", PASSWORD, cache.generation)
+    assert not cache.contains("second", PASSWORD)
+    assert cache.contains("first", PASSWORD)
+
+    now = TTL
+    assert not cache.contains("first", PASSWORD)
+    assert cache.stats() == {"size": 1, "hits": 2, "misses": 3, "invalidations": 0}
+
+
+def test_cache_disabled_or_invalidated() -> None:
+    """Nothing is added with a zero TTL, nor after an invalidation during a verification."""
+    disabled_cache = CredentialCache(max_size=2, ttl=0)
+    disabled_cache.add(USERNAME, PASSWORD, disabled_cache.generation)
+    assert not disabled_cache.contains(USERNAME, PASSWORD)
+
+    cache = CredentialCache(max_size=2, ttl=TTL)
+    generation = cache.generation
+    cache.clear()
+    cache.add(USERNAME, PASSWORD, generation)
+    assert not cache.contains(USERNAME, PASSWORD)
+
+
+def test_authentication_skips_the_database_once_verified(engine: Engine) -> None:
+    """The admin user is only read by the first authentication, a wrong password is not cached."""
+    selects = record_selects(engine)
+    authenticate(engine)
+    authenticate(engine)
+    assert len(selects) == 1
+
+    for _ in range(2):
+        with pytest.raises(AuthenticationException):
+            authenticate(engine, password="wrongpassword")
+    assert len(selects) == 3  # noqa: PLR2004
+
+
+def test_admin_user_change_invalidates_the_cache(engine: Engine) -> None:  # noqa: PLR0915
+    """A committed change of the admin users drops the cached verifications."""
+    authenticate(engine)
+    with Session(engine) as session:
+        session.execute(update(AdminUser).values(password=hash_password("newpassword")))
+        session.commit()
+
+    with pytest.raises(AuthenticationException):
+        authenticate(engine)
+
+    authenticate(engine, password="newpassword")
+    with Session(engine) as session:
+        admin_user = session.get(AdminUser, 1)
+        assert admin_user is not None
+        session.delete(admin_user)
+        session.commit()
+
+    with pytest.raises(AuthenticationException):
+        authenticate(engine, password="newpassword")
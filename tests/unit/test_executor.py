@@ -0,0 +1,67 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.db.executor import DatabaseExecutor
+from src.exceptions.app import ServiceUnavailableException
+from src.models.http_response_code import HTTPResponseCode
+
+
+def test_executor_runs_operations_and_reports_stats() -> None:
+    """The executor returns the operation results and counts them."""
+    executor = DatabaseExecutor(max_workers=2, max_queue_size=2, queue_timeout=5)
+
+    async def scenario() -> list[int]:
+        return await asyncio.gather(*(executor.run(pow, number, 2) for number in range(4)))
+
+    assert asyncio.run(scenario()) == [0, 1, 4, 9]
+    expected_completed = 4
+    stats = executor.stats()
+    executor.shutdown()
+
+    assert stats["completed"] == expected_completed
+    assert stats["rejected"] == 0
+    assert stats["active"] == stats["queue_depth"] == 0
+    assert stats["saturation"] == 0
+
+
+def test_executor_rejects_when_the_queue_is_full() -> None:  # noqa: PLR0915
+    """Operations above the workers + queue size are rejected straight away."""
+    executor = DatabaseExecutor(max_workers=1, max_queue_size=1, queue_timeout=5)
+    release = threading.Event()
+
+    async def scenario() -> None:  # noqa: PLR0915
+        admitted = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        assert executor.stats()["queue_depth"] == 1
+        assert executor.stats()["saturation"] == 1
+
+        with pytest.raises(ServiceUnavailableException) as exc_info:
+            await executor.run(release.wait)
+        assert exc_info.value.status_code == HTTPResponseCode.SERVICE_UNAVAILABLE
+
+        release.set()
+        assert await asyncio.gather(*admitted) == [True, True]
+
+    asyncio.run(scenario())
+    assert executor.stats()["rejected"] == 1
+    executor.shutdown()
+
+
+def test_executor_rejects_operations_waiting_too_long() -> None:  # noqa: PLR0915
+    """An operation waiting for a worker longer than the queue timeout is not run."""
+    executor = DatabaseExecutor(max_workers=1, max_queue_size=1, queue_timeout=0.01)
+    calls: list[int] = []
+
+    async def scenario() -> None:
+        blocking = asyncio.ensure_future(executor.run(threading.Event().wait, 0.1))
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceUnavailableException):
+            await executor.run(calls.append, 1)
+        await blocking
+
+    asyncio.run(scenario())
+    assert calls == []
+    assert executor.stats()["timed_out"] == 1
+    executor.shutdown()
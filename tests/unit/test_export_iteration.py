@@ -0,0 +1,68 @@
+from datetime import date
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from sqlalchemy import Engine
+from sqlmodel import Session, SQLModel
+
+from src.db.engine import create_engine_from_profile, get_database_profile
+from src.db.models import (  # noqa # pylint: disable=unused-import
+    book,
+    reservation,
+    reservation_status,
+    stock,
+)
+from src.db.models.author import Author
+from src.db.operations.export import export_rows_from_db
+from src.models.export import ExportEntity
+
+NUMBER_OF_AUTHORS = 5
+BATCH_SIZE = 2
+
+
+@pytest.fixture
+def engines(tmp_path: Path) -> Iterator[tuple[Engine, Engine]]:
+    """Read-only and writer engines of a file database in WAL mode with a few authors, a
+    reader does not block the writer."""
+    profile = {**get_database_profile("dev"), "url": f"sqlite:///{tmp_path / 'export.db'}"}
+    engine = create_engine_from_profile(profile)
+    writer_engine = create_engine_from_profile(profile, is_writer=True)
+    SQLModel.metadata.create_all(writer_engine)
+    with Session(writer_engine) as session:
+        for index in range(NUMBER_OF_AUTHORS):
+            session.add(get_author(f"Author {index}"))
+        session.commit()
+
+    yield engine, writer_engine
+    engine.dispose()
+    writer_engine.dispose()
+
+
+def get_author(first_name: str) -> Author:
+    """Get an author with the given first name."""
+    return Author(first_name=first_name, last_name="Doe", birth_date=date(1900, 1, 1))
+
+
+@pytest.mark.parametrize(("snapshot", "number_of_rows"), [(True, 5), (False, 6)])
+def test_export_with_concurrent_insert(  # noqa: PLR0915
+    engines: tuple[Engine, Engine], snapshot: bool, number_of_rows: int
+) -> None:
+    """An author inserted during the export is only seen by the export reading batches by id."""
+    engine, writer_engine = engines
+    with Session(engine) as session:
+        batches = export_rows_from_db(
+            session, ExportEntity.AUTHORS, snapshot=snapshot, batch_size=BATCH_SIZE
+        )
+        first_batch = next(batches)
+        assert len(first_batch) == BATCH_SIZE
+
+        with Session(writer_engine) as writer_session:
+            writer_session.add(get_author("Late"))
+            writer_session.commit()
+
+        other_batches = list(batches)
+
+    assert all(len(batch) <= BATCH_SIZE for batch in other_batches)
+    rows = [*first_batch, *(row for batch in other_batches for row in batch)]
+    assert [row["id"] for row in rows] == list(range(1, number_of_rows + 1))
@@ -0,0 +1,163 @@
+import asyncio
+from datetime import date
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from sqlalchemy import Engine, func
+from sqlmodel import Session, SQLModel, select
+
+from src.db.engine import create_engine_from_profile, get_database_profile
+from src.db.execution import execute_all_query
+from src.db.group_commit import (
+    GroupCommitter,
+    find_group_committer,
+    get_group_committer,
+    shutdown_group_committers,
+)
+from src.db.models.author import Author
+from src.db.operations.author import create_author_on_db, get_author_out_from_db
+from src.db.runner import GroupCommitDatabaseRunner, SyncDatabaseRunner
+from src.exceptions.app import NotFoundException, ServiceUnavailableException, SqlException
+from src.models.author import AuthorIn
+
+
+def create_writer_engine(database_file: Path) -> Engine:
+    """Create the writer engine of a new SQLite database with the application tables."""
+    profile = {**get_database_profile("dev"), "url": f"sqlite:///{database_file}"}
+    profile["sqlite_writer"] = {"enable": True, "timeout": 5}
+    engine = create_engine_from_profile(profile, is_writer=True)
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def new_author(number: int) -> AuthorIn:
+    """Get a new author, the names are unique."""
+    return AuthorIn(first_name="John", last_name=f"Doe {number}", birth_date=date(1980, 5, 15))
+
+
+def count_authors(engine: Engine) -> int:
+    """Count the committed authors."""
+    with Session(engine) as session:
+        return session.exec(select(func.count()).select_from(Author)).one()
+
+
+def create_author_and_fail(db_session: Session, author_in: AuthorIn) -> None:
+    """Operation failing after a write and before its commit, the write must be rolled back."""
+    execute_all_query(db_session, [Author(**author_in.model_dump())], is_commit=False)
+    db_session.flush()
+    raise ValueError("Failure after the write")
+
+
+def test_group_commit_shares_the_commit_and_isolates_failures(tmp_path: Path) -> None:  # noqa: PLR0915
+    """Concurrent operations share a batch, a failing one does not affect the others."""
+    engine = create_writer_engine(tmp_path / "group_commit.db")
+    group_committer = GroupCommitter(engine, max_batch_size=10, max_delay_ms=200)
+    created = [group_committer.submit(create_author_on_db, new_author(i)) for i in range(3)]
+    failed = group_committer.submit(create_author_and_fail, new_author(3))
+    # Same author as the first one, the unique constraint fails in its own savepoint
+    duplicate = group_committer.submit(create_author_on_db, new_author(0))
+    not_found = group_committer.submit(get_author_out_from_db, 999)
+
+    assert [future.result(timeout=5).id for future in created] == [1, 2, 3]
+    with pytest.raises(ValueError):
+        failed.result(timeout=5)
+    with pytest.raises(SqlException):
+        duplicate.result(timeout=5)
+    with pytest.raises(NotFoundException):
+        not_found.result(timeout=5)
+
+    assert count_authors(engine) == len(created)
+    assert group_committer.stats()["batches"] == 1
+    assert group_committer.stats()["operations"] == len(created) + 3
+
+    group_committer.shutdown()
+    engine.dispose()
+
+
+def test_group_commit_batch_size_and_shutdown(tmp_path: Path) -> None:  # noqa: PLR0915
+    """A full batch is committed right away and the shutdown commits the pending one."""
+    engine = create_writer_engine(tmp_path / "group_commit.db")
+    # The delay is long enough for the batches to only end on their size or the shutdown
+    group_committer = GroupCommitter(engine, max_batch_size=2, max_delay_ms=60_000)
+    futures = [group_committer.submit(create_author_on_db, new_author(i)) for i in range(3)]
+    assert [future.result(timeout=5).id for future in futures[:2]] == [1, 2]
+    assert not futures[2].done()
+
+    group_committer.shutdown()
+    assert futures[2].result(timeout=0).id == len(futures)
+    assert count_authors(engine) == len(futures)
+    assert group_committer.stats()["batches"] == len(futures) - 1
+
+    with pytest.raises(ServiceUnavailableException):
+        group_committer.submit(create_author_on_db, new_author(3))
+
+    engine.dispose()
+
+
+def test_group_committer_of_each_writer_engine(tmp_path: Path) -> None:  # noqa: PLR0915
+    """Each writer engine gets its own group committer, a SQLite reader engine none."""
+    engines = [create_writer_engine(tmp_path / f"group_commit_{i}.db") for i in range(2)]
+    assert find_group_committer(engines[0]) is None
+    group_committers = [get_group_committer(engine) for engine in engines]
+    assert find_group_committer(engines[0]) is group_committers[0]
+    assert get_group_committer(engines[0]) is group_committers[0]
+    assert group_committers[0] is not group_committers[1]
+
+    reader_engine = create_engine_from_profile(
+        {**get_database_profile("dev"), "url": f"sqlite:///{tmp_path / 'group_commit_0.db'}"}
+    )
+    with pytest.raises(ValueError):
+        get_group_committer(reader_engine)
+
+    shutdown_group_committers()
+    assert find_group_committer(engines[0]) is None
+    assert get_group_committer(engines[0]) is not group_committers[0]
+    shutdown_group_committers()
+    for engine in [*engines, reader_engine]:
+        engine.dispose()
+
+
+def test_group_commit_thread_survives_a_failing_batch(  # noqa: PLR0915
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An error outside of the operations fails the callers of its batch only, the next
+    batches are still committed."""
+    engine = create_writer_engine(tmp_path / "group_commit.db")
+    group_committer = GroupCommitter(engine, max_batch_size=1, max_delay_ms=10)
+
+    def fail_to_notify(_table_names: set[str]) -> None:
+        raise RuntimeError("Table change listener failure")
+
+    monkeypatch.setattr("src.db.group_commit.notify_table_changes", fail_to_notify)
+    with pytest.raises(RuntimeError):
+        group_committer.submit(create_author_on_db, new_author(0)).result(timeout=5)
+
+    monkeypatch.undo()
+    author_out = group_committer.submit(create_author_on_db, new_author(1)).result(timeout=5)
+    assert author_out.last_name == "Doe 1"
+    # The listeners run after the commit, the author of the failed batch is committed too
+    assert group_committer.stats()["batches"] == count_authors(engine)
+
+    group_committer.shutdown()
+    engine.dispose()
+
+
+def iterate_author_names(db_session: Session) -> Iterator[str]:
+    """Streamed read operation."""
+    yield from db_session.exec(select(Author.last_name).order_by(Author.id))  # type: ignore
+
+
+def test_group_commit_runner_streams_with_the_mode_runner(tmp_path: Path) -> None:
+    """The streamed reads of the group commit runner are run by the runner of the mode."""
+    engine = create_writer_engine(tmp_path / "group_commit.db")
+    group_committer = GroupCommitter(engine, max_batch_size=10, max_delay_ms=10)
+    db_runner = GroupCommitDatabaseRunner(group_committer, SyncDatabaseRunner(Session(engine)))
+
+    async def scenario() -> list[str]:
+        await db_runner.run(create_author_on_db, new_author(0))
+        return [name async for name in db_runner.stream(iterate_author_names)]
+
+    assert asyncio.run(scenario()) == ["Doe 0"]
+    group_committer.shutdown()
+    engine.dispose()
@@ -1,6 +1,17 @@
+import base64
+import json
+from typing import Any
+
 import pytest
 
-from src.helper.pagination import pagination_details
+from src.exceptions.app import BadRequestException
+from src.helper.pagination import (
+    Cursor,
+    cursor_details,
+    decode_cursor,
+    encode_cursor,
+    pagination_details,
+)
 
 
 @pytest.mark.parametrize(
@@ -27,3 +38,85 @@ def test_pagination_details(
     """Test pagination details."""
     result = pagination_details(offset=offset, limit=limit, counts=counts)
     assert result == expected, f"Expected {expected}, but got {result}"
+
+
+def test_pagination_details_with_cursor() -> None:
+    """The page numbers are unknown with a cursor."""
+    cursor = Cursor(id=10, is_previous=False)
+    assert pagination_details(offset=0, limit=10, counts=50, cursor=cursor) == (5, None, None, None)
+
+
+@pytest.mark.parametrize(
+    "has_next, expected", [(True, (None, 3, 4, 2)), (False, (None, 3, None, 2))]
+)
+def test_pagination_details_without_counts(
+    has_next: bool, expected: tuple[int | None, int | None, int | None, int | None]
+) -> None:
+    """The next page comes from the fetched rows when the items are not counted."""
+    result = pagination_details(offset=20, limit=10, counts=None, has_next=has_next)
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "cursor", [Cursor(id=42, is_previous=False), Cursor(id=1, is_previous=True)]
+)
+def test_cursor_round_trip(cursor: Cursor) -> None:
+    """Test the encoding and decoding of the cursors."""
+    assert decode_cursor(encode_cursor(cursor)) == cursor
+
+
+@pytest.mark.parametrize(
+    "value", ["", "not-a-cursor", "e30", "eyJpZCI6ICIxIiwgInByZXZpb3VzIjogZmFsc2V9"]
+)
+def test_decode_invalid_cursor(value: str) -> None:
+    """Test the decoding of invalid cursors."""
+    with pytest.raises(BadRequestException):
+        decode_cursor(value)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"id": True, "previous": False},
+        {"id": -1, "previous": False},
+        {"id": 2**63, "previous": False},
+        {"id": 10**30, "previous": False},
+        {"id": 1.5, "previous": False},
+        {"id": 1, "previous": 1},
+        {"id": 1, "previous": None},
+    ],
+)
+def test_decode_tampered_cursor(payload: dict[str, Any]) -> None:
+    """A cursor edited by the client to another id or direction type is rejected."""
+    value = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+    with pytest.raises(BadRequestException):
+        decode_cursor(value)
+
+
+@pytest.mark.parametrize(
+    "rows, offset, cursor, expected",
+    [
+        ([1, 2, 3], 0, None, ([1, 2], 2, None)),  # First page, a next page
+        ([3, 4], 2, None, ([3, 4], None, 3)),  # Last page from the offset
+        ([3, 4, 5], 0, Cursor(id=2, is_previous=False), ([3, 4], 4, 3)),  # Middle page
+        ([4, 3, 2], 0, Cursor(id=5, is_previous=True), ([3, 4], 4, 3)),  # Previous page
+        ([2, 1], 0, Cursor(id=3, is_previous=True), ([1, 2], 2, None)),  # First page, backward
+        ([], 0, Cursor(id=9, is_previous=False), ([], None, None)),  # Past the last page
+    ],
+)
+def test_cursor_details(
+    rows: list[int],
+    offset: int,
+    cursor: Cursor | None,
+    expected: tuple[list[int], int | None, int | None],
+) -> None:
+    """Test the page and cursors of the pagination queries (limit 2)."""
+    page, next_cursor, previous_cursor = cursor_details(
+        rows, limit=2, offset=offset, cursor=cursor, get_id=lambda row: row
+    )
+    expected_page, next_id, previous_id = expected
+    assert page == expected_page
+    assert next_cursor == (next_id and encode_cursor(Cursor(id=next_id, is_previous=False)))
+    assert previous_cursor == (
+        previous_id and encode_cursor(Cursor(id=previous_id, is_previous=True))
+    )
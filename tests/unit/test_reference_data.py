@@ -0,0 +1,75 @@
+from typing import Any, Iterator
+
+import pytest
+from sqlalchemy import Engine, event, update
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.db.models.reservation_status import ReservationStatus as DBReservationStatus
+from src.db.queries.reservation_status import get_reservation_status_stmt
+from src.db.reference_data import RESERVATION_STATUS, ReferenceDataRegistry
+from src.exceptions.app import SqlException
+from src.models.reservation_status import ReservationStatus
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    """In memory database with the reservation statuses."""
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=[DBReservationStatus.__table__])  # type: ignore
+    with Session(engine) as session:
+        for status_id, status in enumerate(ReservationStatus, start=1):
+            session.add(DBReservationStatus(id=status_id, name=status))
+        session.commit()
+
+    yield engine
+    engine.dispose()
+
+
+def rename_status(engine: Engine, status_id: int, name: str) -> None:
+    """Rename a reservation status in the database."""
+    with Session(engine) as session:
+        session.execute(
+            update(DBReservationStatus).where(DBReservationStatus.id == status_id).values(name=name)  # type: ignore
+        )
+        session.commit()
+
+
+def test_lookups_are_read_once(engine: Engine) -> None:
+    """A table is read by its first lookup only, then looked up by ID and by name."""
+    registry = ReferenceDataRegistry()
+    registry.register(RESERVATION_STATUS, get_reservation_status_stmt, ReservationStatus)
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        statements.append(statement)
+
+    with Session(engine) as session:
+        for status_id, status in enumerate(ReservationStatus, start=1):
+            statuses = registry.get(session, RESERVATION_STATUS)
+            assert statuses.get_id(status) == status_id
+            assert statuses.get_name(status_id) == status
+    assert len(statements) == 1
+
+
+def test_load_refreshes_the_tables(engine: Engine) -> None:
+    """A table is reloaded with the rows changed since its first load."""
+    registry = ReferenceDataRegistry()
+    registry.register(RESERVATION_STATUS, get_reservation_status_stmt)
+    with Session(engine) as session:
+        registry.load(session)
+        rename_status(engine, 1, "waiting")
+        assert registry.get(session, RESERVATION_STATUS).get_name(1) == ReservationStatus.PENDING
+
+        registry.load(session)
+        assert registry.get(session, RESERVATION_STATUS).get_name(1) == "waiting"
+
+
+def test_load_checks_the_enum(engine: Engine) -> None:
+    """The names of a table which do not match its enum are rejected."""
+    registry = ReferenceDataRegistry()
+    registry.register(RESERVATION_STATUS, get_reservation_status_stmt, ReservationStatus)
+    rename_status(engine, 1, "waiting")
+    with Session(engine) as session, pytest.raises(SqlException) as exc_info:
+        registry.load(session)
+    assert "waiting" in exc_info.value.message
@@ -0,0 +1,152 @@
+from datetime import datetime
+from typing import Any, Iterator
+
+import pytest
+from sqlalchemy import Engine, event
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.db.execution import fetch_one_or_none
+from src.db.models import book, stock, user  # noqa # pylint: disable=unused-import
+from src.db.models.reservation import Reservation
+from src.db.models.reservation_status import ReservationStatus as DBReservationStatus
+from src.db.operations.reservation import get_reservations_with_offset_and_limit
+from src.db.queries.reservation import get_non_returned_books_from_user_id_stmt
+from src.helper.pagination import Cursor
+from src.models.reservation import ReservationFilters
+from src.models.reservation_status import ReservationStatus
+
+NUMBER_OF_RESERVATIONS = 12
+# The first reservations are past their due date
+NUMBER_OF_OVERDUE = 6
+
+FILTERS = [
+    ReservationFilters(user_id=1),
+    ReservationFilters(book_id=2),
+    ReservationFilters(status=ReservationStatus.RETURNED),
+    ReservationFilters(active=True),
+    ReservationFilters(overdue=True),
+    ReservationFilters(user_id=1, active=True),
+    ReservationFilters(book_id=2, overdue=True),
+]
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    """In memory database with reservations of 3 users on 4 books, every other one returned."""
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        for status_id, status in enumerate(ReservationStatus, start=1):
+            session.add(DBReservationStatus(id=status_id, name=status))
+        for index in range(NUMBER_OF_RESERVATIONS):
+            returned = index % 2 == 0
+            session.add(
+                Reservation(
+                    book_id=index % 4 + 1,
+                    user_id=index % 3 + 1,
+                    status_id=4 if returned else 2,
+                    borrowed_at=datetime(2024, 1, 1),
+                    due_date=datetime(2024, 1, 15)
+                    if index < NUMBER_OF_OVERDUE
+                    else datetime(2999, 1, 1),
+                    returned_at=datetime(2024, 1, 10) if returned else None,
+                )
+            )
+        session.commit()
+
+    yield engine
+    engine.dispose()
+
+
+def record_queries(engine: Engine) -> list[tuple[str, Any]]:
+    """Record the statements executed on the engine with their parameters."""
+    statements: list[tuple[str, Any]] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(_conn: Any, _cursor: Any, statement: str, parameters: Any, *_args: Any) -> None:
+        statements.append((statement, parameters))
+
+    return statements
+
+
+def expected_reservations(engine: Engine, filters: ReservationFilters) -> list[int]:
+    """Get the ids of the reservations matching the filters, filtered in Python."""
+    with Session(engine) as session:
+        reservations = session.query(Reservation).order_by(Reservation.id).all()  # type: ignore
+        statuses = {status.id: status.name for status in session.query(DBReservationStatus)}
+    now = datetime.now()
+    return [
+        reservation.id
+        for reservation in reservations
+        if (filters.user_id is None or reservation.user_id == filters.user_id)
+        and (filters.book_id is None or reservation.book_id == filters.book_id)
+        and (filters.status is None or statuses[reservation.status_id] == filters.status.value)
+        and (not (filters.active or filters.overdue) or reservation.returned_at is None)
+        and (not filters.overdue or reservation.due_date < now)
+    ]
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_filtered_reservations(engine: Engine, filters: ReservationFilters) -> None:
+    """The offset and cursor pages and the count hold the reservations matching the filters."""
+    expected = expected_reservations(engine, filters)
+    with Session(engine) as session:
+        offset_page = get_reservations_with_offset_and_limit(
+            session, offset=0, limit=NUMBER_OF_RESERVATIONS, filters=filters
+        )
+        cursor_page = get_reservations_with_offset_and_limit(
+            session,
+            offset=0,
+            limit=NUMBER_OF_RESERVATIONS,
+            cursor=Cursor(id=0, is_previous=False),
+            filters=filters,
+        )
+
+    assert expected
+    assert [reservation.id for reservation in offset_page.reservations] == expected
+    assert [reservation.id for reservation in cursor_page.reservations] == expected
+    assert offset_page.number_of_reservation == len(expected)
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_filtered_reservations_use_indexes(  # noqa: PLR0915
+    engine: Engine, filters: ReservationFilters
+) -> None:
+    """No filtered statement falls back to a full scan of the reservations."""
+    with Session(engine) as session:
+        statements = record_queries(engine)
+        get_reservations_with_offset_and_limit(session, offset=0, limit=10, filters=filters)
+        get_reservations_with_offset_and_limit(
+            session, offset=0, limit=10, cursor=Cursor(id=3, is_previous=False), filters=filters
+        )
+
+    # The count and the page of each call
+    expected_statements = 4
+    executed = list(statements)
+    assert len(executed) == expected_statements
+    with engine.connect() as connection:
+        for statement, parameters in executed:
+            plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            details = [row[3] for row in plan]
+            assert any("reservations USING" in detail for detail in details), details
+            assert not any(detail.startswith("SCAN reservations") for detail in details), details
+
+
+def test_open_loan_lookup_uses_partial_index(engine: Engine) -> None:
+    """The open loan of a user on a book is sought in the partial index of the open loans."""
+    with Session(engine) as session:
+        statements = record_queries(engine)
+        # The loans of book_id=1 are returned, the ones of book_id=2 are open
+        returned_stmt = get_non_returned_books_from_user_id_stmt(user_id=1, book_id=1)
+        open_stmt = get_non_returned_books_from_user_id_stmt(user_id=1, book_id=2)
+        assert fetch_one_or_none(session, returned_stmt) is None
+        assert fetch_one_or_none(session, open_stmt) is not None
+
+    with engine.connect() as connection:
+        for statement, parameters in list(statements):
+            plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            details = [row[3] for row in plan]
+            assert details == [
+                "SEARCH reservations USING INDEX ix_reservations_open_user_id_book_id "
+                "(user_id=? AND book_id=?)"
+            ]
@@ -0,0 +1,216 @@
+import threading
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+from sqlalchemy import Engine, event
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from src.db.models import author, book  # noqa # pylint: disable=unused-import
+from src.db.models.reservation import Reservation
+from src.db.models.reservation_status import ReservationStatus as DBReservationStatus
+from src.db.models.stock import Stock
+from src.db.models.user import User
+from src.db.operations.reservation import (
+    create_reservation_on_db,
+    create_reservations_on_db,
+    return_reservations_on_db,
+)
+from src.db.reference_data import reference_data
+from src.exceptions.app import NotFoundException, ReservationException
+from src.models.http_response_code import HTTPResponseCode
+from src.models.reservation import ReservationBatchIn, ReservationIn, ReservationReturnsIn
+from src.models.reservation_status import ReservationStatus
+
+NUMBER_OF_USERS = 8
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Iterator[Engine]:
+    """File database with users, a book with one copy (book_id=1), one without (book_id=2)
+    and one with several (book_id=3)."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'reserve.db'}", connect_args={"timeout": 30})
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        for status_id, status in enumerate(ReservationStatus, start=1):
+            session.add(DBReservationStatus(id=status_id, name=status))
+        for user_id in range(1, NUMBER_OF_USERS + 1):
+            session.add(User(first_name="Jane", last_name="Doe", email=f"user{user_id}@test.com"))
+        session.add(Stock(book_id=1, stock_quantity=1))
+        session.add(Stock(book_id=2, stock_quantity=0))
+        session.add(Stock(book_id=3, stock_quantity=NUMBER_OF_USERS))
+        session.commit()
+
+    yield engine
+    engine.dispose()
+
+
+def record_queries(engine: Engine) -> list[str]:
+    """Record the statements executed on the engine."""
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        statements.append(statement)
+
+    return statements
+
+
+def get_state(engine: Engine) -> tuple[int, int]:
+    """Get the stock quantity of book_id=1 and the number of reservations."""
+    with Session(engine) as session:
+        stock = session.exec(select(Stock).where(Stock.book_id == 1)).one()
+        return stock.stock_quantity, len(session.exec(select(Reservation)).all())
+
+
+def test_reserve_is_two_statements(engine: Engine) -> None:
+    """A reservation is the conditional decrement of the stock and the conditional insert."""
+    with Session(engine) as session:
+        # The statuses are read once per process
+        reference_data.load(session)
+        statements = record_queries(engine)
+        reservation_out = create_reservation_on_db(session, ReservationIn(user_id=1, book_id=1))
+
+    assert reservation_out.id == 1
+    assert reservation_out.status == ReservationStatus.CONFIRMED
+    assert [statement.split()[0] for statement in statements] == ["UPDATE", "INSERT"]
+    assert get_state(engine) == (0, 1)
+
+
+@pytest.mark.parametrize(
+    ("user_id", "book_id", "exception", "status_code"),
+    [
+        (1, 2, ReservationException, HTTPResponseCode.BAD_REQUEST),
+        (1, 4, NotFoundException, HTTPResponseCode.NOT_FOUND),
+        (NUMBER_OF_USERS + 1, 1, NotFoundException, HTTPResponseCode.NOT_FOUND),
+    ],
+)
+def test_reserve_failures_are_rolled_back(
+    engine: Engine, user_id: int, book_id: int, exception: type[Exception], status_code: int
+) -> None:
+    """A book out of stock, an unknown book or user fail cleanly and change nothing."""
+    with Session(engine) as session, pytest.raises(exception) as exc_info:
+        create_reservation_on_db(session, ReservationIn(user_id=user_id, book_id=book_id))
+
+    assert exc_info.value.status_code == status_code  # type: ignore
+    assert get_state(engine) == (1, 0)
+
+
+def test_reserve_twice_is_rolled_back(engine: Engine) -> None:
+    """A second loan of a non returned book fails and gives its copy back."""
+    with Session(engine) as session:
+        create_reservation_on_db(session, ReservationIn(user_id=1, book_id=1))
+        session.exec(select(Stock).where(Stock.book_id == 1)).one().stock_quantity = 1
+        session.commit()
+        with pytest.raises(ReservationException) as exc_info:
+            create_reservation_on_db(session, ReservationIn(user_id=1, book_id=1))
+
+    assert exc_info.value.status_code == HTTPResponseCode.BAD_REQUEST
+    assert get_state(engine) == (1, 1)
+
+
+def test_concurrent_reservations_of_the_last_copy(engine: Engine) -> None:  # noqa: PLR0915
+    """Concurrent reservations of the last copy: one succeeds, the others get a 400."""
+    barrier = threading.Barrier(NUMBER_OF_USERS)
+    outcomes: list[int] = []
+
+    def reserve(user_id: int) -> None:
+        with Session(engine) as session:
+            barrier.wait()
+            try:
+                create_reservation_on_db(session, ReservationIn(user_id=user_id, book_id=1))
+                outcomes.append(HTTPResponseCode.CREATED)
+            except ReservationException as exc:
+                outcomes.append(exc.status_code)
+
+    threads = [
+        threading.Thread(target=reserve, args=(user_id,))
+        for user_id in range(1, NUMBER_OF_USERS + 1)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(outcomes) == sorted(
+        [HTTPResponseCode.CREATED] + [HTTPResponseCode.BAD_REQUEST] * (NUMBER_OF_USERS - 1)
+    )
+    assert get_state(engine) == (0, 1)
+
+
+def test_reserve_batch(engine: Engine) -> None:  # noqa: PLR0915
+    """The available books of a batch are reserved, the others get the reason of the failure."""
+    with Session(engine) as session:
+        reference_data.load(session)
+        statements = record_queries(engine)
+        batch_out = create_reservations_on_db(
+            session, ReservationBatchIn(user_id=1, book_ids=[1, 3])
+        )
+        # The user, the decrement of the available stocks and the insert of the reservations
+        assert [statement.split()[0] for statement in statements] == ["SELECT", "UPDATE", "INSERT"]
+        assert [item.status_code for item in batch_out.reservations] == [
+            HTTPResponseCode.CREATED,
+            HTTPResponseCode.CREATED,
+        ]
+
+        batch_out = create_reservations_on_db(
+            session, ReservationBatchIn(user_id=2, book_ids=[1, 2, 3, 4, 3])
+        )
+        assert [
+            (item.book_id, item.status_code, item.reservation is not None)
+            for item in batch_out.reservations
+        ] == [
+            (1, HTTPResponseCode.BAD_REQUEST, False),
+            (2, HTTPResponseCode.BAD_REQUEST, False),
+            (3, HTTPResponseCode.CREATED, True),
+            (4, HTTPResponseCode.NOT_FOUND, False),
+            (3, HTTPResponseCode.BAD_REQUEST, False),
+        ]
+        assert batch_out.number_of_reservation == 1
+
+        batch_out = create_reservations_on_db(session, ReservationBatchIn(user_id=2, book_ids=[3]))
+        assert batch_out.reservations[0].message is not None
+        assert batch_out.reservations[0].message.startswith("Book already borrowed")
+
+        with pytest.raises(NotFoundException):
+            create_reservations_on_db(
+                session, ReservationBatchIn(user_id=NUMBER_OF_USERS + 1, book_ids=[3])
+            )
+
+    expected_reservations = 3
+    assert get_state(engine) == (0, expected_reservations)
+
+
+def test_return_batch(engine: Engine) -> None:  # noqa: PLR0915
+    """The reservations of a batch are returned and the stocks incremented per book."""
+    with Session(engine) as session:
+        reference_data.load(session)
+        for user_id in range(1, NUMBER_OF_USERS + 1):
+            create_reservations_on_db(session, ReservationBatchIn(user_id=user_id, book_ids=[1, 3]))
+        # Reservations 1 to 8 hold book_id=1 (one copy) and book_id=3 for every user
+        assert get_state(engine) == (0, NUMBER_OF_USERS + 1)
+
+        statements = record_queries(engine)
+        reservation_ids = list(range(1, NUMBER_OF_USERS + 2))
+        returns_out = return_reservations_on_db(
+            session, ReservationReturnsIn(reservation_ids=[*reservation_ids, 1, 99])
+        )
+        # The reservations and the stocks, the reasons of the failures are read afterwards
+        assert [statement.split()[0] for statement in statements[:2]] == ["UPDATE", "UPDATE"]
+
+    assert returns_out.number_of_reservation == NUMBER_OF_USERS + 1
+    assert [item.status_code for item in returns_out.reservations] == [HTTPResponseCode.OK] * (
+        NUMBER_OF_USERS + 1
+    ) + [HTTPResponseCode.BAD_REQUEST, HTTPResponseCode.NOT_FOUND]
+    returned = returns_out.reservations[0].reservation
+    assert returned is not None
+    assert returned.status == ReservationStatus.RETURNED
+    assert returned.return_date is not None
+    with Session(engine) as session:
+        quantities = {stock.book_id: stock.stock_quantity for stock in session.exec(select(Stock))}
+    assert quantities == {1: 1, 2: 0, 3: NUMBER_OF_USERS}
+
+    with Session(engine) as session:
+        returns_out = return_reservations_on_db(session, ReservationReturnsIn(reservation_ids=[1]))
+    assert returns_out.reservations[0].status_code == HTTPResponseCode.BAD_REQUEST
+    assert get_state(engine) == (1, NUMBER_OF_USERS + 1)
@@ -0,0 +1,41 @@
+from datetime import datetime
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.helper.response import ModelJSONResponse
+from src.models.reservation import ReservationOut, ReservationsList
+
+
+def test_model_json_response_matches_fastapi_encoding() -> None:
+    """The single pass encoding gives the same body as the FastAPI response_model path."""
+    borrowed_at = datetime(2024, 1, 1, 10, 30, 15, 123456)
+    reservations = ReservationsList.trusted(
+        reservations=[
+            ReservationOut.trusted(
+                id=1,
+                book_id=2,
+                user_id=3,
+                status="réservé",
+                borrowed_at=borrowed_at,
+                due_date=borrowed_at,
+                return_date=None,
+            )
+        ],
+        number_of_reservation=1,
+        number_of_pages=1,
+        current_page=1,
+        next_page=None,
+        previous_page=None,
+    )
+
+    response = ModelJSONResponse(reservations)
+    assert response.headers["content-type"] == "application/json"
+    assert response.body == JSONResponse(jsonable_encoder(reservations)).body
+
+
+def test_model_json_response_needs_a_model() -> None:
+    """Only Pydantic models are encoded."""
+    with pytest.raises(TypeError):
+        ModelJSONResponse({"status": "ok"})
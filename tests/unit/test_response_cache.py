@@ -0,0 +1,111 @@
+from datetime import date
+from typing import Iterator
+
+import pytest
+from sqlalchemy import Engine, update
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.db import table_changes
+from src.db.models.author import Author
+from src.db.models.book import Book
+from src.db.table_changes import add_table_change_listener, pop_changed_tables
+from src.helper import response_cache as response_cache_module
+from src.helper.conditional import Validators
+from src.helper.response_cache import CachedResponse, ResponseCache
+
+TTL = 60
+BODY = b"0123456789"
+RESPONSE = CachedResponse(body=BODY, validators=Validators(etag='W/"1"', last_modified=None))
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    """In-memory database with the authors and books tables."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine, tables=[Author.__table__, Book.__table__])  # type: ignore
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def notified(monkeypatch: pytest.MonkeyPatch) -> list[set[str]]:
+    """Tables notified by the committed transactions."""
+    monkeypatch.setattr(table_changes, "_listeners", [])
+    notified: list[set[str]] = []
+    add_table_change_listener(notified.append)
+    return notified
+
+
+def test_cache_eviction_and_expiry(monkeypatch: pytest.MonkeyPatch) -> None:  # noqa: PLR0915
+    """The least recently used bodies are evicted past the size, and expire after the TTL."""
+    now = 0.0
+    monkeypatch.setattr(response_cache_module.time, "monotonic", lambda: now)
+    cache = ResponseCache(max_bytes=2 * len(BODY), ttl=TTL)
+
+    for key in ("first", "second"):
+        cache.add(key, ["books"], cache.get_generations(["books"]), RESPONSE)
+    assert cache.get("first") == RESPONSE
+    cache.add("third", ["books"], cache.get_generations(["books"]), RESPONSE)
+    assert cache.get("second") is None
+
+    now = TTL
+    assert cache.get("first") is None
+    assert cache.stats() == {
+        "size": 1,
+        "bytes": len(BODY),
+        "max_bytes": 2 * len(BODY),
+        "hits": 1,
+        "misses": 2,
+        "hit_rate": 0.3333,
+        "evictions": 1,
+        "invalidations": 0,
+    }
+
+
+def test_cache_invalidation() -> None:
+    """A write drops the responses of its tables, and a response read before is not added."""
+    cache = ResponseCache(max_bytes=10 * len(BODY), ttl=TTL)
+    cache.add("books", ["books"], cache.get_generations(["books"]), RESPONSE)
+    cache.add("stocks", ["books", "stocks"], (0, 0), RESPONSE)
+    cache.add("users", ["users"], (0,), RESPONSE)
+
+    generations = cache.get_generations(["stocks"])
+    cache.invalidate({"stocks"})
+    cache.add("outdated", ["stocks"], generations, RESPONSE)
+    assert [cache.get(key) for key in ("books", "stocks", "users", "outdated")] == [
+        RESPONSE,
+        None,
+        RESPONSE,
+        None,
+    ]
+
+    cache.invalidate({"books"})
+    assert cache.get("books") is None
+    assert cache.stats()["invalidations"] == 2  # noqa: PLR2004
+
+
+def test_committed_writes_are_notified(engine: Engine, notified: list[set[str]]) -> None:
+    """The tables written by the unit of work and by statements are notified after commit."""
+    with Session(engine) as session:
+        session.add(Author(first_name="Jane", last_name="Roe", birth_date=date(1975, 2, 11)))
+        session.execute(update(Book).values(category="Poetry"))
+        assert notified == []
+        session.commit()
+    assert notified == [{"authors", "books"}]
+
+    with Session(engine) as session:
+        session.execute(update(Author).values(nationality="GBR"))
+        session.rollback()
+        session.commit()
+    assert notified == [{"authors", "books"}]
+
+
+def test_savepoint_writes_are_kept(engine: Engine, notified: list[set[str]]) -> None:
+    """A session in a savepoint of an outer transaction keeps its tables for its owner."""
+    with engine.connect() as connection, connection.begin():
+        with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
+            session.execute(update(Book).values(category="Poetry"))
+            session.commit()
+            assert notified == []
+            assert pop_changed_tables(session) == {"books"}
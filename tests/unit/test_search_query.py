@@ -0,0 +1,19 @@
+import pytest
+
+from src.db.operations.search import get_match_query
+from src.exceptions.app import BadRequestException
+
+
+def test_match_query_quotes_the_words() -> None:
+    """The words are quoted prefixes, the FTS5 syntax of the text is not interpreted."""
+    assert get_match_query("pride") == '"pride"*'
+    assert get_match_query(' Jane  "Austen" OR title:Émile*') == (
+        '"Jane"* "Austen"* "OR"* "title"* "Émile"*'
+    )
+
+
+def test_match_query_without_word() -> None:
+    """A text without any word has no query."""
+    with pytest.raises(BadRequestException) as exc_info:
+        get_match_query(" - * ")
+    assert "has no word" in exc_info.value.message
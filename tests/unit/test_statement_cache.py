@@ -0,0 +1,68 @@
+from datetime import date
+from pathlib import Path
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from src.db.engine import create_engine_from_profile, get_database_profile
+from src.db.models.author import Author
+from src.db.queries.author import get_author_stmt
+from src.db.statement_cache import StatementCache, statement_cache
+
+
+def test_statement_cache_hits_and_bound_parameters() -> None:  # noqa: PLR0915
+    """A builder is analysed once, its closure variables stay bound parameters."""
+    cache = StatementCache()
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+
+    def get_author_from_last_name_stmt(last_name: str) -> Author | None:
+        stmt = cache.statement(lambda: select(Author).where(Author.last_name == last_name))
+        return session.scalars(stmt).one_or_none()
+
+    with Session(engine) as session:
+        for last_name in ("Doe", "Roe"):
+            session.add(Author(first_name="John", last_name=last_name, birth_date=date(1980, 1, 1)))
+        session.commit()
+
+        cache.register_engine(engine)
+        for last_name in ("Doe", "Roe", "Moe"):
+            author = get_author_from_last_name_stmt(last_name)
+            assert (author and author.last_name) == (None if last_name == "Moe" else last_name)
+
+    assert cache.stats() == {
+        "statements": 1,
+        "statement_hits": 2,
+        "statement_misses": 1,
+        "compiled_hits": 2,
+        "compiled_misses": 1,
+    }
+    engine.dispose()
+
+
+def test_query_builders_return_cached_statements() -> None:
+    """The builders of src.db.queries return the same cached statement for every call."""
+    first_key = get_author_stmt(1)._generate_cache_key()
+    second_key = get_author_stmt(2)._generate_cache_key()
+    assert first_key is not None and second_key is not None
+    assert first_key.key == second_key.key
+    assert [bind.value for bind in first_key.bindparams] == [1]
+    assert [bind.value for bind in second_key.bindparams] == [2]
+
+
+def test_sync_engines_count_the_compiled_cache(tmp_path: Path) -> None:
+    """The reader and writer engines of the synchronous mode count their compiled SQL too."""
+    profile = {**get_database_profile("dev"), "url": f"sqlite:///{tmp_path / 'sync.db'}"}
+    # The writer engine creates the tables, the reader engine is read only
+    for is_writer in (True, False):
+        engine = create_engine_from_profile(profile, is_writer=is_writer)
+        if is_writer:
+            SQLModel.metadata.create_all(engine)
+        before = statement_cache.stats()
+        with Session(engine) as session:
+            for author_id in (1, 2):
+                session.scalars(get_author_stmt(author_id)).one_or_none()
+
+        after = statement_cache.stats()
+        assert after["compiled_misses"] == before["compiled_misses"] + 1
+        assert after["compiled_hits"] == before["compiled_hits"] + 1
+        engine.dispose()
@@ -0,0 +1,91 @@
+from datetime import date
+from typing import Any, Iterator
+
+import pytest
+from sqlalchemy import Engine, event
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.db.models import reservation, user  # noqa # pylint: disable=unused-import
+from src.db.models.author import Author
+from src.db.models.book import Book
+from src.db.models.stock import Stock
+from src.db.operations.stock import (
+    add_new_quantity_to_the_existing_stocks_on_db,
+    get_stock_book_out_from_db,
+    get_stocks_with_offset_and_limit,
+)
+from src.models.stock import StockQuantityAdd
+
+NUMBER_OF_STOCKS = 30
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    """In memory database with a stock for every book."""
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Author(first_name="John", last_name="Doe", birth_date=date(1980, 1, 1)))
+        for index in range(NUMBER_OF_STOCKS):
+            session.add(
+                Book(
+                    title=f"Book {index}",
+                    author_id=1,
+                    published_date=date(2000, 1, 1),
+                    category="Novel",
+                )
+            )
+        session.flush()
+        for book_id in range(1, NUMBER_OF_STOCKS + 1):
+            session.add(Stock(book_id=book_id, stock_quantity=book_id))
+        session.commit()
+
+    yield engine
+    engine.dispose()
+
+
+def record_queries(engine: Engine) -> list[str]:
+    """Record the statements executed on the engine."""
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        statements.append(statement)
+
+    return statements
+
+
+@pytest.mark.parametrize("limit", [1, 10, NUMBER_OF_STOCKS])
+def test_stocks_page_query_count_is_constant(engine: Engine, limit: int) -> None:
+    """A page of stocks is read with the count and one joined query, whatever its size."""
+    with Session(engine) as session:
+        statements = record_queries(engine)
+        stocks = get_stocks_with_offset_and_limit(session, offset=0, limit=limit)
+
+    assert len(stocks.stocks) == limit
+    assert stocks.stocks[0].title == "Book 0"
+    expected_queries = 2
+    assert len(statements) == expected_queries
+
+
+def test_stock_responses_are_read_by_one_query(engine: Engine) -> None:
+    """The stock responses read the stock and its book together."""
+    with Session(engine) as session:
+        statements = record_queries(engine)
+        stock_out = get_stock_book_out_from_db(session, 3)
+        assert (stock_out.title, stock_out.category, stock_out.stock_quantity) == (
+            "Book 2",
+            "Novel",
+            3,
+        )
+        assert len(statements) == 1
+
+        statements.clear()
+        stock_out = add_new_quantity_to_the_existing_stocks_on_db(
+            session, 3, StockQuantityAdd(stock_quantity=2)
+        )
+        expected_quantity = 5
+        assert stock_out.stock_quantity == expected_quantity
+        # The update and the joined select
+        expected_queries = 2
+        assert len(statements) == expected_queries
@@ -0,0 +1,64 @@
+from datetime import date, datetime
+
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.db.execution import fetch_rows
+from src.db.models import book, stock, user  # noqa # pylint: disable=unused-import
+from src.db.models.author import Author
+from src.db.models.reservation import Reservation
+from src.db.models.reservation_status import ReservationStatus
+from src.db.queries.author import get_authors_stmt_with_limit_and_offset
+from src.db.queries.reservation import get_reservations_stmt_with_limit_and_offset
+from src.models.author import AuthorOut
+from src.models.reservation import ReservationOut
+
+
+def test_fetch_rows_builds_trusted_models() -> None:  # noqa: PLR0915
+    """The projected rows hold the fields of the *Out models, built without validation."""
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    borrowed_at = datetime(2024, 1, 1, 10, 0)
+
+    with Session(engine) as session:
+        session.add(Author(first_name="John", last_name="Doe", birth_date=date(1980, 1, 1)))
+        session.add(ReservationStatus(id=1, name="confirmed"))
+        session.add(
+            Reservation(
+                book_id=1, user_id=1, status_id=1, borrowed_at=borrowed_at, due_date=borrowed_at
+            )
+        )
+        session.commit()
+
+        authors_stmt = get_authors_stmt_with_limit_and_offset(offset=0, limit=10)
+        authors = [AuthorOut.trusted(**row) for row in fetch_rows(session, authors_stmt)]
+        reservations_stmt = get_reservations_stmt_with_limit_and_offset(offset=0, limit=10)
+        reservations = [
+            ReservationOut.trusted(**row) for row in fetch_rows(session, reservations_stmt)
+        ]
+
+    assert authors == [
+        AuthorOut(
+            id=1, first_name="John", last_name="Doe", birth_date=date(1980, 1, 1), nationality=None
+        )
+    ]
+    assert reservations == [
+        ReservationOut(
+            id=1,
+            book_id=1,
+            user_id=1,
+            status="confirmed",
+            borrowed_at=borrowed_at,
+            due_date=borrowed_at,
+            return_date=None,
+        )
+    ]
+    engine.dispose()
+
+
+def test_trusted_skips_validation_and_extra_keys() -> None:
+    """trusted() keeps the values as they are and drops the keys which are not fields."""
+    author = AuthorOut.trusted(
+        id=0, first_name="", last_name="Doe", birth_date=date(1980, 1, 1), nationality=None, x=1
+    )
+    assert author.id == 0
+    assert "x" not in author.model_dump()